@@ -0,0 +1,103 @@
+"""
+Measure how long ``import pangolin`` takes in a fresh interpreter.
+
+Usage::
+
+    python benchmarks/import_time.py [--repeat N] [--breakdown] [--frozen]
+
+--breakdown  Also print the slowest modules according to ``-X importtime``.
+--frozen     Build the timing script with PyInstaller (which must be installed)
+             and time the frozen executable instead.
+
+Bytecode caching is enabled for the child processes (even if
+PYTHONDONTWRITEBYTECODE is set) and the first run is discarded so that
+compiling ``.py`` files isn't counted.
+
+"""
+import argparse
+import os
+from pathlib import Path
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+TIMER = """\
+import time
+start = time.perf_counter()
+import pangolin
+print(time.perf_counter() - start)
+"""
+
+
+def _env():
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def _median_time(command, repeat):
+    times = []
+    for i in range(repeat + 1):
+        out = subprocess.run(command, check=True, stdout=subprocess.PIPE,
+                             env=_env()).stdout
+        times.append(float(out))
+    # Discard the first, cache warming, run.
+    return statistics.median(times[1:])
+
+
+def breakdown(top=10):
+    """Parse ``-X importtime`` output into (cumulative_us, self_us, module)
+    tuples, slowest first."""
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c",
+                             "import pangolin"], check=True,
+                            stderr=subprocess.PIPE, env=_env()).stderr
+    rows = re.findall(r"import time:\s+(\d+) \|\s+(\d+) \| (.*)",
+                      stderr.decode())
+    rows = [(int(cumulative), int(self), name.rstrip())
+            for (self, cumulative, name) in rows]
+    return sorted(rows, reverse=True)[:top]
+
+
+def build_frozen(directory):
+    """Freeze the timing script with PyInstaller. Returns the executable."""
+    script = Path(directory) / "import_pangolin.py"
+    script.write_text(TIMER)
+    subprocess.run([
+        sys.executable, "-m", "PyInstaller", "--noconfirm", "--onedir",
+        "--distpath", str(Path(directory) / "dist"), "--workpath",
+        str(Path(directory) / "build"), "--specpath", directory,
+        str(script)
+    ], check=True)
+    executable = Path(directory) / "dist" / "import_pangolin" \
+                 / "import_pangolin"
+    if os.name == "nt":
+        executable = executable.with_suffix(".exe")
+    return str(executable)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--breakdown", action="store_true")
+    parser.add_argument("--frozen", action="store_true")
+    options = parser.parse_args(argv)
+
+    if options.frozen:
+        with tempfile.TemporaryDirectory() as directory:
+            command = [build_frozen(directory)]
+            time = _median_time(command, options.repeat)
+        print(f"frozen import pangolin: {time * 1000:.2f} ms")
+    else:
+        time = _median_time([sys.executable, "-c", TIMER], options.repeat)
+        print(f"import pangolin: {time * 1000:.2f} ms")
+
+    if options.breakdown:
+        print(f"{'cumulative':>12}{'self':>8}  module (microseconds)")
+        for (cumulative, self, name) in breakdown():
+            print(f"{cumulative:>12}{self:>8}  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compare pangolin.json against converting palmer keys by hand with the standard
+json module on a large per-tooth payload.
+
+Usage::
+
+    python benchmarks/json_keys.py [patients]
+
+"""
+import functools
+import json
+import sys
+import timeit
+
+from pangolin import Palmer
+import pangolin.json
+
+
+def naive_dumps(data):
+    return json.dumps({
+        patient: {str(tooth): value for (tooth, value) in teeth.items()}
+        for (patient, teeth) in data.items()
+    })
+
+
+def naive_hook(pairs):
+    return {
+        Palmer(key) if Palmer.regex.fullmatch(key) else key: value
+        for (key, value) in pairs
+    }
+
+
+def naive_loads(text):
+    return json.loads(text, object_pairs_hook=naive_hook)
+
+
+def main(patients=2000):
+    teeth = Palmer.range()
+    data = {
+        f"patient-{i}": {tooth: i * 0.1 for tooth in teeth}
+        for i in range(patients)
+    }
+    text = naive_dumps(data)
+    assert pangolin.json.dumps(data) == text
+    loads = functools.partial(pangolin.json.loads, palmer_keys=True)
+    assert loads(text) == naive_loads(text)
+
+    print(f"{patients} patients x {len(teeth)} teeth, {len(text)} bytes")
+    for (name, naive, fast, arg) in [
+        ("dumps", naive_dumps, pangolin.json.dumps, data),
+        ("loads", naive_loads, loads, text),
+    ]:
+        slow = min(timeit.repeat(lambda: naive(arg), number=1, repeat=3))
+        quick = min(timeit.repeat(lambda: fast(arg), number=1, repeat=3))
+        print(f"{name}: naive {slow:.3f}s, pangolin.json {quick:.3f}s "
+              f"({slow / quick:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,88 @@
+"""
+Measure the memory footprint of Palmer and JawType instances.
+
+Usage::
+
+    python benchmarks/memory.py [count]
+
+The *before* columns measure stand-ins with the layout both classes had before
+their attributes were packed into a single integer: one slot per attribute,
+holding the same Python values. Recorded with 100,000 live instances::
+
+    Python 3.11.7
+                    traced bytes        getsizeof
+                  before   after    before   after
+    Palmer         144.1    80.0       128      64
+    JawType         96.1     0.0        80      64
+
+JawTypes are now interned so creating equal ones repeatedly allocates nothing.
+
+"""
+import sys
+import tracemalloc
+
+from pangolin import Palmer, JawType
+
+
+class UnpackedBucket(object):
+    """The old base class. It had no __slots__ so every instance also carried
+    __dict__ and __weakref__ pointers."""
+
+    def __init__(self, original):
+        for name in self.__slots__:
+            setattr(self, name, getattr(original, name[1:]))
+
+
+class UnpackedJawType(UnpackedBucket):
+    """A JawType as it used to be stored."""
+    __slots__ = ("_arch_type", "_primary", "_species")
+
+
+class UnpackedPalmer(UnpackedJawType):
+    """A Palmer as it used to be stored. Its __slots__ repeated three of
+    JawType's so those were stored twice."""
+    __slots__ = ("_arch_type", "_side", "_index", "_sub_index", "_primary",
+                 "_species")
+
+
+def bytes_per_instance(factory, count):
+    """Measure the average memory allocated per object created by `factory()`
+    when `count` of them are kept alive at once."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    total = sum(i.size_diff for i in stats)
+    # Don't count the list holding the objects.
+    total -= sys.getsizeof(objects)
+    return total / count, sys.getsizeof(objects[0])
+
+
+def main(count=100_000):
+    labels = [str(i) for i in Palmer.range(arch_type="U")
+              + Palmer.range(arch_type="L")
+              + Palmer.range(arch_type="U", primary=True)]
+    labels.append("orc-LR3.1")
+
+    palmers = [Palmer(i) for i in labels]
+    jaw_types = [JawType(*i) for i in zip("UL*", [False, True, True])]
+
+    rows = [
+        ("Palmer", lambda i: UnpackedPalmer(palmers[i % len(palmers)]),
+         lambda i: Palmer(labels[i % len(labels)])),
+        ("JawType", lambda i: UnpackedJawType(jaw_types[i % 3]),
+         lambda i: JawType("UL*"[i % 3], bool(i % 3), "human")),
+    ]
+    print(f"{'':<12}{'traced bytes':>16}{'getsizeof':>17}")
+    print(f"{'':<12}{'before':>8}{'after':>8}{'before':>10}{'after':>8}")
+    for (name, before, after) in rows:
+        (traced_before, size_before) = bytes_per_instance(before, count)
+        (traced_after, size_after) = bytes_per_instance(after, count)
+        print(f"{name:<12}{traced_before:>8.1f}{traced_after:>8.1f}"
+              f"{size_before:>10}{size_after:>8}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,41 @@
+"""
+Compare parse_array() against parsing each label with Palmer().
+
+Usage::
+
+    python benchmarks/palmer_array.py [size]
+
+The labels are drawn from every human palmer plus a few species prefixed and
+multi digit ones which have to take parse_array()'s slow path.
+
+"""
+import sys
+import time
+
+import numpy as np
+
+from pangolin import Palmer, parse_array
+
+
+def _time(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main(size=1000000):
+    pool = [str(i) for i in Palmer("***").expand()]
+    pool += ["cat-UR3", "dog-LLC", "UR12"]
+    labels = np.array(pool)[np.random.default_rng(0).integers(0, len(pool),
+                                                               size)]
+    print(f"{size} labels, {len(pool)} distinct")
+    print(f"{'Palmer() loop':<20}"
+          f"{_time(lambda: [Palmer(i) for i in labels.tolist()]):>8.3f} s")
+    print(f"{'parse_array()':<20}{_time(parse_array, labels):>8.3f} s")
+    print(f"{'packed=True':<20}{_time(parse_array, labels, True):>8.3f} s")
+    print(f"{'bytes':<20}"
+          f"{_time(parse_array, labels.astype(bytes)):>8.3f} s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
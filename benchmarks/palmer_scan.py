@@ -0,0 +1,47 @@
+"""
+Compare Palmer.finditer() against Palmer.regex.finditer() on adversarial text.
+
+Usage::
+
+    python benchmarks/palmer_scan.py [max_size]
+
+Each input is a long run of word characters and '-' delimiters, none of which
+are followed by a palmer. The regex re-scans the run from every starting
+position, so doubling the size quadruples its time. Palmer.finditer() should
+only double.
+
+"""
+import sys
+import time
+
+from pangolin import Palmer
+
+INPUTS = {
+    "a-a-a-...": lambda n: "a-" * (n // 2),
+    "hex + UL-": lambda n: ("3f9c0e7d" * (n // 8))[:n - 3] + "UL-",
+    "prose": lambda n: ("orc-UR3 and UL4 x " * n)[:n],
+}
+
+
+def _time(function, text):
+    start = time.perf_counter()
+    list(function(text))
+    return time.perf_counter() - start
+
+
+def main(max_size=16000):
+    print(f"{'input':<12}{'size':>8}{'regex (s)':>12}{'finditer (s)':>14}")
+    for (name, make) in INPUTS.items():
+        size = 1000
+        while size <= max_size:
+            text = make(size)
+            assert [i.span() for i in Palmer.finditer(text)] \
+                   == [i.span() for i in Palmer.regex.finditer(text)]
+            print(f"{name:<12}{size:>8}"
+                  f"{_time(Palmer.regex.finditer, text):>12.4f}"
+                  f"{_time(Palmer.finditer, text):>14.4f}")
+            size *= 2
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
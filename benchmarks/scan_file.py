@@ -0,0 +1,40 @@
+"""
+Time scan_file() on one large generated file with varying numbers of worker
+processes.
+
+Usage::
+
+    python benchmarks/scan_file.py [megabytes]
+
+"""
+import os
+import sys
+import tempfile
+import time
+
+from pangolin import scan_file
+
+LINE = (b"2021-03-04 patient 3f9c0e7d: UR3 and UL4 extracted, orc-LL5 sound, "
+        b"see attachment c2VlIGF0dGFjaG1lbnQ=\n")
+
+
+def main(megabytes=64):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "notes.txt")
+        with open(path, "wb") as file:
+            file.write(LINE * (megabytes * 2**20 // len(LINE)))
+
+        workers = 1
+        baseline = None
+        while workers <= (os.cpu_count() or 1):
+            start = time.perf_counter()
+            count = sum(1 for i in scan_file(path, workers, shard_size=2**22))
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{workers:>2} workers: {elapsed:6.2f}s "
+                  f"({baseline / elapsed:.1f}x) {count} palmers")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,95 @@
+"""
+Measure how pangolin's cached hot paths scale with the number of threads.
+
+Usage::
+
+    python benchmarks/threads.py [max_threads] [items]
+
+Each workload is split evenly between the threads and timed as the best of 5
+runs. The only result recorded so far is from a single CPU, GIL build where
+threads can't run in parallel so all this can show is that throughput doesn't
+collapse under contention::
+
+    Python 3.11.7, GIL enabled, 1 CPUs
+    workload     threads       items/s  speedup
+    parse              1       259,146     1.00
+    parse              8       232,086     0.90
+    jaw_types          1       656,540     1.00
+    jaw_types          8       622,794     0.95
+    paths              1       358,742     1.00
+    paths              8       379,068     1.06
+    translate          1     2,536,430     1.00
+    translate          8     2,833,314     1.12
+
+Repeat runs on that machine varied by up to +-40% so the speedup column is
+within noise. How throughput scales on multiple cores or a free-threaded build
+(python3.13t or later) is unmeasured.
+
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pangolin import (Palmer, JawType, tooth_kinds, arch_type_from_path,
+                      PalmerTranslation)
+
+PALMERS = [str(i) for i in Palmer("***").expand()]
+PATHS = [f"/data/cohort{i % 7}/{('Upper', 'Lower')[i % 2]} Jaw/{i}.stl"
+         for i in range(100)]
+MIRROR = PalmerTranslation.mirror()
+
+
+def parse(n):
+    for i in range(n):
+        Palmer(PALMERS[i % len(PALMERS)])
+
+
+def jaw_types(n):
+    for i in range(n):
+        tooth_kinds(JawType(primary=bool(i & 1)))
+
+
+def paths(n):
+    for i in range(n):
+        arch_type_from_path(PATHS[i % len(PATHS)])
+
+
+def translate(n):
+    MIRROR.apply_strings(PALMERS[i % len(PALMERS)] for i in range(n))
+
+
+WORKLOADS = [parse, jaw_types, paths, translate]
+
+
+def throughput(workload, threads, items, repeat=5):
+    """The best of **repeat** runs in items per second."""
+    chunk = items // threads
+    best = float("inf")
+    with ThreadPoolExecutor(threads) as pool:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            list(pool.map(workload, [chunk] * threads))
+            best = min(best, time.perf_counter() - start)
+    return chunk * threads / best
+
+
+def main(max_threads=8, items=200000):
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, "
+          f"GIL {'enabled' if gil else 'disabled'}, {os.cpu_count()} CPUs")
+    print(f"{'workload':<12}{'threads':>8}{'items/s':>14}{'speedup':>9}")
+    for workload in WORKLOADS:
+        workload(1000)  # Warm the caches.
+        threads = 1
+        while threads <= max_threads:
+            rate = throughput(workload, threads, items)
+            if threads == 1:
+                base = rate
+            print(f"{workload.__name__:<12}{threads:>8}{rate:>14,.0f}"
+                  f"{rate / base:>9.2f}")
+            threads *= 2
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -1,41 +1,84 @@
+import sys
+from typing import TYPE_CHECKING
+
 from ._jaw_type import JawType
+from ._tooth_kinds import TOOTH_KINDS, tooth_kinds
+from ._palmer import Palmer, LazyPalmer
 
-TOOTH_KINDS = {
-    JawType(): "IICPPMMM",
-    JawType(primary=True): "IICMM",
-    JawType(arch_type="U", species="sheep"): "PPPMMM",
-    JawType(arch_type="L", species="sheep"): "IIIIPPPMMM",
-    JawType(species="pangolin", primary="*"): "",
+# Everything else is only imported on first access (see __getattr__() below) so
+# that `import pangolin` doesn't pay for sqlite3, difflib, csv, etc. until
+# they're needed.
+_submodules = {
+    "._arch_type_parser": [
+        "ParseArchType", "split_arch_type", "arch_type", "AmbiguousArchType",
+        "substitute_arch_type", "Candidate"
+    ],
+    "._arch_type_cache": ["ArchTypeCache"],
+    "._scan_index": ["ScanIndex"],
+    "._arch_type_bulk": [
+        "substitute_arch_type_many", "substitute_arch_type_csv", "rename_plan",
+        "arch_type_from_path", "arch_type_from_paths"
+    ],
+    "._layout": ["Layout", "layout"],
+    "._dentition": ["Dentition"],
+    "._palmer_map": ["PalmerMap"],
+    "._palmer_table": ["PalmerTable"],
+    "._palmer_index": ["PalmerIndex"],
+    "._adjacency": ["Adjacency", "adjacency"],
+    "._tokenize": ["tokenize", "Token"],
+    "._validate": ["validate", "valid_mask"],
+    "._palmer_bulk": ["isin", "unique", "value_counts"],
+    "._palmer_array": ["parse_array"],
+    "._palmer_translation": ["PalmerTranslation"],
+    "._scan_file": ["scan_file"],
+    "._async_scan": ["scan_stream", "arch_types_async"],
+    "._notation": ["sniff_notation", "NotationGuess", "convert_column"],
+}
+_lazy = {
+    name: module for (module, names) in _submodules.items() for name in names
 }
 
+if TYPE_CHECKING or sys.version_info < (3, 7):  # pragma: py36
+    # Module level __getattr__() requires Python >= 3.7 so import eagerly.
+    # Spelling these imports out also lets static analysers (IDEs and
+    # PyInstaller) see them.
+    from ._arch_type_parser import (ParseArchType, split_arch_type, arch_type,
+                                    AmbiguousArchType, substitute_arch_type,
+                                    Candidate)
+    from ._arch_type_cache import ArchTypeCache
+    from ._scan_index import ScanIndex
+    from ._arch_type_bulk import (substitute_arch_type_many,
+                                  substitute_arch_type_csv, rename_plan,
+                                  arch_type_from_path, arch_type_from_paths)
+    from ._layout import Layout, layout
+    from ._dentition import Dentition
+    from ._palmer_map import PalmerMap
+    from ._palmer_table import PalmerTable
+    from ._palmer_index import PalmerIndex
+    from ._adjacency import Adjacency, adjacency
+    from ._tokenize import tokenize, Token
+    from ._validate import validate, valid_mask
+    from ._palmer_bulk import isin, unique, value_counts
+    from ._palmer_array import parse_array
+    from ._palmer_translation import PalmerTranslation
+    from ._scan_file import scan_file
+    from ._async_scan import scan_stream, arch_types_async
+    from ._notation import sniff_notation, NotationGuess, convert_column
 
-def tooth_kinds(jaw_type=JawType()) -> str:
-    """Get dental formula for a given :class:`JawType`.
-
-    Args:
-        jaw_type:
-            The type of arch.
-    Returns:
-        The tooth types in one quadrant.
-
-    Examples:
-
-         The following tells us that each quadrant of a baby's mouth contains
-         two incisors, one canine and two molars::
-
-            >>> tooth_kinds(JawType(primary=True))
-            'IICMM'
-
-    """
-    if jaw_type in TOOTH_KINDS:
-        return TOOTH_KINDS[jaw_type]
-    for jaw_type_ in TOOTH_KINDS.keys():
-        if jaw_type_.match(jaw_type, strict=True):
-            return TOOTH_KINDS[jaw_type_]
-    raise ValueError(f"No tooth kinds data is available for {repr(jaw_type)}. "
-                     "You can add it to `pangolin.TOOTH_KINDS`.")
+else:  # pragma: py37
 
+    def __getattr__(name):
+        try:
+            module = _lazy[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {repr(__name__)} has no attribute {repr(name)}"
+            ) from None
+        import importlib
+        value = getattr(importlib.import_module(module, __name__), name)
+        # Cache it so that __getattr__() isn't needed next time.
+        globals()[name] = value
+        return value
 
-from ._palmer import Palmer
-from ._arch_type_parser import (ParseArchType, split_arch_type, arch_type,
-                                AmbiguousArchType, substitute_arch_type)
+    def __dir__():
+        return sorted(set(globals()) | set(_lazy))
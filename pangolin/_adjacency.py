@@ -0,0 +1,109 @@
+from pangolin._jaw_type import JawType
+from pangolin._layout import layout
+from pangolin._tooth_kinds import _memo
+
+
+class Adjacency(object):
+    """Precomputed tables of the spatial relationships between teeth in one
+    :class:`JawType`.
+
+    Don't construct these directly. Use :func:`adjacency` which caches them.
+
+    Each table maps a tooth's :meth:`Layout.slot` to the slot of its:
+
+    - **mesial** neighbour: the next tooth towards the centre of the arch. The
+      mesial neighbour of a central incisor is the central incisor on the other
+      side.
+    - **distal** neighbour: the next tooth away from the centre of the arch.
+    - **opposing** tooth: the tooth in the same position on the other arch.
+    - **mirror**: the contralateral tooth. i.e. :py:`-palmer`.
+
+    Relationships which don't exist (e.g. the distal neighbour of the last
+    molar) are :py:`None`.
+
+    The bulk methods :meth:`mesial`, :meth:`distal`, :meth:`opposing` and
+    :meth:`mirror` apply these tables to whole iterables of :class:`Palmer` or
+    palmer strings::
+
+        >>> adjacency().mesial(["UR1", "UR2", "LL8"])
+        [Palmer('UL1'), Palmer('UR1'), Palmer('LL7')]
+
+    For single teeth, use :attr:`Palmer.mesial`, :attr:`Palmer.distal` and
+    :attr:`Palmer.opposing`.
+
+    """
+
+    def __init__(self, jaw_type):
+        self.layout = layout(jaw_type.with_(arch_type="*"))
+        palmers = self.layout.palmers
+        slot = self.layout._slots.get
+
+        self._tables = {}
+        for name in ("mesial", "distal", "opposing", "mirror"):
+            self._tables[name] = [
+                slot(str(getattr(self, "_" + name)(palmer)))
+                for palmer in palmers
+            ]
+
+    @staticmethod
+    def _mesial(palmer):
+        if palmer.index == 1:
+            return -palmer
+        return palmer.with_(index=palmer.index - 1)
+
+    @staticmethod
+    def _distal(palmer):
+        return palmer.with_(index=palmer.index + 1)
+
+    @staticmethod
+    def _opposing(palmer):
+        return palmer.with_(arch_type="L" if palmer.arch_type == "U" else "U")
+
+    @staticmethod
+    def _mirror(palmer):
+        return -palmer
+
+    def _apply(self, name, palmers):
+        table = self._tables[name]
+        teeth = self.layout.palmers
+        slot = self.layout.slot
+        out = []
+        for palmer in palmers:
+            try:
+                i = table[slot(palmer)]
+            except KeyError:
+                raise ValueError(f"'{palmer}' is not a tooth of "
+                                 f"{repr(self.layout.jaw_type)}.") from None
+            out.append(None if i is None else teeth[i])
+        return out
+
+    def mesial(self, palmers) -> list:
+        """Get the mesial neighbour of each of **palmers**."""
+        return self._apply("mesial", palmers)
+
+    def distal(self, palmers) -> list:
+        """Get the distal neighbour of each of **palmers**."""
+        return self._apply("distal", palmers)
+
+    def opposing(self, palmers) -> list:
+        """Get the tooth on the opposite arch of each of **palmers**."""
+        return self._apply("opposing", palmers)
+
+    def mirror(self, palmers) -> list:
+        """Get the contralateral tooth of each of **palmers**."""
+        return self._apply("mirror", palmers)
+
+
+def adjacency(jaw_type=JawType()) -> Adjacency:
+    """Get the (cached) :class:`Adjacency` tables for a :class:`JawType`. The
+    :attr:`~JawType.arch_type` is ignored since the tables always cover both
+    arches. The cache is emptied whenever :data:`TOOTH_KINDS` is modified."""
+    if not isinstance(jaw_type, JawType):
+        jaw_type = JawType(jaw_type)
+    jaw_type = jaw_type.with_(arch_type="*")
+    adjacencies = _memo("adjacencies")
+    try:
+        return adjacencies[jaw_type]
+    except KeyError:
+        pass
+    return adjacencies.setdefault(jaw_type, Adjacency(jaw_type))
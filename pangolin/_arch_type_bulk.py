@@ -0,0 +1,376 @@
+import csv
+import os
+import re
+
+from pangolin._arch_type_parser import (ParseArchType, AmbiguousArchType,
+                                        _substitute)
+from pangolin._scan_index import _walk
+
+
+class _ParseCache(object):
+    """A bounded memo of :class:`ParseArchType` results. An ambiguous input is
+    remembered as :py:`None`."""
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self._parsers = {}
+
+    def __call__(self, text):
+        try:
+            return self._parsers[text]
+        except KeyError:
+            pass
+        try:
+            parser = ParseArchType(text)
+        except AmbiguousArchType:
+            parser = None
+        if len(self._parsers) >= self.max_size:
+            # Crude but cheap: start again rather than track usage.
+            self._parsers.clear()
+        self._parsers[text] = parser
+        return parser
+
+
+# Words in a directory name. Splits on anything but letters and on camelCase.
+_words = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])")
+
+
+def _within(path, root):
+    return path == root or path.startswith(os.path.join(root, ""))
+
+
+class _PathArchTypes(object):
+    """Find the arch type of a path from its filename or, failing that, its
+    nearest parent directory with one. Filenames are parsed fuzzily but a
+    directory must contain a specifier keyword as a whole word - directory
+    names are too short and too varied (Desktop, flower, ...) for fuzzy
+    matching. Results for both filenames and whole directories are
+    memoised."""
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self.specifiers = list(ParseArchType.SPECIFIERS)
+        self._keywords = dict(self.specifiers)
+        self._parse = _ParseCache(max_size)
+        self._directories = {}
+
+    def name(self, name):
+        parser = self._parse(name)
+        return None if parser is None else parser.arch_type
+
+    def _exact(self, name):
+        arch_types = {
+            self._keywords.get(word.lower())
+            for word in _words.findall(name)
+        }
+        arch_types.discard(None)
+        return arch_types.pop() if len(arch_types) == 1 else None
+
+    def _nearest(self, path):
+        """Find the nearest of a directory and its ancestors whose name has an
+        arch type. Returns :py:`(arch_type, ancestor, levels)` where
+        **levels** is how many directories up **ancestor** is or None."""
+        try:
+            return self._directories[path]
+        except KeyError:
+            pass
+        (parent, name) = os.path.split(path)
+        arch_type = self._exact(name)
+        if arch_type is not None:
+            nearest = (arch_type, path, 0)
+        elif parent and parent != path:
+            nearest = self._nearest(parent)
+            if nearest is not None:
+                nearest = nearest[:2] + (nearest[2] + 1,)
+        else:
+            nearest = None
+        if len(self._directories) >= self.max_size:
+            self._directories.clear()
+        self._directories[path] = nearest
+        return nearest
+
+    def directory(self, path, root=None, max_depth=None):
+        nearest = self._nearest(path)
+        if nearest is None:
+            return None
+        (arch_type, ancestor, levels) = nearest
+        if max_depth is not None and levels >= max_depth:
+            return None
+        if root is not None and not _within(ancestor, root):
+            return None
+        return arch_type
+
+    def __call__(self, path, root=None, max_depth=None):
+        (directory, name) = os.path.split(path)
+        arch_type = self.name(os.path.splitext(name)[0])
+        if arch_type is None and directory:
+            return self.directory(directory, root, max_depth)
+        return arch_type
+
+
+# Shared by all arch_type_from_path() calls since the same few directory names
+# tend to be queried over and over. Replaced (never mutated) should
+# ParseArchType.SPECIFIERS change.
+_paths = _PathArchTypes()
+
+
+def substitute_arch_type_many(texts, replace="", *, delimiter=r"[ \-_]",
+                              errors="raise", cache_size=10000):
+    """Lazily apply :func:`substitute_arch_type` to many strings.
+
+    Args:
+        texts:
+            An iterable of strings. It is consumed lazily so it may be a file
+            or a generator.
+        replace:
+            See :func:`substitute_arch_type`.
+        delimiter:
+            See :func:`substitute_arch_type`.
+        errors:
+            What to do with strings with no discernible arch type:
+            :py:`'raise'` an :class:`AmbiguousArchType` or :py:`'ignore'` them
+            by passing them through unchanged.
+        cache_size:
+            The maximum number of unique strings to remember parse results of.
+    Returns:
+        A generator of modified strings.
+
+    Repeated strings are only parsed once::
+
+        >>> list(substitute_arch_type_many(["upper", "lower", "upper"], "U"))
+        ['U', 'U', 'U']
+
+    """
+    _check_errors(errors)
+    parse = _ParseCache(cache_size)
+    return (_substitute_cached(parse, text, replace, delimiter, errors)
+            for text in texts)
+
+
+def _check_errors(errors):
+    if errors not in ("raise", "ignore"):
+        raise ValueError(f"Invalid errors value {repr(errors)}. "
+                         f"Must be either 'raise' or 'ignore'.")
+
+
+def _substitute_cached(parse, text, replace, delimiter, errors):
+    parser = parse(text)
+    if parser is None:
+        if errors == "raise":
+            raise AmbiguousArchType(text)
+        return text
+    return _substitute(parser, replace, delimiter)
+
+
+def substitute_arch_type_csv(source, destination, columns, replace="", *,
+                             delimiter=r"[ \-_]", separator=",",
+                             errors="ignore", cache_size=10000, **format):
+    """Apply :func:`substitute_arch_type` to selected columns of a CSV file,
+    one row at a time.
+
+    Args:
+        source:
+            An open, readable, text file containing CSV data.
+        destination:
+            An open, writable, text file to write the modified CSV to.
+        columns:
+            The names (if the file has a header row) or the indices (if it
+            doesn't) of the columns to modify.
+        replace:
+            See :func:`substitute_arch_type`.
+        delimiter:
+            See :func:`substitute_arch_type`. Not to be confused with
+            **separator**.
+        separator:
+            The character separating CSV fields.
+        errors:
+            See :func:`substitute_arch_type_many`. Defaults to
+            :py:`'ignore'`.
+        cache_size:
+            See :func:`substitute_arch_type_many`.
+        format:
+            Any other formatting parameters for :func:`csv.reader` and
+            :func:`csv.writer`.
+
+    Rows too short to have a column (including blank lines) are written
+    with that column still missing.
+
+    Files should be opened with :py:`newline=""` as recommended by the
+    :mod:`csv` module::
+
+        with open("manifest.csv", newline="") as source, \\
+                open("normalised.csv", "w", newline="") as destination:
+            substitute_arch_type_csv(source, destination, ["jaw"],
+                                     lambda arch_type, _: arch_type)
+
+    """
+    _check_errors(errors)
+    parse = _ParseCache(cache_size)
+    reader = csv.reader(source, delimiter=separator, **format)
+    writer = csv.writer(destination, delimiter=separator, **format)
+    columns = list(columns)
+    if columns and all(isinstance(i, str) for i in columns):
+        header = next(reader)
+        writer.writerow(header)
+        columns = [header.index(i) for i in columns]
+
+    for row in reader:
+        for i in columns:
+            # Blank lines and short rows simply lack some columns.
+            if i < len(row):
+                row[i] = _substitute_cached(parse, row[i], replace, delimiter,
+                                            errors)
+        writer.writerow(row)
+
+
+def rename_plan(root, replace="", *, delimiter=r"[ \-_]", cache_size=10000):
+    """Plan renaming every file in a directory tree via
+    :func:`substitute_arch_type` without touching anything.
+
+    Args:
+        root:
+            The top level directory to walk recursively.
+        replace:
+            See :func:`substitute_arch_type`.
+        delimiter:
+            See :func:`substitute_arch_type`.
+        cache_size:
+            See :func:`substitute_arch_type_many`.
+    Returns:
+        A generator of :py:`(old_path, new_path)` pairs. Files whose names
+        contain no arch type or whose names wouldn't change are skipped.
+
+    As with :class:`ScanIndex`, only the filename minus its extension is
+    parsed. The extension is kept as is.
+
+    Carry out the plan with :func:`os.rename`::
+
+        for (old, new) in rename_plan("scans", lambda x, _: x):
+            os.rename(old, new)
+
+    """
+    parse = _ParseCache(cache_size)
+    for entry in _walk(os.fspath(root)):
+        (stem, extension) = os.path.splitext(entry.name)
+        name = _substitute_cached(parse, stem, replace, delimiter,
+                                  "ignore") + extension
+        if name != entry.name:
+            yield entry.path, os.path.join(os.path.dirname(entry.path), name)
+
+
+def _normalise_root(root):
+    return None if root is None else os.path.normpath(os.fspath(root))
+
+
+def arch_type_from_path(path, errors="raise", root=None, max_depth=None):
+    """Extract the arch type from a file path, looking in parent directories if
+    the filename doesn't specify one.
+
+    Args:
+        path:
+            A :class:`str` or :class:`os.PathLike` file path.
+        errors:
+            What to do if no component of the path contains an arch type:
+            :py:`'raise'` an :class:`AmbiguousArchType` or :py:`'ignore'` it
+            by returning :py:`None`.
+        root:
+            The top directory being scanned. Directories above it are never
+            looked at. **path** and **root** must both be relative or both be
+            absolute.
+        max_depth:
+            The maximum number of parent directories to look at. :py:`1`
+            means only the directory containing the file. :py:`0` means only
+            the filename.
+    Returns:
+        Either :py:`'U'` or :py:`'L'` (or :py:`None`).
+
+    The filename (minus its extension) is checked first, then each directory
+    from the innermost outwards. The first component to contain an arch type
+    wins::
+
+        >>> arch_type_from_path("/data/cohort7/Upper Jaw/patient_123.stl")
+        'U'
+        >>> arch_type_from_path("/data/upper/patient_123_lower.stl")
+        'L'
+        >>> arch_type_from_path("/data/upper/patient_123.stl", max_depth=0,
+        ...                     errors="ignore") is None
+        True
+
+    The filename is matched with the same fuzzy matching as :func:`arch_type`
+    but a directory name must contain one of the
+    :attr:`ParseArchType.SPECIFIERS` keywords as a whole word (e.g.
+    :py:`'Upper Jaw'` or :py:`'lower_scans'` but not :py:`'Desktop'`).
+
+    Results are cached per directory so that the many files in one directory
+    cost only a filename check each. To process a whole directory tree, use
+    :func:`arch_type_from_paths`.
+
+    """
+    global _paths
+    _check_errors(errors)
+    path = os.fspath(path)
+    root = _normalise_root(root)
+    paths = _paths
+    if paths.specifiers != ParseArchType.SPECIFIERS:
+        paths = _paths = _PathArchTypes()
+    lookup = path if root is None else os.path.normpath(path)
+    return _check_found(path, paths(lookup, root, max_depth), errors)
+
+
+def arch_type_from_paths(paths, errors="ignore", cache_size=10000, root=None,
+                         max_depth=None):
+    """Lazily apply :func:`arch_type_from_path` to many paths.
+
+    Args:
+        paths:
+            Either an iterable of paths (strings, :class:`os.PathLike` or the
+            :class:`os.DirEntry` objects given by :func:`os.scandir`) or the
+            output of :func:`os.walk` (or a mixture of both).
+        errors:
+            See :func:`arch_type_from_path`. Defaults to :py:`'ignore'`.
+        cache_size:
+            The maximum number of unique names and directories to remember the
+            arch types of.
+        root:
+            See :func:`arch_type_from_path`. Usually the directory passed to
+            :func:`os.walk`.
+        max_depth:
+            See :func:`arch_type_from_path`.
+    Returns:
+        A generator of :py:`(path, arch_type)` pairs. :func:`os.walk` triples
+        are expanded to one pair per filename.
+
+    ::
+
+        for (path, arch_type) in arch_type_from_paths(os.walk("scans"),
+                                                      root="scans"):
+            ...
+
+    Each directory is only resolved once, even when given as the
+    :py:`dirpath` of an :func:`os.walk` triple.
+
+    """
+    _check_errors(errors)
+    root = _normalise_root(root)
+    get = _PathArchTypes(cache_size)
+    for item in paths:
+        if isinstance(item, tuple):
+            (directory, _, names) = item
+            lookup = directory if root is None \
+                else os.path.normpath(directory)
+            inherited = get.directory(lookup, root, max_depth)
+            for name in names:
+                arch_type = get.name(os.path.splitext(name)[0]) or inherited
+                path = os.path.join(directory, name)
+                yield path, _check_found(path, arch_type, errors)
+        else:
+            path = os.fspath(item)
+            lookup = path if root is None else os.path.normpath(path)
+            yield path, _check_found(path, get(lookup, root, max_depth),
+                                     errors)
+
+
+def _check_found(path, arch_type, errors):
+    if arch_type is None and errors == "raise":
+        raise AmbiguousArchType(path)
+    return arch_type
@@ -0,0 +1,159 @@
+import hashlib
+import sqlite3
+import threading
+
+from pangolin._arch_type_parser import (ParseArchType, AmbiguousArchType,
+                                        SCORING_VERSION)
+
+
+class ArchTypeCache(object):
+    """A persistent, on-disk cache for :func:`arch_type` and
+    :func:`split_arch_type`.
+
+    Args:
+        path:
+            The database file to use. It is created if it doesn't exist.
+        batch_size:
+            How many new results to accumulate before writing them to disk.
+        timeout:
+            How many seconds to wait for another process to release a write
+            lock.
+
+    Results are stored in an SQLite_ database keyed by the input string and a
+    fingerprint of :attr:`ParseArchType.SPECIFIERS` plus the version of the
+    scoring algorithm so that results from an incompatible configuration are
+    never reused. The fingerprint is recomputed should
+    :attr:`~ParseArchType.SPECIFIERS` be modified whilst the cache is open.
+    The database uses write-ahead logging so that any number of processes may
+    read from it whilst another writes to it.
+
+    ::
+
+        with ArchTypeCache("arch-types.sqlite") as cache:
+            for name in names:
+                print(cache.arch_type(name))
+
+    New results are written in batches. Use :meth:`flush` or the context
+    manager to ensure that the last batch is saved.
+
+    A cache may be shared between threads. Its database connection is guarded
+    by a lock but parsing is done outside of it.
+
+    .. _SQLite: https://www.sqlite.org/
+
+    """
+
+    def __init__(self, path, batch_size=1000, timeout=30):
+        self.path = path
+        self.batch_size = batch_size
+        self._specifiers = list(ParseArchType.SPECIFIERS)
+        self.fingerprint = fingerprint()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), timeout=timeout,
+                                           check_same_thread=False)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS arch_types ("
+                "fingerprint TEXT, input TEXT, start INTEGER, end INTEGER, "
+                "arch_type TEXT, PRIMARY KEY (fingerprint, input))")
+
+    def _lookup(self, text):
+        """Get the :py:`(start, end, arch_type)` of **text**, parsing it only
+        if it isn't already in the cache. An **arch_type** of :py:`None`
+        means that the arch type is ambiguous."""
+        text = str(text)
+        with self._lock:
+            self._refresh()
+            key = self.fingerprint
+            row = self._pending.get(text)
+            if row is None:
+                row = self._connection.execute(
+                    "SELECT start, end, arch_type FROM arch_types "
+                    "WHERE fingerprint = ? AND input = ?",
+                    (self.fingerprint, text)).fetchone()
+        if row is not None:
+            return row
+
+        try:
+            parser = ParseArchType(text)
+            row = (parser.start, parser.end, parser.arch_type)
+        except AmbiguousArchType:
+            row = (None, None, None)
+        with self._lock:
+            self._refresh()
+            if self.fingerprint != key:
+                # SPECIFIERS changed whilst parsing so it's unclear which
+                # fingerprint this result belongs to. Don't store it.
+                return row
+            self._pending[text] = row
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+        return row
+
+    def split_arch_type(self, name):
+        """A cached equivalent to :func:`split_arch_type`."""
+        start, end, arch_type = self._lookup(name)
+        if arch_type is None:
+            raise AmbiguousArchType(name)
+        name = str(name)
+        return name[:start], name[start:end], name[end:]
+
+    def arch_type(self, text):
+        """A cached equivalent to :func:`arch_type`."""
+        arch_type = self._lookup(text)[2]
+        if arch_type is None:
+            raise AmbiguousArchType(text)
+        return arch_type
+
+    def flush(self):
+        """Write any pending results to disk."""
+        with self._lock:
+            self._flush()
+
+    def _refresh(self):
+        """Switch to a new fingerprint if ParseArchType.SPECIFIERS has changed
+        since the last lookup."""
+        if self._specifiers != ParseArchType.SPECIFIERS:
+            # Pending results belong to the old fingerprint.
+            self._flush()
+            self._specifiers = list(ParseArchType.SPECIFIERS)
+            self.fingerprint = fingerprint()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO arch_types VALUES (?, ?, ?, ?, ?)",
+                ((self.fingerprint, text) + row
+                 for (text, row) in self._pending.items()))
+        self._pending.clear()
+
+    def close(self):
+        """Flush then close the database connection."""
+        with self._lock:
+            self._flush()
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self):
+        """The number of results stored for the current fingerprint."""
+        with self._lock:
+            self._refresh()
+            self._flush()
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM arch_types WHERE fingerprint = ?",
+                (self.fingerprint,)).fetchone()[0]
+
+
+def fingerprint() -> str:
+    """Hash everything that can change the output of :class:`ParseArchType`."""
+    key = repr((SCORING_VERSION, list(ParseArchType.SPECIFIERS)))
+    return hashlib.sha1(key.encode()).hexdigest()
@@ -2,6 +2,10 @@
 import re
 from collections import namedtuple
 
+# Bump this whenever a change to the matching logic could change any result so
+# that persistent caches (see ArchTypeCache) know to invalidate themselves.
+SCORING_VERSION = 1
+
 
 class Span(namedtuple("Span", ["start", "size", "start_b"])):
 
@@ -10,6 +14,25 @@ def end(self):
         return self.start + self.size
 
 
+class Candidate(
+        namedtuple("Candidate", ["specifier", "arch_type", "spans", "score"])):
+    """A single specifier keyword's best attempt at matching an input string.
+    """
+
+    @property
+    def start(self):
+        return self.spans[0].start
+
+    @property
+    def end(self):
+        return self.spans[-1].end
+
+
+def _rank(candidates, top_k=None):
+    """Sort candidates from best to worst. Ties retain their original order."""
+    return sorted(candidates, key=lambda x: x.score, reverse=True)[:top_k]
+
+
 class ParseArchType(object):
     """A low level arch_type specifier searching engine.
 
@@ -49,6 +72,7 @@ class ParseArchType(object):
     def __init__(self, input):
         self.input = str(input)
         self._input = self.input.lower()
+        self._candidates = []
         self._match()
 
     @staticmethod
@@ -72,26 +96,47 @@ def _match_specifier(self, specifier):
     def _match(self):
         """Compare all words against all specifiers, selecting the highest
         overall scoring sequence of matching spans."""
-        specifier, arch_type, spans = self._max(
-            ((specifier, arch_type, self._match_specifier(specifier))
-             for specifier, arch_type in self.SPECIFIERS),
-            key=lambda x: self._score(x[2]),
-        )
+        # Copy in case another thread is modifying SPECIFIERS.
+        for (specifier, arch_type) in list(self.SPECIFIERS):
+            spans = self._match_specifier(specifier)
+            self._candidates.append(
+                Candidate(specifier, arch_type, spans, self._score(spans)))
+        specifier, arch_type, spans, (score, _) = \
+            self._max(self._candidates, key=lambda x: x.score)
 
-        score = self._score(spans)[0]
         if score < 3 ** 2:
             if score < max(len(i) for i in re.findall("[a-z]+", self._input)) ** 2:
-                raise AmbiguousArchType(self.input)
+                raise AmbiguousArchType(self.input, self._candidates)
         if specifier[0] != self._input[spans[0].start]:
-            raise AmbiguousArchType(self.input)
+            raise AmbiguousArchType(self.input, self._candidates)
         self.specifier, self.arch_type, self._spans = specifier, arch_type, spans
 
     def _max(self, iterable, key):
         candidates = list(iterable)
         if not candidates:
-            raise AmbiguousArchType(self.input)
+            raise AmbiguousArchType(self.input, self._candidates)
         return max(candidates, key=key)
 
+    def candidates(self, top_k=None):
+        """List every specifier keyword's best match, ranked from best to worst.
+
+        Args:
+            top_k:
+                Only return this many candidates. Defaults to all of them.
+        Returns:
+            A list of :class:`Candidate` tuples containing the
+            :py:`(specifier, arch_type, spans, score)`.
+
+        These are computed once on initialisation so inspecting them is free.
+        The first candidate is always the one that was picked::
+
+            >>> parse = ParseArchType("upper jaw")
+            >>> [i.specifier for i in parse.candidates(3)]
+            ['upper', 'lower', 'mandibular']
+
+        """
+        return _rank(self._candidates, top_k)
+
     @property
     def start(self):
         """The starting index of the arch type specifier in the input string."""
@@ -127,23 +172,39 @@ def _score(spans):
 
     def _show(self):
         """Make a table showing each comparison."""
-        bits = []
-        for (specifier, _) in self.SPECIFIERS:
-            spans = self._match_specifier(specifier)
-            bits += [
-                highlight_matches(self.input, *spans),
-                "  |  ",
-                specifier.ljust(12, " ") + "|  ",
-                " ".join(map(str, self._score(spans))),
-                "\n",
-            ]
-        return "".join(bits)
+        return _show(self.input, self._candidates)
 
 
 class AmbiguousArchType(Exception):
+    def __init__(self, input, candidates=()):
+        super().__init__(input)
+        self._candidates = list(candidates)
+
     def __str__(self):
         return f'Unable to determine arch type from the name "{self.args[0]}"'
 
+    def candidates(self, top_k=None):
+        """List the (rejected) candidates, ranked from best to worst. See
+        :meth:`ParseArchType.candidates`."""
+        return _rank(self._candidates, top_k)
+
+    def _show(self):
+        """Make a table showing each comparison."""
+        return _show(self.args[0], self._candidates)
+
+
+def _show(input, candidates):
+    bits = []
+    for (specifier, _, spans, score) in candidates:
+        bits += [
+            highlight_matches(input, *spans),
+            "  |  ",
+            specifier.ljust(12, " ") + "|  ",
+            " ".join(map(str, score)),
+            "\n",
+        ]
+    return "".join(bits)
+
 
 def split_arch_type(name: str) -> (str, str, str):
     """Split a name containing an `arch_type` specifier into the string
@@ -188,7 +249,11 @@ def substitute_arch_type(text, replace="", *, delimiter=r"[ \-_]"):
         'The MAXILLARY jaw'
 
     """
-    parser = ParseArchType(text)
+    return _substitute(ParseArchType(text), replace, delimiter)
+
+
+def _substitute(parser, replace, delimiter):
+    """The guts of :func:`substitute_arch_type` for an existing parser."""
     after = parser.after
 
     if callable(replace):
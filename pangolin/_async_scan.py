@@ -0,0 +1,149 @@
+import asyncio
+import codecs
+import re
+
+from pangolin._arch_type_bulk import _ParseCache
+from pangolin._palmer import Palmer
+from pangolin._palmer_scan import finditer
+
+# The last character in a string which can't be part of a palmer. Everything
+# before it can be scanned without waiting to see what comes next.
+_boundary = re.compile(r"[^\w*.-][\w*.-]*\Z")
+
+# Python 3.6 has no get_running_loop(). Called from a coroutine,
+# get_event_loop() returns the same loop.
+_get_running_loop = getattr(asyncio, "get_running_loop",
+                            asyncio.get_event_loop)
+
+
+def _scan(text, offset):
+    """Find all palmers in **text**, which starts at **offset** characters
+    into a stream. Returns a list of :py:`(offset, palmer)` pairs."""
+    palmers = {}
+    out = []
+    for match in finditer(text):
+        try:
+            palmer = palmers[match.group()]
+        except KeyError:
+            palmer = palmers.setdefault(match.group(), Palmer(match))
+        out.append((offset + match.start(), palmer))
+    return out
+
+
+async def _chunks(source, chunk_size):
+    if hasattr(source, "read"):
+        while True:
+            chunk = await source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        async for chunk in source:
+            yield chunk
+
+
+async def scan_stream(source, encoding="utf-8", chunk_size=1 << 16,
+                      offload_size=1 << 16, executor=None):
+    """Find every palmer in a stream of text as it arrives.
+
+    Args:
+        source:
+            Either an :class:`asyncio.StreamReader` (or anything else with an
+            asynchronous :py:`read(n)` method) or an asynchronous iterable of
+            chunks. Chunks may be :class:`str` or :class:`bytes`.
+        encoding:
+            How to decode :class:`bytes` chunks. Multibyte characters may be
+            split between chunks.
+        chunk_size:
+            How many bytes to ask **source** for at a time if it's a reader.
+        offload_size:
+            Text which is ready to be scanned is scanned in **executor** if
+            there is at least this much of it. Smaller amounts are scanned
+            directly in the event loop since a thread hop would cost more than
+            the scan.
+        executor:
+            Passed to :meth:`~asyncio.loop.run_in_executor`. The default is
+            the event loop's default thread pool. Use a
+            :class:`~concurrent.futures.ProcessPoolExecutor` to scan on other
+            cores.
+    Yields:
+        :py:`(offset, palmer)` pairs in stream order. **offset** is the number
+        of characters preceding the palmer in the decoded stream.
+
+    ::
+
+        reader, writer = await asyncio.open_connection(host, port)
+        async for (offset, palmer) in scan_stream(reader):
+            ...
+
+    The stream is never buffered in full. Each chunk is scanned up to its last
+    character which can't be part of a palmer (whitespace or most punctuation)
+    and only the remainder is kept back to be joined with later chunks. A
+    palmer split between chunks is therefore found exactly once and the
+    results are identical to :meth:`Palmer.finditer` on the whole text.
+
+    """
+    loop = _get_running_loop()
+    decoder = codecs.getincrementaldecoder(encoding)()
+    # The unscanned text since the last boundary. Kept as a list and joined
+    # only once a boundary arrives so that a long run of chunks without one
+    # costs linear rather than quadratic time.
+    pieces = []
+    offset = 0
+
+    async def scan(text, offset):
+        if len(text) >= offload_size:
+            return await loop.run_in_executor(executor, _scan, text, offset)
+        return _scan(text, offset)
+
+    async for chunk in _chunks(source, chunk_size):
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        # Only the new chunk needs to be searched for a boundary. If it
+        # doesn't have one, then neither do any of the pieces before it.
+        boundary = _boundary.search(chunk)
+        if boundary is None:
+            pieces.append(chunk)
+            continue
+        pieces.append(chunk[:boundary.start()])
+        text = "".join(pieces)
+        for result in await scan(text, offset):
+            yield result
+        offset += len(text)
+        pieces = [chunk[boundary.start():]]
+
+    pieces.append(decoder.decode(b"", final=True))
+    for result in await scan("".join(pieces), offset):
+        yield result
+
+
+async def arch_types_async(texts, executor=None) -> list:
+    """Apply :func:`arch_type` to many strings (e.g. file names or other
+    metadata) in **executor** so as not to block the event loop.
+
+    Args:
+        texts:
+            An iterable of strings.
+        executor:
+            Passed to :meth:`~asyncio.loop.run_in_executor`.
+    Returns:
+        A list of :py:`'U'`, :py:`'L'` or :py:`None` (for strings with no
+        discernible arch type).
+
+    Repeated strings are only parsed once. ::
+
+        >>> await arch_types_async(["upper.stl", "lower.stl", "notes.txt"])
+        ['U', 'L', None]
+
+    """
+    loop = _get_running_loop()
+    return await loop.run_in_executor(executor, _arch_types, list(texts))
+
+
+def _arch_types(texts):
+    parse = _ParseCache()
+    out = []
+    for text in texts:
+        parser = parse(text)
+        out.append(None if parser is None else parser.arch_type)
+    return out
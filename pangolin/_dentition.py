@@ -0,0 +1,144 @@
+from pangolin._jaw_type import JawType
+from pangolin._layout import layout
+
+
+class Dentition(object):
+    """An immutable set of :class:`Palmer` teeth stored as a bitmask.
+
+    Args:
+        teeth:
+            An iterable of :class:`Palmer` or palmer strings.
+        jaw_type:
+            The :class:`JawType` whose :class:`Layout` defines which teeth may
+            be included. The default is a full permanent human mouth.
+
+    Each concrete tooth in **jaw_type** (see :func:`layout`) is assigned one
+    bit of an integer so that set operations are bitwise operations::
+
+        >>> present = Dentition(["UR1", "UR2", "UL1", "LR6"])
+        >>> treated = Dentition(["UR2", "LR6", "LR7"])
+        >>> present & treated
+        Dentition(['UR2', 'LR6'])
+        >>> present - treated
+        Dentition(['UL1', 'UR1'])
+        >>> "UR1" in present, len(present)
+        (True, 4)
+
+    Iteration is in :meth:`Palmer.range` order (left to right), upper arch
+    first.
+
+    For storing large numbers of dentitions, keep only the :attr:`mask`
+    integers (which, for layouts of up to 64 teeth, fit into an
+    :py:`array.array("Q")` at 8 bytes each) and restore them using
+    :meth:`from_mask`.
+
+    """
+    __slots__ = ("_layout", "_mask")
+
+    def __init__(self, teeth=(), jaw_type=JawType()):
+        self._layout = layout(jaw_type)
+        slot = self._layout.slot
+        mask = 0
+        for tooth in teeth:
+            mask |= 1 << slot(tooth)
+        self._mask = mask
+
+    @classmethod
+    def from_mask(cls, mask: int, jaw_type=JawType()) -> 'Dentition':
+        """Construct directly from a bitmask as given by :attr:`mask`."""
+        self = cls.__new__(cls)
+        self._layout = layout(jaw_type)
+        if mask >> len(self._layout):
+            raise ValueError(f"Mask {mask} has more bits than there are teeth "
+                             f"in {repr(self._layout.jaw_type)}.")
+        self._mask = mask
+        return self
+
+    @classmethod
+    def full(cls, jaw_type=JawType()) -> 'Dentition':
+        """A dentition containing every tooth."""
+        return cls.from_mask((1 << len(layout(jaw_type))) - 1, jaw_type)
+
+    @property
+    def mask(self) -> int:
+        """The raw bitmask. Bit **i** is set if the **i** th tooth of
+        :attr:`Layout.palmers` is present."""
+        return self._mask
+
+    @property
+    def jaw_type(self) -> JawType:
+        return self._layout.jaw_type
+
+    def __contains__(self, palmer):
+        try:
+            return bool(self._mask >> self._layout.slot(palmer) & 1)
+        except KeyError:
+            return False
+
+    def __len__(self):
+        return bin(self._mask).count("1")
+
+    def __iter__(self):
+        palmers = self._layout.palmers
+        mask = self._mask
+        while mask:
+            lowest = mask & -mask
+            yield palmers[lowest.bit_length() - 1]
+            mask ^= lowest
+
+    def __bool__(self):
+        return bool(self._mask)
+
+    def __repr__(self):
+        teeth = [str(i) for i in self]
+        if self.jaw_type == JawType():
+            return f"{type(self).__name__}({teeth})"
+        return f"{type(self).__name__}({teeth}, {repr(self.jaw_type)})"
+
+    def __hash__(self):
+        return hash((self._layout.jaw_type, self._mask))
+
+    def _other_mask(self, other):
+        if other._layout is not self._layout:
+            raise ValueError(f"Can't combine dentitions with different jaw "
+                             f"types {repr(self.jaw_type)} and "
+                             f"{repr(other.jaw_type)}.")
+        return other._mask
+
+    def _binary_operator(operator):
+
+        def method(self, other):
+            if not isinstance(other, Dentition):
+                return NotImplemented
+            return self.from_mask(operator(self._mask, self._other_mask(other)),
+                                  self._layout.jaw_type)
+
+        return method
+
+    __or__ = _binary_operator(int.__or__)
+    __and__ = _binary_operator(int.__and__)
+    __xor__ = _binary_operator(int.__xor__)
+    __sub__ = _binary_operator(lambda x, y: x & ~y)
+    del _binary_operator
+
+    def __invert__(self):
+        return self.full(self._layout.jaw_type) - self
+
+    def __eq__(self, other):
+        if not isinstance(other, Dentition):
+            return NotImplemented
+        return self._layout is other._layout and self._mask == other._mask
+
+    def __le__(self, other):
+        if not isinstance(other, Dentition):
+            return NotImplemented
+        return self._mask & ~self._other_mask(other) == 0
+
+    def __ge__(self, other):
+        if not isinstance(other, Dentition):
+            return NotImplemented
+        return other <= self
+
+    def to_list(self) -> list:
+        """Convert to a list of :class:`Palmer` objects."""
+        return list(self)
@@ -1,17 +1,137 @@
 from collections.abc import Mapping
+import operator
 import sys
+import threading
 from typing import Union
 
+# --- Packed attributes ---
+# To keep instances small, all the attributes of a JawType or Palmer are packed
+# into a single integer, `_code`. From least significant bits up, it contains:
+#
+#   arch_type: 2 bits   An index into _ARCH_TYPES.
+#   primary:   2 bits   An index into _PRIMARIES.
+#   side:      2 bits   An index into _SIDES. Always 0 for a JawType.
+#   sub_index: 8 bits   0 for None, otherwise sub_index + 1.
+#   index:     16 bits  0 for '*', otherwise index + 1.
+#   species:   the rest An index into the _species intern table.
+#
+# Only the first _MAX_SPECIES distinct species get an ID and an index or
+# sub_index must fit in its field (0 <= index < 65535, 0 <= sub_index < 255).
+# Anything else can't be packed so `_code` holds the plain tuple
+#
+#   (arch_type, primary, species, side, index, sub_index)
+#
+# instead (just the first 3 for a JawType). Whether a value is packed depends
+# only on the value itself so equal values always have equal codes.
+#
+# Codes are themselves interned so that instances share one int object. All
+# intern tables are bounded so that parsing arbitrary text can't grow them
+# forever.
+
+_ARCH_TYPES = ("*", "U", "L")
+_PRIMARIES = (False, True, "*")
+_SIDES = ("*", "L", "R")
+_SUB_INDEX_SHIFT = 6
+_INDEX_SHIFT = 14
+_SPECIES_SHIFT = 30
+# The bits which describe a JawType.
+_JAW_TYPE_MASK = 0b1111 | (-1 << _SPECIES_SHIFT)
+_MAX_SPECIES = 1024
+_MAX_CODES = 1 << 16
+
+_species = ["human"]
+_species_ids = {"human": 0}
+_species_lock = threading.Lock()
+_codes = {}
+_jaw_types = {}
+
+
+def _lookup(name, value, options):
+    try:
+        return options.index(value)
+    except ValueError:
+        raise ValueError(f"Invalid {name} {repr(value)}. "
+                         f"Must be one of {options}.") from None
+
+
+def _small_int(name, value, bits):
+    """Encode None/'*' as 0 and integers in [0, 2**bits - 1) as value + 1.
+    Other integers can't be packed and give None."""
+    if value is None or value == "*":
+        return 0
+    try:
+        value = operator.index(value)
+    except TypeError:
+        raise ValueError(f"Invalid {name} {repr(value)}.") from None
+    if not 0 <= value < (1 << bits) - 1:
+        return None
+    return value + 1
+
+
+def _plain(value, wildcard):
+    """Normalise an index or sub_index for an unpacked `_code`."""
+    if value is None or value == "*":
+        return wildcard
+    return operator.index(value)
+
+
+def _species_id(species):
+    """Get the ID of a species, registering it if need be. Returns None if
+    it's new and the table is full."""
+    try:
+        return _species_ids[species]
+    except KeyError:
+        pass
+    # Only registration takes the lock. Lookups above are lock free so the new
+    # species must be in _species before its ID is published in _species_ids.
+    with _species_lock:
+        if species not in _species_ids and len(_species) < _MAX_SPECIES:
+            _species.append(species)
+            _species_ids[species] = len(_species) - 1
+    return _species_ids.get(species)
+
+
+def _pack(arch_type, primary, species, side="*", index="*", sub_index=None):
+    """Combine attributes into a `_code`."""
+    fields = (_lookup("arch_type", arch_type, _ARCH_TYPES),
+              _lookup("primary", primary, _PRIMARIES),
+              _lookup("side", side, _SIDES),
+              _small_int("sub_index", sub_index, 8),
+              _small_int("index", index, 16),
+              _species_id(species))
+    if None in fields:
+        return (_ARCH_TYPES[fields[0]], _PRIMARIES[fields[1]], species,
+                _SIDES[fields[2]], _plain(index, "*"), _plain(sub_index, None))
+    code = fields[0] | fields[1] << 2 | fields[2] << 4 \
+         | fields[3] << _SUB_INDEX_SHIFT | fields[4] << _INDEX_SHIFT \
+         | fields[5] << _SPECIES_SHIFT
+    try:
+        return _codes[code]
+    except KeyError:
+        pass
+    if len(_codes) >= _MAX_CODES:
+        _codes.clear()
+    return _codes.setdefault(code, code)
+
+
+def _jaw_type_code(code):
+    """Extract the JawType part of a Palmer's `_code`."""
+    try:
+        return code & _JAW_TYPE_MASK
+    except TypeError:
+        pass
+    # The Palmer may be unpacked only because of its index or sub_index.
+    code = _pack(*code[:3])
+    return code if type(code) is int else code[:3]
+
 
 class BaseBucket(Mapping):
     """A custom bucket class which acts a bit like a dictionary."""
 
-    def __init__(self, **kwargs):
-        for (key, value) in kwargs.items():
-            setattr(self, "_" + key, value)
-
-    def __hash__(self):
-        return hash(tuple(getattr(self, i) for i in self.__slots__))
+    def __reduce__(self):
+        # The default would pickle `_code` which contains process specific
+        # species IDs.
+        return type(self), tuple(getattr(self, i) for i in self.keys())
 
     def __repr__(self):
         arguments = ", ".join(
@@ -20,7 +140,7 @@ def __repr__(self):
 
     def with_(self, **values):
         """Return a modified copy. Arguments can be any of the core attributes
-        in :attr:`!__slots__`. Multiple modifications can be done at once.
+        listed by :meth:`!keys`. Multiple modifications can be done at once.
         Use :py:`...` to indicate *unchanged*.
         """
         out = self.to_dict()
@@ -80,7 +200,7 @@ def __getitem__(self, k):
         return getattr(self, k)
 
     def __len__(self):
-        return len(self.__slots__)
+        return len(self.keys())
 
     def __array__(self, dtype=None, copy=None):  # pragma: needs-numpy
         # Doing this prevents numpy.array(JawType()) from becoming:
@@ -92,8 +212,8 @@ def __array__(self, dtype=None, copy=None):  # pragma: needs-numpy
         return out
 
     @classmethod
-    def keys(self):
-        return [i[1:] for i in self.__slots__]
+    def keys(cls):
+        return list(cls._fields)
 
     @classmethod
     def from_obj(cls, obj):
@@ -109,16 +229,31 @@ class JawType(BaseBucket):
     - :attr:`species`
 
     """
-    __slots__ = ("_arch_type", "_primary", "_species")
+    __slots__ = ("_code",)
+    _fields = ("arch_type", "primary", "species")
+
+    def __new__(cls, arch_type="*", primary=False, species="human"):
+        # Jaw types are immutable and there are only ever a handful of distinct
+        # ones so share one instance per distinct value.
+        if isinstance(arch_type, str) and arch_type in "LU*":
+            code = _jaw_type_code(_pack(arch_type, primary, species))
+            return cls._from_code(code)
+        if isinstance(arch_type, Mapping):
+            return JawType.__new__(cls, **arch_type)
+        raise ValueError(f"Invalid arch_type {repr(arch_type)}. "
+                         f"Must be one of 'LU*'.")
 
     def __init__(self, arch_type="*", primary=False, species="human"):
-        if isinstance(arch_type, Mapping):
-            BaseBucket.__init__(self, **arch_type)
-        elif isinstance(arch_type, str) and arch_type in "LU*":
-            BaseBucket.__init__(**locals())
-        else:
-            raise ValueError(f"Invalid arch_type {repr(arch_type)}. "
-                             f"Must be one of 'LU*'.")
+        # All the work is done in __new__().
+        pass
+
+    def __eq__(self, other):
+        if type(other) is JawType:
+            return self._code == other._code
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self):
+        return hash(self._code)
 
     @property
     def arch_type(self) -> str:
@@ -129,14 +264,20 @@ def arch_type(self) -> str:
         - For unspecified use :py:`'*'`.
 
         """
-        return self._arch_type
+        try:
+            return _ARCH_TYPES[self._code & 0b11]
+        except TypeError:
+            return self._code[0]
 
     @property
     def primary(self) -> Union[bool, str]:
         """Specifies deciduous dentition (A.K.A baby teeth).
         Either :py:`True` or :py:`False` or :py:`'*'`.
         """
-        return self._primary
+        try:
+            return _PRIMARIES[self._code >> 2 & 0b11]
+        except TypeError:
+            return self._code[1]
 
     @property
     def species(self) -> str:
@@ -144,7 +285,27 @@ def species(self) -> str:
         :py:`'human'`. It is highly recommended that you use '-' instead of
         spaces to delimit multiple words.
         """
-        return self._species
+        try:
+            return _species[self._code >> _SPECIES_SHIFT]
+        except TypeError:
+            return self._code[2]
 
     def with_(self, arch_type=..., primary=..., species=...):
         return BaseBucket.with_(**locals())
+
+    @classmethod
+    def _from_code(cls, code):
+        """Get the (interned) jaw type for a `_code`."""
+        # Keyed by class too so that a subclass never gets a base class
+        # instance or vice versa.
+        key = (cls, code)
+        try:
+            return _jaw_types[key]
+        except KeyError:
+            pass
+        self = object.__new__(cls)
+        self._code = code
+        if type(code) is tuple:
+            # Unpacked codes come from unbounded input so don't keep them.
+            return self
+        return _jaw_types.setdefault(key, self)
@@ -0,0 +1,85 @@
+from pangolin._jaw_type import JawType
+from pangolin._palmer import Palmer
+from pangolin._tooth_kinds import _memo
+
+
+class Layout(object):
+    """An enumeration of every concrete tooth in a :class:`JawType`, giving
+    each tooth a fixed integer *slot*.
+
+    Don't construct these directly. Use :func:`layout` which caches them.
+
+    The teeth are ordered as given by :meth:`Palmer.range` (left to right),
+    upper arch first. A :attr:`JawType.arch_type` of :py:`'*'` means both
+    arches. ::
+
+        >>> layout(JawType(primary=True, arch_type="L")).palmers[:3]
+        (Palmer('LLE'), Palmer('LLD'), Palmer('LLC'))
+
+    """
+
+    def __init__(self, jaw_type):
+        self.jaw_type = jaw_type
+        arch_types = "UL" if jaw_type.arch_type == "*" else jaw_type.arch_type
+        palmers = []
+        self._arches = {}
+        for arch_type in arch_types:
+            arch = Palmer.range(**jaw_type.with_(arch_type=arch_type))
+            self._arches[arch_type] = (len(palmers), len(arch) // 2)
+            palmers += arch
+        self.palmers = tuple(palmers)
+        self._slots = {str(palmer): i for (i, palmer) in enumerate(palmers)}
+
+    def __len__(self):
+        return len(self.palmers)
+
+    def slot(self, palmer) -> int:
+        """Get the slot number of a :class:`Palmer` (or a palmer string).
+
+        Raises:
+            KeyError:
+                If **palmer** isn't a concrete tooth in this layout.
+
+        For a :class:`Palmer`, this is simple arithmetic on its attributes.
+        A :class:`str` is looked up in a table, falling back to parsing it
+        should it not be in its normalised form.
+        """
+        if isinstance(palmer, str):
+            try:
+                return self._slots[palmer]
+            except KeyError:
+                pass
+            try:
+                palmer = Palmer(palmer)
+            except ValueError:
+                raise KeyError(palmer) from None
+        elif not isinstance(palmer, Palmer):
+            raise KeyError(palmer)
+        try:
+            offset, count = self._arches[palmer.arch_type]
+        except KeyError:
+            raise KeyError(palmer) from None
+        index = palmer.index
+        if palmer.species != self.jaw_type.species \
+                or palmer.primary != self.jaw_type.primary \
+                or palmer.sub_index is not None or index == "*" \
+                or not 1 <= index <= count:
+            raise KeyError(palmer)
+        if palmer.side == "L":
+            return offset + count - index
+        if palmer.side == "R":
+            return offset + count + index - 1
+        raise KeyError(palmer)
+
+
+def layout(jaw_type=JawType()) -> Layout:
+    """Get the (cached) :class:`Layout` for a :class:`JawType`. The cache is
+    emptied whenever :data:`TOOTH_KINDS` is modified."""
+    if not isinstance(jaw_type, JawType):
+        jaw_type = JawType(jaw_type)
+    layouts = _memo("layouts")
+    try:
+        return layouts[jaw_type]
+    except KeyError:
+        pass
+    return layouts.setdefault(jaw_type, Layout(jaw_type))
@@ -0,0 +1,193 @@
+import itertools
+from collections import namedtuple
+from collections.abc import Sequence
+
+from pangolin._palmer import Palmer
+
+
+def _from_palmer(value):
+    # Palmer() would accept single characters as partially specified palmers.
+    match = Palmer.regex.fullmatch(value)
+    if not match:
+        raise ValueError(f"Could not parse the palmer '{value}'.")
+    return Palmer(match)
+
+
+_CONVERTERS = {
+    "palmer": _from_palmer,
+    "fdi": Palmer.from_FDI,
+    "universal": Palmer.from_universal,
+}
+
+
+class NotationGuess(
+        namedtuple("NotationGuess",
+                   ["notation", "primary", "confidence", "scores"])):
+    """The outcome of :func:`sniff_notation`.
+
+    Attributes:
+        notation:
+            The most plausible notation. One of :py:`'palmer'`, :py:`'fdi'` or
+            :py:`'universal'`, or :py:`None` if the sample contained nothing
+            valid in any notation.
+        primary:
+            :py:`True` if every valid sampled value was a primary tooth,
+            :py:`False` if none were or :py:`'*'` if there was a mix.
+        confidence:
+            The fraction of (non-blank) sampled values which are valid in
+            **notation**, divided by the number of notations which explain the
+            sample equally well. i.e. :py:`1.0` means that every sampled value
+            was valid in **notation** and that no other notation fits as well.
+        scores:
+            A :class:`dict` mapping every notation to the fraction of sampled
+            values which are valid in it.
+
+    """
+
+
+def _clean(value):
+    """Normalise a spreadsheet cell to a string or None if it's blank."""
+    if value is None or value != value:  # None or NaN
+        return None
+    if isinstance(value, float) and value.is_integer():
+        # Spreadsheet readers like to turn whole numbers into floats.
+        value = int(value)
+    value = str(value).strip()
+    return value or None
+
+
+def _try(converter, value):
+    try:
+        return converter(value)
+    except ValueError:
+        return None
+
+
+def _sample(values, sample_size):
+    """Pick up to **sample_size** values spread out over **values**. Returns
+    the sample and an iterable which still yields all of **values**."""
+    if isinstance(values, Sequence) or hasattr(values, "__array__"):
+        step = max(len(values) // sample_size, 1)
+        return values[::step][:sample_size], values
+    values = iter(values)
+    head = list(itertools.islice(values, sample_size))
+    return head, itertools.chain(head, values)
+
+
+def _sniff(sample):
+    sample = [i for i in map(_clean, sample) if i is not None]
+    parsed = {
+        notation: [_try(converter, i) for i in sample]
+        for (notation, converter) in _CONVERTERS.items()
+    }
+    scores = {
+        notation: sum(i is not None for i in palmers) / (len(sample) or 1)
+        for (notation, palmers) in parsed.items()
+    }
+    best = max(scores.values())
+    if not best:
+        return NotationGuess(None, False, 0.0, scores)
+    # Ties go to whichever comes first in _CONVERTERS.
+    notation = next(i for i in scores if scores[i] == best)
+    ties = sum(i == best for i in scores.values())
+
+    primaries = {i.primary for i in parsed[notation] if i is not None}
+    primary = primaries.pop() if len(primaries) == 1 else "*"
+    return NotationGuess(notation, primary, best / ties, scores)
+
+
+def sniff_notation(values, sample_size=500) -> NotationGuess:
+    """Guess which tooth numbering system a column of values is written in.
+
+    Args:
+        values:
+            The column. Any iterable of strings or numbers. Blanks (empty
+            strings, :py:`None` and NaN) are ignored.
+        sample_size:
+            How many values to check. If **values** is a sequence (e.g. a list
+            or a NumPy array), they're spread evenly over it. Otherwise they're
+            the first **sample_size** values.
+    Returns:
+        A :class:`NotationGuess`.
+
+    ::
+
+        >>> guess = sniff_notation(["11", "21", "48", "", "36"])
+        >>> guess.notation, guess.primary, guess.confidence
+        ('fdi', False, 1.0)
+        >>> guess.scores
+        {'palmer': 0.0, 'fdi': 1.0, 'universal': 0.5}
+        >>> sniff_notation([1, 5, 16.0, 30]).notation
+        'universal'
+        >>> sniff_notation(["URA", "ULB", "LRE"]).primary
+        True
+
+    Values which are valid in more than one notation (e.g. FDI and Universal
+    both have a tooth 12) count towards each notation. Where the sample
+    can't tell notations apart, the :attr:`~NotationGuess.confidence` is
+    lowered accordingly and the order of preference is Palmer, FDI then
+    Universal.
+
+    """
+    return _sniff(_sample(values, sample_size)[0])
+
+
+def convert_column(values, notation=None, sample_size=500,
+                   errors="raise") -> list:
+    """Convert a whole column of tooth numbers to :class:`Palmer` objects.
+
+    Args:
+        values:
+            An iterable of strings or numbers. It's only iterated over once.
+        notation:
+            Which notation **values** are written in: :py:`'palmer'`,
+            :py:`'fdi'` or :py:`'universal'`. If not given, it's chosen by
+            :func:`sniff_notation`.
+        sample_size:
+            Passed to :func:`sniff_notation`.
+        errors:
+            What to do with values which aren't valid in **notation**: either
+            :py:`'raise'` a :class:`ValueError` or :py:`'ignore'` them by
+            outputting :py:`None`.
+    Returns:
+        A list containing a :class:`Palmer` or :py:`None` for each value.
+        Blanks always give :py:`None`.
+
+    ::
+
+        >>> convert_column(["11", "21", "", 48])
+        [Palmer('UR1'), Palmer('UL1'), None, Palmer('LR8')]
+
+    Each distinct value is only converted once. To inspect the sniffer's
+    confidence before committing to a notation, call :func:`sniff_notation`
+    first then pass its :attr:`~NotationGuess.notation` to this function.
+
+    """
+    if errors not in ("raise", "ignore"):
+        raise ValueError(f"Invalid errors {repr(errors)}. Must be either "
+                         f"'raise' or 'ignore'.")
+    if notation is None:
+        (sample, values) = _sample(values, sample_size)
+        notation = _sniff(sample).notation
+        if notation is None:
+            raise ValueError("Couldn't determine the notation. No sampled "
+                             "values are valid in any notation.")
+    try:
+        converter = _CONVERTERS[notation]
+    except KeyError:
+        raise ValueError(f"Unknown notation {repr(notation)}. Must be one of "
+                         f"{tuple(_CONVERTERS)}.") from None
+
+    cache = {None: None}
+    out = []
+    for (i, value) in enumerate(values):
+        value = _clean(value)
+        try:
+            palmer = cache[value]
+        except KeyError:
+            palmer = cache.setdefault(value, _try(converter, value))
+        if palmer is None and value is not None and errors == "raise":
+            raise ValueError(f"Row {i}: {repr(value)} is not a valid "
+                             f"{notation} tooth number.")
+        out.append(palmer)
+    return out
@@ -1,11 +1,31 @@
 import re
-from typing import Union, List, Match
+from typing import Union, List, Match, Optional
 
-from pangolin._jaw_type import JawType, BaseBucket
-from pangolin import tooth_kinds
+from pangolin._jaw_type import (JawType, BaseBucket, _pack, _SIDES,
+                                _SUB_INDEX_SHIFT, _INDEX_SHIFT, _jaw_type_code)
+from pangolin._tooth_kinds import tooth_kinds, _memo
 
 
-_palmer_regex = re.compile(r"""
+class _LazyRegex(object):
+    """A class attribute which compiles its pattern on first access then
+    replaces itself with the compiled :ref:`re.Pattern <re-objects>`. This
+    keeps compiling out of ``import pangolin``."""
+
+    def __init__(self, pattern, flags=0):
+        self.pattern = pattern
+        self.flags = flags
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance, owner):
+        regex = re.compile(self.pattern, self.flags)
+        setattr(self.owner, self.name, regex)
+        return regex
+
+
+_palmer_regex = r"""
 
 # species: optional, requires but excludes a trailing - or _ delimiter.
 (?:([\w-]+)[_-])?
@@ -22,7 +42,7 @@
 # subindex: optional single-digit number, ignores but requires a preceding '.'.
 (?:[.](\d))?
 
-""", re.VERBOSE)  # yapf: disable
+"""  # yapf: disable
 
 PalmerLike = Union['Palmer', str, Match]
 
@@ -44,6 +64,13 @@ class Palmer(JawType):
     :attr:`arch_type`, :attr:`side`, :attr:`index`, :attr:`sub_index`
     :attr:`primary`, :attr:`species`.
 
+    To keep instances small, these attributes are packed into one integer.
+    Values which don't fit -- an :attr:`index` of 65535 or more, a
+    :attr:`sub_index` of 255 or more, a negative number or a :attr:`species`
+    beyond the first 1024 distinct ones seen by the process -- are still
+    allowed but are stored unpacked, costing more memory, and have no code in
+    :func:`parse_array(..., packed=True) <parse_array>`.
+
     .. _`Palmer tooth labelling system`:
         https://support.clearcorrect.com/hc/article_attachments/360054874894/Dental_Notation_Systems_1_-_EN.jpg
 
@@ -56,7 +83,10 @@ def side(self) -> str:
         Either :py:`'L'` for left, :py:`'R'` or :py:`'*'` for unknown.
         Left and right are from the patient's perspective -- not the examiner's.
         """
-        return self._side
+        try:
+            return _SIDES[self._code >> 4 & 0b11]
+        except TypeError:
+            return self._code[3]
 
     @property
     def index(self) -> Union[str, int]:
@@ -65,16 +95,36 @@ def index(self) -> Union[str, int]:
         This is still an integer for baby teeth. The only valid :class:`str`
         value this attribute may have is wildcard :py:`'*'`.
         """
-        return self._index
+        try:
+            index = self._code >> _INDEX_SHIFT & 0xFFFF
+        except TypeError:
+            return self._code[4]
+        return index - 1 if index else "*"
 
     @property
     def sub_index(self) -> int:
         """An optional sub-enumeration usable to specify indivual cusps."""
-        return self._sub_index
+        try:
+            sub_index = self._code >> _SUB_INDEX_SHIFT & 0xFF
+        except TypeError:
+            return self._code[5]
+        return sub_index - 1 if sub_index else None
 
-    __slots__ = ("_arch_type", "_side", "_index", "_sub_index", "_primary",
-                 "_species")
-    regex = _palmer_regex
+    # All attributes are packed into JawType's `_code` slot.
+    __slots__ = ()
+    _fields = ("arch_type", "side", "index", "sub_index", "primary", "species")
+    regex = _LazyRegex(_palmer_regex, re.VERBOSE)
+
+    def __new__(cls, *args, **kwargs):
+        # Don't inherit JawType's interning.
+        return object.__new__(cls)
+
+    @classmethod
+    def _from_code(cls, code):
+        """Construct directly from a packed `_code`."""
+        self = object.__new__(cls)
+        self._code = code
+        return self
 
     def __init__(self, arch_type="*", side="*", index="*", sub_index=None,
                  primary=False, species="human"):
@@ -114,11 +164,12 @@ def __init__(self, arch_type="*", side="*", index="*", sub_index=None,
             match = Palmer.regex.fullmatch(arch_type)
             if not match:
                 raise ValueError(f"Could not parse the palmer '{arch_type}'.")
-            self.__init__(match)
+            self.__init__(*unpack_match(match))
 
         else:
             # Initialise explicitly (just set each attribute).
-            BaseBucket.__init__(**locals())
+            self._code = _pack(arch_type, primary, species, side, index,
+                               sub_index)
 
     def __eq__(self, x):
         return (self is x) or str(self) == x
@@ -195,7 +246,7 @@ def __str__(self):
     def jaw_type(self) -> JawType:
         """Export the :class:`JawType` properties of the arch that this tooth
         belongs to."""
-        return JawType.from_obj(self)
+        return JawType._from_code(_jaw_type_code(self._code))
 
     @property
     def kind(self):
@@ -217,6 +268,65 @@ def kind(self):
 
     KINDS = dict(zip("ICPM", ("incisor", "canine", "premolar", "molar")))
 
+    @property
+    def mesial(self) -> Optional['Palmer']:
+        """The neighbouring tooth towards the centre of the arch. For a central
+        incisor, this is the central incisor on the other side.
+
+        ::
+
+            >>> Palmer("UR3").mesial
+            Palmer('UR2')
+            >>> Palmer("UR1").mesial
+            Palmer('UL1')
+
+        See :func:`adjacency` for the bulk equivalent.
+        """
+        return self._adjacent("mesial")
+
+    @property
+    def distal(self) -> Optional['Palmer']:
+        """The neighbouring tooth away from the centre of the arch or
+        :py:`None` if this is the last tooth.
+
+        ::
+
+            >>> Palmer("UR3").distal
+            Palmer('UR4')
+            >>> print(Palmer("UR8").distal)
+            None
+
+        """
+        return self._adjacent("distal")
+
+    @property
+    def opposing(self) -> Optional['Palmer']:
+        """The tooth in the same position on the other arch or :py:`None` if
+        there is no such tooth.
+
+        ::
+
+            >>> Palmer("UR3").opposing
+            Palmer('LR3')
+
+        """
+        return self._adjacent("opposing")
+
+    def _adjacent(self, name):
+        # Memoised by `_code`. Discarded should TOOTH_KINDS change.
+        neighbours = _memo(name)
+        try:
+            return neighbours[self._code]
+        except KeyError:
+            pass
+        if self.index == "*" or self.side == "*" or self.arch_type == "*":
+            raise ValueError(f"The {name} tooth of '{self}' is ambiguous.")
+        # Only needed on a miss. Importing it at the top would be circular
+        # and would drag _layout into every `import pangolin`.
+        from pangolin._adjacency import adjacency
+        neighbour = adjacency(self.jaw_type)._apply(name, [self])[0]
+        return neighbours.setdefault(self._code, neighbour)
+
     @property
     def quadrant(self) -> str:
         """Quadrant is a standard dental enumeration derived from :attr:`side`
@@ -302,6 +412,66 @@ def _range(cls, start: int, end: int, jaw_type: JawType):
             out.append(base.with_(side="R", index=index))
         return out
 
+    def expand(self) -> List['Palmer']:
+        """Enumerate every concrete tooth which a wildcard Palmer could be.
+
+        Returns:
+            A list of palmers with no wildcard :attr:`arch_type`,
+            :attr:`side`, :attr:`index` or :attr:`primary`. Upper teeth come
+            before lower teeth and permanent teeth come before primary teeth.
+            Otherwise they are ordered left to right as in :meth:`range`.
+
+        ::
+
+            >>> Palmer("U*1").expand()
+            [Palmer('UL1'), Palmer('UR1')]
+            >>> Palmer("*RC").expand()
+            [Palmer('URC'), Palmer('LRC')]
+
+        A wildcard :attr:`index` expands to all teeth listed by
+        :func:`tooth_kinds`. An explicit :attr:`index` is checked against
+        :func:`tooth_kinds` and raises a :class:`ValueError` if it's out of
+        range. With a wildcard :attr:`primary`, dentitions with no
+        :func:`tooth_kinds` data (sheep only have permanent teeth data) or too
+        few teeth for an explicit :attr:`index` are skipped instead. A
+        wildcard :attr:`species` can't be expanded.
+
+        """
+        if self.species == "*":
+            raise ValueError(f"Can't expand '{self}' with a wildcard species.")
+        out = []
+        missing = None
+        for arch_type in "UL" if self.arch_type == "*" else self.arch_type:
+            for primary in (False, True) if self.primary == "*" \
+                    else (self.primary,):
+                jaw_type = JawType(arch_type, primary, self.species)
+                try:
+                    count = len(tooth_kinds(jaw_type))
+                    if self.index == "*":
+                        indices = range(1, count + 1)
+                    elif self.index <= count:
+                        indices = [self.index]
+                    else:
+                        raise ValueError(
+                            f"'{self}' has index {self.index} but "
+                            f"{repr(jaw_type)} only has {count} teeth per "
+                            f"quadrant.")
+                except ValueError as ex:
+                    if self.primary != "*":
+                        raise
+                    missing = ex
+                    continue
+                for side in "LR" if self.side == "*" else self.side:
+                    out += [
+                        self.with_(arch_type=arch_type, side=side, index=i,
+                                   primary=primary)
+                        for i in (indices[::-1] if side == "L" else indices)
+                    ]
+        if missing is not None and not out:
+            # No dentition has data or, for an explicit index, enough teeth.
+            raise missing
+        return out
+
     def to_FDI(self) -> str:
         """Convert to `FDI International Standard
         <https://support.clearcorrect.com/hc/article_attachments/360054874894/Dental_Notation_Systems_1_-_EN.jpg>`_.
@@ -314,6 +484,35 @@ def to_FDI(self) -> str:
             quadrant += 4
         return str(quadrant) + str(self.index)
 
+    @classmethod
+    def from_FDI(cls, code: str) -> 'Palmer':
+        """Parse from `FDI International Standard
+        <https://support.clearcorrect.com/hc/article_attachments/360054874894/Dental_Notation_Systems_1_-_EN.jpg>`_.
+        The inverse of :meth:`to_FDI`.
+
+        ::
+
+            >>> Palmer.from_FDI("13")
+            Palmer('UR3')
+            >>> Palmer.from_FDI("73")
+            Palmer('LLC')
+
+        """
+        code = str(code)
+        if len(code) != 2 or code[0] not in "12345678" \
+                or not (code[1] in "12345678" or code[1] == "*"):
+            raise ValueError(f"Invalid FDI tooth number '{code}'.")
+        quadrant = int(code[0])
+        primary = quadrant > 4
+        if primary:
+            quadrant -= 4
+        index = "*" if code[1] == "*" else int(code[1])
+        arch_type, side = _QUADRANTS[quadrant]
+        if primary and index != "*" and index > 5:
+            raise ValueError(f"Invalid FDI tooth number '{code}'. "
+                             f"Primary teeth only go up to 5.")
+        return cls(arch_type, side, index, primary=primary)
+
     def to_symbol(self, true_type: bool = False) -> str:
         """Convert to special Palmer unicode symbols which match the traditional
         handwritten syntax.
@@ -397,16 +596,146 @@ def to_universal(self) -> str:
 
         return out
 
+    @classmethod
+    def from_universal(cls, code: str) -> 'Palmer':
+        """Parse from `Universal ADA Standard
+        <https://support.clearcorrect.com/hc/article_attachments/360054874894/Dental_Notation_Systems_1_-_EN.jpg>`_.
+        The inverse of :meth:`to_universal`.
+
+        ::
+
+            >>> Palmer.from_universal("1")
+            Palmer('UR8')
+            >>> Palmer.from_universal("A")
+            Palmer('URE')
+
+        """
+        code = str(code)
+        if code.isdigit() and 1 <= int(code) <= 32:
+            primary, max_, number = False, 32, int(code)
+        elif len(code) == 1 and "A" <= code <= "T":
+            primary, max_, number = True, 20, char_to_digit(code)
+        else:
+            raise ValueError(f"Invalid Universal tooth number '{code}'.")
+
+        # Undo everything to_universal() does in reverse order.
+        if number > max_ // 2:
+            arch_type = "L"
+            number = (max_ + 1) - number
+        else:
+            arch_type = "U"
+        if number > max_ // 4:
+            side, index = "L", number - max_ // 4
+        else:
+            side, index = "R", (1 + max_ // 4) - number
+        return cls(arch_type, side, index, primary=primary)
+
     def with_(self, arch_type=..., side=..., index=..., sub_index=...,
               primary=..., species=...):
         return BaseBucket.with_(**locals())
 
+    @classmethod
+    def finditer(cls, text: str):
+        """Find all palmers in **text**. Equivalent to
+        :py:`Palmer.regex.finditer(text)` but runs in linear time even when
+        **text** contains long runs of word characters.
+
+        ::
+
+            >>> [Palmer(i) for i in Palmer.finditer("UR3, orc-LL2 and UL1.")]
+            [Palmer('UR3'), Palmer('orc-LL2'), Palmer('UL1')]
+
+        """
+        from pangolin._palmer_scan import finditer
+        return finditer(text)
+
+    @classmethod
+    def lazy(cls, palmer: str, validate: bool = True) -> 'LazyPalmer':
+        """Create a :class:`LazyPalmer` which defers parsing **palmer**."""
+        return LazyPalmer(palmer, validate=validate)
+
+
+# A palmer string in the form that str(Palmer(x)) would give.
+_canonical_regex = \
+    r"(?:(?!human-)[\w-]+-)?[UL*][LR*](?:[1-9][0-9]*|[A-Z]|\*)(?:[.][0-9])?"
+
+
+class LazyPalmer(Palmer):
+    """A :class:`Palmer` which holds onto its raw string and only parses it
+    when one of its attributes is needed.
+
+    Args:
+        palmer:
+            A palmer string.
+        validate:
+            If true, raise a :class:`ValueError` immediately if **palmer**
+            isn't a valid palmer. Otherwise, defer the error until the first
+            attribute access.
+
+    Hashing, equality testing and :class:`str` don't require parsing if the
+    input is already normalised (in the form :py:`str(Palmer(x))` would
+    give). Lazy palmers are interchangeable with regular ones::
+
+        >>> lazy = Palmer.lazy("UR3")
+        >>> lazy == Palmer("UR3"), {Palmer("UR3"): 1}[lazy]
+        (True, 1)
+        >>> lazy.index  # Parsing happens here.
+        3
+
+    Passing anything other than a single string falls back to regular
+    (eager) :class:`Palmer` initialisation.
+
+    """
+    __slots__ = ("_raw", "_str")
+    _canonical_regex = _LazyRegex(_canonical_regex)
+
+    def __init__(self, *args, validate=True, **kwargs):
+        self._raw = self._str = None
+        if len(args) != 1 or kwargs or not isinstance(args[0], str) \
+                or len(args[0]) < 2:
+            Palmer.__init__(self, *args, **kwargs)
+            return
+        self._raw = palmer = args[0]
+        if self._canonical_regex.fullmatch(palmer):
+            self._str = palmer
+        elif validate and not Palmer.regex.fullmatch(palmer):
+            raise ValueError(f"Could not parse the palmer '{palmer}'.")
+
+    def __getattr__(self, name):
+        # Only called if `name` isn't already set.
+        if name != "_code":
+            raise AttributeError(name)
+        raw = self._raw
+        if raw is None:
+            # Either not a lazy palmer or another thread has set `_code` since
+            # it was found to be missing.
+            return object.__getattribute__(self, name)
+        # Parse into a local rather than via self.__init__() so that other
+        # threads never see `_raw` cleared before `_code` is set.
+        code = Palmer(raw)._code
+        self._code = code
+        self._raw = None
+        return code
+
+    def __str__(self):
+        if self._str is not None:
+            return self._str
+        return Palmer.__str__(self)
+
+    __hash__ = Palmer.__hash__
+
 
 def unpack_match(match: Match) -> tuple:
     """Convert a match from :attr:`Palmer.regex` into explicit palmer arguments.
     """
 
-    species, arch_type, side, index, sub_index = match.groups()
+    return unpack_groups(match.groups())
+
+
+def unpack_groups(groups: tuple) -> tuple:
+    """Convert the :py:`(species, arch_type, side, index, sub_index)` groups
+    of a :attr:`Palmer.regex` match into explicit palmer arguments."""
+    species, arch_type, side, index, sub_index = groups
     if species is None:
         species = "human"
 
@@ -425,6 +754,9 @@ def unpack_match(match: Match) -> tuple:
     return arch_type, side, index, sub_index, primary, species
 
 
+_QUADRANTS = {1: "UR", 2: "UL", 3: "LL", 4: "LR"}
+
+
 def char_to_digit(char):
     return ord(char.upper()) - ord("A") + 1
 
@@ -0,0 +1,175 @@
+from pangolin._jaw_type import (_ARCH_TYPES, _PRIMARIES, _SIDES,
+                                _SUB_INDEX_SHIFT, _INDEX_SHIFT)
+from pangolin._palmer import Palmer
+from pangolin._palmer_table import _numpy
+
+_INT64_MAX = (1 << 63) - 1
+
+
+def _table(np, mapping):  # pragma: needs-numpy
+    """A lookup table from character code (clipped to 255) to integer. Any
+    character not in **mapping** maps to -1."""
+    table = np.full(256, -1, np.int64)
+    for (character, value) in mapping.items():
+        table[ord(character)] = value
+    return table
+
+
+def _fast(np, chars):  # pragma: needs-numpy
+    """Parse rows of the form ``[UL*][LR*](\\d|[A-Z]|\\*)(\\.\\d)?`` using only
+    array operations.
+
+    Returns:
+        The **arch_type**, **side**, **index**, **sub_index** and **primary**
+        columns (all integers) and a mask of which rows were parsed.
+
+    """
+    # Everything but these characters is irrelevant to the fast path so
+    # clipping to 255 (which isn't in any table) is harmless.
+    chars = np.minimum(chars, 255)
+    arch_type = _table(np, {i: n for (n, i) in enumerate(_ARCH_TYPES)})
+    arch_type = arch_type[chars[:, 0]]
+    side = _table(np, {i: n for (n, i) in enumerate(_SIDES)})[chars[:, 1]]
+
+    digit = _table(np, {str(i): i for i in range(10)})
+    letter = _table(np, {chr(ord("A") + i): i + 1 for i in range(26)})
+    index_char = chars[:, 2]
+    index = np.where(digit[index_char] >= 0, digit[index_char],
+                     letter[index_char])
+    primary = np.where(letter[index_char] >= 0, 1, 0)
+    wildcard = index_char == ord("*")
+    index[wildcard] = -1
+    primary[wildcard] = _PRIMARIES.index("*")
+
+    # Either nothing or '.\d' after the index then nothing more.
+    sub_index = digit[chars[:, 4]]
+    no_suffix = chars[:, 3] == 0
+    suffix = (chars[:, 3] == ord(".")) & (sub_index >= 0)
+    sub_index[no_suffix] = -1
+    ok = (arch_type >= 0) & (side >= 0) & ((index >= 0) | wildcard) \
+         & (no_suffix & (chars[:, 4] == 0) | suffix) \
+         & ~chars[:, 5:].any(axis=1)
+    return arch_type, side, index, sub_index, primary, ok
+
+
+def parse_array(labels, packed=False):
+    """Parse a NumPy array of palmer strings using vectorised operations.
+
+    Args:
+        labels:
+            An array (or anything :func:`numpy.asarray` can convert to one)
+            with a fixed width string (:py:`'U'`) or bytes (:py:`'S'`) dtype.
+        packed:
+            If true, return one integer per label instead of a column per
+            attribute.
+    Returns:
+        If **packed** is false, a :class:`dict` of arrays, each with the same
+        shape as **labels**:
+
+        - :py:`'arch_type'` and :py:`'side'`: single character strings.
+        - :py:`'index'`: integers. Wildcards are :py:`-1`.
+        - :py:`'sub_index'`: integers. :py:`None` is :py:`-1`.
+        - :py:`'primary'`: integers: :py:`0` for :py:`False`, :py:`1` for
+          :py:`True` and :py:`2` for :py:`'*'`.
+        - :py:`'species'`: strings.
+        - :py:`'valid'`: booleans. The other columns are meaningless where
+          this is false.
+
+        If **packed** is true, a :py:`int64` array of the compact codes which
+        :class:`Palmer` uses internally to store its attributes. Invalid
+        labels are :py:`-1`, as are labels which :class:`Palmer` can't pack.
+        The codes contain process specific IDs for non-human species so must
+        not be saved or sent to another process.
+    Raises:
+        ImportError: If NumPy is not installed.
+
+    ::
+
+        >>> columns = parse_array(np.array(["UR3", "LLE", "U*2.1", "nonsense"]))
+        >>> columns["index"]
+        array([ 3,  5,  2, -1])
+        >>> columns["primary"]
+        array([0, 1, 0, 0])
+        >>> columns["valid"]
+        array([ True,  True,  True, False])
+
+    The common case of no species and a single character index is parsed
+    directly from the labels' character codes without any Python level
+    loop. Anything else (species prefixes, multi digit indices) is
+    deduplicated and each distinct label is parsed with :class:`Palmer`.
+    Indices too large for an :py:`int64` make a label invalid.
+
+    """
+    np = _numpy()
+    if np is None:  # pragma: no-numpy
+        raise ImportError("parse_array() requires NumPy.")
+    return _parse_array(np, labels, packed)
+
+
+def _parse_array(np, labels, packed):  # pragma: needs-numpy
+    labels = np.asarray(labels)
+    if labels.dtype.kind not in "US":
+        raise TypeError(f"parse_array() requires a string or bytes array, "
+                        f"not dtype {labels.dtype}.")
+    shape = labels.shape
+    flat = np.ascontiguousarray(labels.reshape(-1))
+    n = len(flat)
+
+    # Each label as a row of character codes, padded with 0s to >= 5 columns.
+    if labels.dtype.kind == "U":
+        codes = flat.view(np.uint32)
+        width = labels.dtype.itemsize // 4
+    else:
+        codes = flat.view(np.uint8)
+        width = labels.dtype.itemsize
+    chars = np.zeros((n, max(width, 5)), np.int64)
+    chars[:, :width] = codes.reshape(n, width)
+
+    arch_type, side, index, sub_index, primary, valid = _fast(np, chars)
+    species = np.zeros(n, np.int64)
+    code = arch_type | primary << 2 | side << 4 \
+           | (sub_index + 1) << _SUB_INDEX_SHIFT \
+           | (index + 1) << _INDEX_SHIFT
+
+    # Everything else: parse each distinct label once. **species** holds IDs
+    # into **names** rather than _species since not every species has an ID
+    # in _species.
+    slow = np.nonzero(~valid)[0]
+    uniques, inverse = np.unique(flat[slow], return_inverse=True)
+    names = {"human": 0}
+    rows = [(False, 0, 0, 0, -1, -1, 0, -1)]
+    for label in uniques.tolist():
+        if isinstance(label, bytes):
+            label = label.decode("utf-8", "replace")
+        match = Palmer.regex.fullmatch(label)
+        palmer = Palmer(match) if match else None
+        if palmer is None or palmer.index != "*" and palmer.index > _INT64_MAX:
+            rows.append(rows[0])
+            continue
+        rows.append((
+            True,
+            _ARCH_TYPES.index(palmer.arch_type),
+            _PRIMARIES.index(palmer.primary),
+            _SIDES.index(palmer.side),
+            -1 if palmer.sub_index is None else palmer.sub_index,
+            -1 if palmer.index == "*" else palmer.index,
+            names.setdefault(palmer.species, len(names)),
+            palmer._code if type(palmer._code) is int else -1,
+        ))
+    (valid[slow], arch_type[slow], primary[slow], side[slow], sub_index[slow],
+     index[slow], species[slow], code[slow]) = \
+        np.array(rows, np.int64)[inverse.reshape(-1) + 1].T
+
+    if packed:
+        code[~valid] = -1
+        return code.reshape(shape)
+
+    return {
+        "arch_type": np.array(_ARCH_TYPES)[arch_type].reshape(shape),
+        "side": np.array(_SIDES)[side].reshape(shape),
+        "index": index.reshape(shape),
+        "sub_index": sub_index.reshape(shape),
+        "primary": primary.reshape(shape),
+        "species": np.array(list(names))[species].reshape(shape),
+        "valid": valid.reshape(shape),
+    }
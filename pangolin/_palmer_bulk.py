@@ -0,0 +1,122 @@
+import collections
+
+from pangolin._palmer import Palmer, LazyPalmer
+
+
+class _Canonical(object):
+    """Map palmers and palmer strings to their canonical :py:`str(Palmer(x))`
+    form, converting each distinct input only once.
+
+    Strings are cached by value and :class:`Palmer` objects by their packed
+    `_code` so that, in the usual case of a few hundred distinct teeth spread
+    over millions of rows, each row costs one dict lookup. Strings which can't
+    be parsed are their own canonical form.
+    """
+
+    def __init__(self):
+        self._cache = {}
+        # canonical string -> the object reported by unique()/value_counts().
+        self.objects = {}
+
+    def __call__(self, value):
+        if isinstance(value, str):
+            key = value
+        elif isinstance(value, LazyPalmer) and value._raw is not None:
+            key = value._raw
+        else:
+            if not isinstance(value, Palmer):
+                value = Palmer(value)
+            key = value._code
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        return self._cache.setdefault(key, self._canonicalise(key))
+
+    def _canonicalise(self, key):
+        if isinstance(key, str):
+            try:
+                palmer = Palmer(key)
+            except ValueError:
+                palmer = key
+        else:
+            palmer = Palmer._from_code(key)
+        canonical = str(palmer)
+        self.objects.setdefault(canonical, palmer)
+        return canonical
+
+
+def isin(values, targets) -> list:
+    """Test whether each of **values** is equal to any of **targets**.
+
+    Args:
+        values:
+            An iterable of :class:`Palmer` objects or palmer strings.
+        targets:
+            The palmers to look for, in the same forms as **values**.
+    Returns:
+        A list of booleans, one per element of **values**.
+
+    This is the bulk equivalent of :py:`[i in targets for i in values]` but
+    each side is normalised once then compared by hashing rather than
+    formatting a string per comparison. Strings are compared by what they
+    parse to so :py:`'human-UR3'` matches :py:`'UR3'`. ::
+
+        >>> isin(["UR3", Palmer("LL2"), "human-UL1"], ["UL1", Palmer("UR3")])
+        [True, False, True]
+
+    """
+    canonical = _Canonical()
+    targets = set(map(canonical, targets))
+    return [canonical(value) in targets for value in values]
+
+
+def unique(values) -> list:
+    """Deduplicate palmers, preserving the order in which each first appears.
+
+    Args:
+        values:
+            An iterable of :class:`Palmer` objects or palmer strings.
+    Returns:
+        A list of :class:`Palmer` objects. Strings which can't be parsed are
+        passed through unchanged.
+
+    ::
+
+        >>> unique(["UR3", Palmer("UR3"), "LL2", "human-UR3", "LL2"])
+        [Palmer('UR3'), Palmer('LL2')]
+
+    """
+    canonical = _Canonical()
+    seen = {}
+    for value in values:
+        seen.setdefault(canonical(value))
+    return [canonical.objects[i] for i in seen]
+
+
+def value_counts(values) -> dict:
+    """Count how many times each palmer appears.
+
+    Args:
+        values:
+            An iterable of :class:`Palmer` objects or palmer strings.
+    Returns:
+        A :class:`dict` mapping each distinct :class:`Palmer` to its count,
+        most common first. Ties keep the order of first appearance. Strings
+        which can't be parsed are counted as they are.
+
+    Since palmers hash the same as their strings, the output can be indexed
+    with either::
+
+        >>> counts = value_counts(["UR3", "LL2", Palmer("UR3"), "LL2", "LL2"])
+        >>> counts
+        {Palmer('LL2'): 3, Palmer('UR3'): 2}
+        >>> counts["UR3"]
+        2
+
+    """
+    canonical = _Canonical()
+    counts = collections.Counter(map(canonical, values))
+    return {
+        canonical.objects[i]: count for (i, count) in counts.most_common()
+    }
@@ -0,0 +1,103 @@
+from pangolin._palmer import Palmer
+
+_empty = frozenset()
+
+
+class PalmerIndex(object):
+    """A collection of :class:`Palmer` objects which can be searched using
+    wildcard palmers.
+
+    Args:
+        palmers:
+            Initial contents. Either :class:`Palmer` objects or palmer strings.
+
+    Every palmer is assigned a *position* (the order it was added in). For
+    each attribute (:attr:`~Palmer.arch_type`, :attr:`~Palmer.side`, etc.)
+    the index keeps a table mapping each value to the set of positions holding
+    that value. A query intersects those sets, starting from its most
+    selective attribute, rather than scanning every element. ::
+
+        >>> index = PalmerIndex(["UR3", "UL3", "LR3", "UR5", "orc-UR3"])
+        >>> index.query("U*3")
+        [Palmer('UR3'), Palmer('UL3')]
+        >>> index.positions("**3")
+        [0, 1, 2]
+
+    Matching follows the same rules as :meth:`Palmer.match`: wildcards in
+    either the query or the stored palmers match anything.
+
+    """
+
+    def __init__(self, palmers=()):
+        self._palmers = []
+        self._postings = {key: {} for key in Palmer.keys()}
+        self.extend(palmers)
+
+    def add(self, palmer):
+        """Add a single palmer."""
+        palmer = Palmer(palmer)
+        position = len(self._palmers)
+        self._palmers.append(palmer)
+        for (key, postings) in self._postings.items():
+            postings.setdefault(getattr(palmer, key), set()).add(position)
+
+    def extend(self, palmers):
+        """Add many palmers."""
+        for palmer in palmers:
+            self.add(palmer)
+
+    def __len__(self):
+        return len(self._palmers)
+
+    def __iter__(self):
+        return iter(self._palmers)
+
+    def __getitem__(self, position):
+        return self._palmers[position]
+
+    def positions(self, query) -> list:
+        """Find the positions of all palmers matching a wildcard **query**.
+
+        Returns:
+            A sorted list of positions.
+
+        The cost is proportional to the number of positions matching the
+        query's most selective attribute (including stored wildcards), plus
+        sorting the result. It is not proportional to the size of the result
+        so broad queries such as :py:`"U**"` still touch a large share of the
+        index.
+
+        """
+        query = Palmer(query)
+        constraints = []
+        for (key, postings) in self._postings.items():
+            value = getattr(query, key)
+            if value == "*":
+                continue
+            constraints.append(
+                (postings.get(value, _empty), postings.get("*", _empty)))
+
+        # Positions matching an attribute are those holding either its value
+        # or a wildcard. Start with the most selective attribute's positions
+        # and narrow them down with the rest. Set intersection only iterates
+        # over the smaller operand so each step costs at most the size of the
+        # (shrinking) candidate set, never that of a large wildcard set.
+        # There is always at least one constraint because sub_index can't be
+        # '*'.
+        constraints.sort(key=lambda sets: len(sets[0]) + len(sets[1]))
+        ((exact, wildcards), *others) = constraints
+        candidates = exact | wildcards
+        for (exact, wildcards) in others:
+            if not candidates:
+                break
+            candidates = (candidates & exact) | (candidates & wildcards)
+        return sorted(candidates)
+
+    def query(self, query) -> list:
+        """Find all palmers matching a wildcard **query**, in the order they
+        were added."""
+        return [self._palmers[i] for i in self.positions(query)]
+
+    def count(self, query) -> int:
+        """Count the number of palmers matching a wildcard **query**."""
+        return len(self.positions(query))
@@ -0,0 +1,101 @@
+import array
+from collections.abc import MutableMapping
+
+from pangolin._jaw_type import JawType
+from pangolin._layout import layout
+
+
+class PalmerMap(MutableMapping):
+    """A dictionary-like mapping whose keys are the teeth of a
+    :class:`JawType`.
+
+    Args:
+        items:
+            Optional initial contents. Either a mapping or an iterable of
+            :py:`(key, value)` pairs.
+        jaw_type:
+            The :class:`JawType` whose :class:`Layout` defines which keys are
+            allowed. The default is a full permanent human mouth.
+        typecode:
+            If given, store values in an :class:`array.array` with this
+            typecode. Otherwise values are stored in a :class:`list` and may be
+            anything.
+
+    Values are stored contiguously with one slot per tooth. Keys may be
+    :class:`Palmer` objects or palmer strings::
+
+        >>> widths = PalmerMap({"UR3": 7.2}, typecode="d")
+        >>> widths[Palmer("UR3")]
+        7.2
+        >>> widths["UR4"] = 6.9
+        >>> widths
+        PalmerMap({'UR3': 7.2, 'UR4': 6.9})
+
+    Looking up a :class:`Palmer` is an arithmetic slot calculation rather than
+    formatting and hashing a string as a :class:`dict` would require.
+    Iteration order is that of the :class:`Layout` rather than insertion
+    order.
+
+    """
+
+    def __init__(self, items=(), jaw_type=JawType(), typecode=None):
+        self._layout = layout(jaw_type)
+        if typecode is None:
+            self._data = [None] * len(self._layout)
+        else:
+            self._data = array.array(typecode, bytes(
+                array.array(typecode).itemsize * len(self._layout)))
+        # What a vacant slot contains.
+        self._blank = self._data[0] if self._data else None
+        self._present = 0
+        self.update(items)
+
+    @property
+    def jaw_type(self) -> JawType:
+        return self._layout.jaw_type
+
+    @property
+    def data(self):
+        """The underlying :class:`list` or :class:`array.array`, indexed by
+        :meth:`Layout.slot`. Slots of missing keys contain :py:`None` or
+        :py:`0`."""
+        return self._data
+
+    def __getitem__(self, key):
+        slot = self._layout.slot(key)
+        if not self._present >> slot & 1:
+            raise KeyError(key)
+        return self._data[slot]
+
+    def __setitem__(self, key, value):
+        slot = self._layout.slot(key)
+        self._data[slot] = value
+        self._present |= 1 << slot
+
+    def __delitem__(self, key):
+        slot = self._layout.slot(key)
+        if not self._present >> slot & 1:
+            raise KeyError(key)
+        self._present &= ~(1 << slot)
+        self._data[slot] = self._blank
+
+    def __contains__(self, key):
+        try:
+            return bool(self._present >> self._layout.slot(key) & 1)
+        except KeyError:
+            return False
+
+    def __iter__(self):
+        palmers = self._layout.palmers
+        present = self._present
+        for slot in range(present.bit_length()):
+            if present >> slot & 1:
+                yield palmers[slot]
+
+    def __len__(self):
+        return bin(self._present).count("1")
+
+    def __repr__(self):
+        contents = ", ".join(f"'{key}': {repr(value)}"
+                             for (key, value) in self.items())
+        return f"{type(self).__name__}({{{contents}}})"
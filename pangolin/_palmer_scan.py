@@ -0,0 +1,73 @@
+import bisect
+import re
+
+from pangolin._palmer import Palmer
+
+# Palmer.regex minus its optional species prefix. Wrapped in a lookahead so
+# that one pass finds every position at which a palmer could start, even
+# overlapping ones.
+_cores = re.compile(r"(?=([UL*][LR*](?:\d+|[A-Z]|\*)(?:[.]\d)?))")
+
+# What Palmer.regex's species group may consume.
+_runs = re.compile(r"[\w-]+")
+
+
+def finditer(text: str):
+    """A linear time equivalent of :py:`Palmer.regex.finditer(text)`.
+
+    :attr:`Palmer.regex` begins with an optional, greedy :py:`[\\w-]+` species
+    group. Searching text containing long runs of word characters (hashes,
+    base64, IDs) makes the regex engine re-scan the run from every starting
+    position - quadratic time. This instead finds every position where the
+    mandatory part of a palmer matches and, for each run of word characters,
+    the rightmost delimiter which could end a species. The leftmost-first,
+    greedy semantics of the regex are then resolved without backtracking.
+
+    Yields:
+        :ref:`Match objects <match-objects>` with the same spans and groups
+        as :py:`Palmer.regex.finditer(text)` would give. Only their
+        :attr:`~re.Match.pos` and :attr:`~re.Match.endpos` differ.
+
+    """
+    # Where each core (species-less) palmer starts -> where it ends.
+    cores = {match.start(): match.end(1) for match in _cores.finditer(text)}
+    # Delimiters which are followed by a core. Already sorted.
+    delimiters = [i - 1 for i in cores if i and text[i - 1] in "_-"]
+
+    # For every run of [\w-] characters, find the rightmost delimiter which a
+    # species could end at. A species may start anywhere before it in the same
+    # run and the greedy regex will always pick that delimiter.
+    species = []
+    for run in _runs.finditer(text):
+        (start, end) = run.span()
+        i = bisect.bisect_left(delimiters, end) - 1
+        if i >= 0 and delimiters[i] > start:
+            species.append((start, delimiters[i]))
+
+    starts = list(cores)
+    core_index = species_index = 0
+    position = 0
+    while True:
+        while core_index < len(starts) and starts[core_index] < position:
+            core_index += 1
+        while species_index < len(species) \
+                and species[species_index][1] <= position:
+            species_index += 1
+
+        core = starts[core_index] if core_index < len(starts) else None
+        if species_index < len(species):
+            (start, delimiter) = species[species_index]
+            start = max(start, position)
+        else:
+            start = None
+
+        # The regex tries a species before trying without one.
+        if start is not None and (core is None or start <= core):
+            end = cores[delimiter + 1]
+        elif core is not None:
+            (start, end) = (core, cores[core])
+        else:
+            return
+        # With its end pinned, this match can't backtrack much.
+        yield Palmer.regex.match(text, start, end)
+        position = end
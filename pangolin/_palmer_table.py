@@ -0,0 +1,203 @@
+import array
+import importlib
+import math
+
+from pangolin._jaw_type import JawType
+from pangolin._layout import layout
+
+
+def _numpy():
+    """Import NumPy if it's available. Use importlib to prevent PyInstaller
+    thinking pangolin depends on NumPy."""
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:  # pragma: no-numpy
+        return None
+
+
+_GROUPINGS = {
+    "tooth": lambda palmer: palmer,
+    "quadrant": lambda palmer: palmer.quadrant,
+    "kind": lambda palmer: palmer.kind,
+    "mirror": lambda palmer: palmer.with_(side="*"),
+}
+
+_REDUCTIONS = ("mean", "sum", "min", "max", "count")
+
+
+class PalmerTable(object):
+    """Per-tooth metrics for many patients stored in columns.
+
+    Args:
+        patients:
+            The patient identifiers. These may be any hashable objects.
+        jaw_type:
+            The :class:`JawType` whose :class:`Layout` defines the tooth slots
+            of each patient. The default is a full permanent human mouth.
+        use_numpy:
+            Store columns as NumPy arrays and use vectorised reductions.
+            Defaults to using NumPy if it is installed.
+
+    Each metric is one contiguous column of floats with one row per
+    :py:`(patient, tooth)` combination in patient-major order. Missing values
+    are NaN and are ignored by all reductions. ::
+
+        table = PalmerTable(["bob", "alice"])
+        table.set("width", "bob", "UR3", 7.2)
+        table.set("width", "bob", "UL3", 7.0)
+        table.set("width", "alice", "LR3", 6.8)
+
+        table.group_by("width", "tooth")     # {Palmer('UL3'): 7.0, ...}
+        table.group_by("width", "mirror")    # {Palmer('U*3'): 7.1, ...}
+        table.group_by("width", "quadrant", "count")   # {1: 1, 2: 1, 4: 1}
+
+    """
+
+    def __init__(self, patients, jaw_type=JawType(), use_numpy=None):
+        self.patients = list(patients)
+        self._rows = {patient: i for (i, patient) in enumerate(self.patients)}
+        self._layout = layout(jaw_type)
+        self._numpy = _numpy() if use_numpy is not False else None
+        if use_numpy and self._numpy is None:  # pragma: no-numpy
+            raise ImportError("use_numpy=True requires NumPy.")
+        self._columns = {}
+
+    @property
+    def jaw_type(self) -> JawType:
+        return self._layout.jaw_type
+
+    def __len__(self):
+        """The number of rows - one per :py:`(patient, tooth)`."""
+        return len(self.patients) * len(self._layout)
+
+    @property
+    def metrics(self) -> list:
+        """The names of all columns."""
+        return list(self._columns)
+
+    def column(self, metric):
+        """Get a column, creating it (filled with NaNs) if it doesn't exist.
+
+        Returns:
+            Either a NumPy array or an :py:`array.array("d")`. Either way,
+            it may be written to directly.
+
+        """
+        try:
+            return self._columns[metric]
+        except KeyError:
+            pass
+        if self._numpy:
+            column = self._numpy.full(len(self), math.nan)
+        else:
+            column = array.array("d", [math.nan]) * len(self)
+        return self._columns.setdefault(metric, column)
+
+    def row(self, patient, tooth) -> int:
+        """Get the index of a :py:`(patient, tooth)` in each column."""
+        return self._rows[patient] * len(self._layout) \
+               + self._layout.slot(tooth)
+
+    def set(self, metric, patient, tooth, value):
+        """Set the value of one **metric** for one **tooth** of one
+        **patient**."""
+        self.column(metric)[self.row(patient, tooth)] = value
+
+    def get(self, metric, patient, tooth) -> float:
+        """Get the value of one **metric** for one **tooth** of one
+        **patient**. Missing values are NaN."""
+        return float(self._columns[metric][self.row(patient, tooth)])
+
+    def group_by(self, metric, by="tooth", reduce="mean") -> dict:
+        """Aggregate a metric over all patients, grouping teeth together.
+
+        Args:
+            metric:
+                The name of the column to aggregate.
+            by:
+                How to group teeth. One of :py:`'tooth'` (no grouping),
+                :py:`'quadrant'` (see :attr:`Palmer.quadrant`), :py:`'kind'`
+                (see :attr:`Palmer.kind`), :py:`'mirror'` (put each tooth with
+                its contralateral counterpart, keyed by palmers with a wildcard
+                :attr:`~Palmer.side`) or a function mapping a :class:`Palmer`
+                to a group key.
+            reduce:
+                One of :py:`'mean'`, :py:`'sum'`, :py:`'min'`, :py:`'max'` or
+                :py:`'count'`.
+        Returns:
+            A :class:`dict` mapping each group key to the reduced value.
+            Groups with no values are omitted.
+
+        """
+        if reduce not in _REDUCTIONS:
+            raise ValueError(f"Invalid reduce {repr(reduce)}. Must be one of "
+                             f"{_REDUCTIONS}.")
+        keys, groups = self._groups(by)
+        column = self._columns[metric]
+        if self._numpy:
+            results = self._reduce_numpy(column, groups, len(keys), reduce)
+        else:
+            results = self._reduce_python(column, groups, len(keys), reduce)
+        return {
+            keys[i]: result
+            for (i, (count, result)) in enumerate(results) if count
+        }
+
+    def _groups(self, by):
+        """Assign every tooth slot to a group. Returns the list of group keys
+        and each slot's index into them."""
+        function = _GROUPINGS.get(by, by)
+        if not callable(function):
+            raise ValueError(f"Invalid by {repr(by)}. Must be a function or "
+                             f"one of {tuple(_GROUPINGS)}.")
+        keys = {}
+        groups = [
+            keys.setdefault(function(palmer), len(keys))
+            for palmer in self._layout.palmers
+        ]
+        return list(keys), groups
+
+    def _reduce_python(self, column, groups, n_groups, reduce):
+        counts = [0] * n_groups
+        if reduce in ("min", "max"):
+            values = [None] * n_groups
+            better = float.__lt__ if reduce == "min" else float.__gt__
+        else:
+            values = [0.] * n_groups
+
+        slots = len(groups)
+        for (i, value) in enumerate(column):
+            if value != value:  # NaN
+                continue
+            group = groups[i % slots]
+            counts[group] += 1
+            if reduce in ("min", "max"):
+                if values[group] is None or better(value, values[group]):
+                    values[group] = value
+            else:
+                values[group] += value
+
+        if reduce == "count":
+            values = counts
+        elif reduce == "mean":
+            values = [i / (j or 1) for (i, j) in zip(values, counts)]
+        return zip(counts, values)
+
+    def _reduce_numpy(self, column, groups, n_groups, reduce):
+        np = self._numpy
+        groups = np.tile(np.asarray(groups, np.intp), len(self.patients))
+        valid = ~np.isnan(column)
+        groups, column = groups[valid], column[valid]
+        counts = np.bincount(groups, minlength=n_groups)
+
+        if reduce in ("min", "max"):
+            values = np.full(n_groups, np.inf if reduce == "min" else -np.inf)
+            ufunc = np.minimum if reduce == "min" else np.maximum
+            ufunc.at(values, groups, column)
+        else:
+            values = np.bincount(groups, column, minlength=n_groups)
+        if reduce == "count":
+            values = counts
+        elif reduce == "mean":
+            values = values / np.maximum(counts, 1)
+        return zip(counts.tolist(), values.tolist())
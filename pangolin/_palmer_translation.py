@@ -0,0 +1,193 @@
+from collections.abc import Mapping
+
+from pangolin._jaw_type import JawType
+from pangolin._layout import layout
+from pangolin._palmer import Palmer
+from pangolin._palmer_table import _numpy
+
+_HUMAN = (JawType(), JawType(primary=True))
+
+
+def _from_mapping(mapping):
+    def translation(palmer):
+        # Palmers hash and compare equal to their strings so this works for
+        # mappings keyed by either.
+        return mapping.get(palmer, palmer)
+
+    return translation
+
+
+class PalmerTranslation(object):
+    """A precomputed relabelling of every tooth in one or more
+    :class:`JawType`\\ s.
+
+    Args:
+        translation:
+            Either a function which takes a :class:`Palmer` and returns its
+            replacement or a mapping of teeth to their replacements. Teeth
+            missing from a mapping are left unchanged. A replacement of
+            :py:`None` means that the tooth has no equivalent. Replacements
+            may be :class:`Palmer` objects or palmer strings.
+        jaw_types:
+            The :class:`JawType`\\ s whose teeth (see :func:`layout`) make up
+            the finite set of teeth which may be translated. The default is
+            every permanent and primary human tooth. Every replacement must
+            also be in this set.
+
+    **translation** is called once per tooth, here and now, and the results
+    stored as a table of indices into :attr:`palmers`. Applying the
+    translation to a whole dataset is then just a table lookup per item::
+
+        >>> mirror = PalmerTranslation(lambda palmer: -palmer)
+        >>> mirror.apply(["UR1", Palmer("LLE")])
+        [Palmer('UL1'), Palmer('LRE')]
+        >>> renumber = PalmerTranslation({"UR8": "UR7", "UR7": None})
+        >>> mirror.then(renumber).apply_strings(["UL8", "UL7", "UL6"])
+        ['UR7', None, 'UR6']
+
+    The common translations :meth:`mirror` and :meth:`successor` have
+    shortcut constructors.
+
+    """
+
+    def __init__(self, translation, jaw_types=_HUMAN):
+        palmers = []
+        for jaw_type in jaw_types:
+            palmers += layout(jaw_type).palmers
+        self.palmers = tuple(palmers)
+        self._strings = tuple(map(str, palmers))
+        self._slots = {string: i for (i, string) in enumerate(self._strings)}
+        self._codes = tuple(palmer._code for palmer in palmers)
+        self._code_slots = {code: i for (i, code) in enumerate(self._codes)}
+
+        if isinstance(translation, Mapping):
+            translation = _from_mapping(translation)
+        table = []
+        for palmer in palmers:
+            target = translation(palmer)
+            if target is None:
+                table.append(None)
+                continue
+            try:
+                table.append(self._slot(target))
+            except ValueError:
+                raise ValueError(f"'{palmer}' translates to '{target}' which "
+                                 f"is not a tooth of any of "
+                                 f"{tuple(jaw_types)}.") from None
+        self._table = table
+
+    def _slot(self, palmer):
+        """Get the index of a Palmer or palmer string in :attr:`palmers`."""
+        try:
+            if isinstance(palmer, Palmer):
+                return self._code_slots[palmer._code]
+            return self._slots[palmer]
+        except (KeyError, TypeError):
+            pass
+        try:
+            return self._code_slots[Palmer(palmer)._code]
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"'{palmer}' is not a tooth which this "
+                             f"translation covers.") from None
+
+    @classmethod
+    def _from_table(cls, template, table):
+        self = cls.__new__(cls)
+        self.__dict__.update(template.__dict__)
+        self._table = table
+        return self
+
+    @classmethod
+    def mirror(cls, jaw_types=_HUMAN) -> 'PalmerTranslation':
+        """Swap left and right sides. i.e. :py:`-palmer`."""
+        return cls(lambda palmer: -palmer, jaw_types)
+
+    @classmethod
+    def successor(cls, jaw_types=_HUMAN) -> 'PalmerTranslation':
+        """Map each primary tooth to the permanent tooth which replaces it.
+        Permanent teeth are unchanged. ::
+
+            >>> PalmerTranslation.successor().apply(["URC", "LLE", "UR8"])
+            [Palmer('UR3'), Palmer('LL5'), Palmer('UR8')]
+
+        """
+        return cls(lambda palmer: palmer.with_(primary=False), jaw_types)
+
+    def then(self, other: 'PalmerTranslation') -> 'PalmerTranslation':
+        """Combine with another translation (covering the same teeth) which is
+        applied after this one. The result is another table so it's no slower
+        to apply than either of its constituents."""
+        if self._codes != other._codes:
+            raise ValueError("Only translations which cover the same teeth "
+                             "can be combined.")
+        table = [None if i is None else other._table[i] for i in self._table]
+        return self._from_table(self, table)
+
+    def __call__(self, palmer):
+        """Translate a single :class:`Palmer` or palmer string to a
+        :class:`Palmer` (or :py:`None`)."""
+        i = self._table[self._slot(palmer)]
+        return None if i is None else self.palmers[i]
+
+    def apply(self, palmers) -> list:
+        """Translate an iterable of :class:`Palmer` objects or palmer strings.
+
+        Returns:
+            A list of :class:`Palmer` objects or :py:`None`\\ s.
+        Raises:
+            ValueError: If an input tooth isn't in :attr:`palmers`.
+
+        """
+        table = self._table
+        teeth = self.palmers
+        slot = self._slot
+        out = []
+        for palmer in palmers:
+            i = table[slot(palmer)]
+            out.append(None if i is None else teeth[i])
+        return out
+
+    def apply_strings(self, strings) -> list:
+        """Like :meth:`apply` but returns normalised palmer strings (or
+        :py:`None`\\ s) instead of :class:`Palmer` objects."""
+        table = self._table
+        teeth = self._strings
+        slot = self._slot
+        out = []
+        for string in strings:
+            i = table[slot(string)]
+            out.append(None if i is None else teeth[i])
+        return out
+
+    def apply_codes(self, codes):
+        """Translate the packed codes given by
+        :func:`parse_array(..., packed=True) <parse_array>`.
+
+        Args:
+            codes:
+                Either an iterable of integers or a NumPy integer array.
+        Returns:
+            The translated codes in the same form: a list or an array of the
+            same shape. Teeth without an equivalent and invalid inputs (codes
+            of :py:`-1`) become :py:`-1`.
+        Raises:
+            ValueError: If a code isn't that of a tooth in :attr:`palmers`.
+
+        """
+        targets = {-1: -1}
+        for (code, i) in zip(self._codes, self._table):
+            targets[code] = -1 if i is None else self._codes[i]
+
+        if hasattr(codes, "__array__"):  # pragma: needs-numpy
+            np = _numpy()
+            codes = np.asarray(codes)
+            (unique, inverse) = np.unique(codes, return_inverse=True)
+            unique = self.apply_codes(unique.tolist())
+            return np.array(unique, np.int64)[inverse.reshape(-1)] \
+                .reshape(codes.shape)
+
+        try:
+            return [targets[code] for code in codes]
+        except KeyError as ex:
+            raise ValueError(f"{ex.args[0]} is not the code of a tooth which "
+                             f"this translation covers.") from None
@@ -0,0 +1,119 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from pangolin._palmer import Palmer
+from pangolin._palmer_scan import finditer
+
+
+def _shard(file, start, end):
+    """Read the whole lines whose first byte lies in ``[start, end)``.
+
+    Returns:
+        The byte offset of the first line and the raw bytes.
+
+    """
+    if start:
+        # Skip the remainder of a line which began in the previous shard.
+        file.seek(start - 1)
+        file.readline()
+        start = file.tell()
+    if start >= end:
+        return start, b""
+    file.seek(start)
+    data = file.read(end - start)
+    if data and not data.endswith(b"\n"):
+        # Finish the last line, even though it spills into the next shard.
+        data += file.readline()
+    return start, data
+
+
+def _scan_range(path, start, end, encoding="utf-8"):
+    """Find all palmers in one shard of a file.
+
+    Returns:
+        A list of :py:`(offset, palmer)` pairs where **offset** is in bytes
+        from the start of the file.
+
+    """
+    with open(path, "rb") as file:
+        offset, data = _shard(file, start, end)
+
+    # surrogateescape makes undecodable bytes round trip so that byte offsets
+    # can be recovered by re-encoding.
+    text = data.decode(encoding, "surrogateescape")
+    ascii = len(text) == len(data)
+    out = []
+    # Notes repeat the same few palmers endlessly. Parse each only once.
+    palmers = {}
+    (char, byte) = (0, offset)
+    for match in finditer(text):
+        if ascii:
+            byte = offset + match.start()
+        else:
+            byte += len(text[char:match.start()].encode(encoding,
+                                                       "surrogateescape"))
+            char = match.start()
+        try:
+            palmer = palmers[match.group()]
+        except KeyError:
+            palmer = palmers.setdefault(match.group(), Palmer(match))
+        out.append((byte, palmer))
+    return out
+
+
+def scan_file(path, workers=None, shard_size=1 << 26, encoding="utf-8"):
+    """Find every palmer in one (potentially enormous) text file using
+    multiple processes.
+
+    Args:
+        path:
+            The file to read.
+        workers:
+            The number of processes to use. Defaults to
+            :func:`os.cpu_count`. Use :py:`1` to run without spawning any
+            processes.
+        shard_size:
+            The approximate number of bytes each process reads at a time.
+        encoding:
+            The file's encoding. It must encode newlines as :py:`b"\\n"`
+            and never use that byte for anything else (e.g. UTF-8, ASCII,
+            Latin-1 but not UTF-16).
+    Yields:
+        :py:`(offset, palmer)` pairs in file order. **offset** is the
+        position in bytes of the palmer from the start of the file.
+
+    The file is split into byte ranges of **shard_size**. A line belongs to the
+    range containing its first byte, so no palmer is ever split between two
+    ranges (palmers can't contain newlines). Each range is scanned with
+    :meth:`Palmer.finditer` by a separate process and the results are yielded
+    in order as they become available. At most two ranges per process are
+    queued or held in memory at once. ::
+
+        for (offset, palmer) in scan_file("notes-2021.txt"):
+            ...
+
+    """
+    size = os.path.getsize(path)
+    starts = range(0, size, shard_size)
+    ends = [min(start + shard_size, size) for start in starts]
+    args = ([path] * len(starts), starts, ends, [encoding] * len(starts))
+
+    if workers == 1:
+        results = map(_scan_range, *args)
+        for result in results:
+            yield from result
+        return
+
+    # pool.map() would submit every shard at once and hold every result until
+    # it's consumed. Keep only a couple of shards per worker in flight so that
+    # memory use doesn't grow with the file size.
+    window = 2 * (workers or os.cpu_count() or 1)
+    pending = deque()
+    with ProcessPoolExecutor(workers) as pool:
+        for shard in zip(*args):
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+            pending.append(pool.submit(_scan_range, *shard))
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,182 @@
+import os
+import sqlite3
+import threading
+
+from pangolin._arch_type_parser import (ParseArchType, AmbiguousArchType,
+                                        _substitute)
+
+
+class ScanIndex(object):
+    """An incremental, on-disk index of scan files by arch type.
+
+    Args:
+        path:
+            The database file to store the index in. It is created if it
+            doesn't exist.
+
+    Each indexed file is stored with its :func:`arch_type` (or :py:`None` if
+    its name doesn't contain one) and its *stem* -- the filename without
+    its suffix or arch type specifier as given by
+    :func:`substitute_arch_type`. The stem is typically a patient or case
+    identifier.
+
+    ::
+
+        with ScanIndex("scans.sqlite") as index:
+            index.update("/data/scans", suffixes=(".stl", ".ply"))
+            uppers = index.find(arch_type="U", stem="patient_123")
+
+    Re-running :meth:`update` only re-parses files that are new or whose
+    modification time or size have changed since the last update.
+
+    An index may be shared between threads. Each database query or write is
+    done under a lock. Walking and parsing files are not.
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, "
+                "directory TEXT, mtime INTEGER, size INTEGER, arch_type TEXT, "
+                "stem TEXT)")
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS stems ON files (stem)")
+
+    def update(self, root, suffixes=None) -> int:
+        """Add, refresh or remove every file inside a directory.
+
+        Args:
+            root:
+                The top level directory to walk recursively.
+            suffixes:
+                Only index files ending with one of these (case insensitive)
+                suffixes. Defaults to all files.
+        Returns:
+            The number of files which had to be (re)parsed.
+
+        Files previously indexed under **root** which no longer exist are
+        removed from the index. Indexed files which still exist but don't
+        match **suffixes** are left as they are.
+
+        """
+        root = os.path.abspath(root)
+        if suffixes is not None:
+            suffixes = tuple(i.lower() for i in suffixes)
+        # Every path starting with `prefix` sorts between it and `end` so the
+        # primary key's index gives just this directory's rows.
+        prefix = os.path.join(root, "")
+        end = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        with self._lock:
+            known = {
+                path: (mtime, size)
+                for (path, mtime, size) in self._connection.execute(
+                    "SELECT path, mtime, size FROM files "
+                    "WHERE path >= ? AND path < ?", (prefix, end))
+            }
+
+        changed = []
+        for entry in _walk(root):
+            # Whatever is left in `known` after the walk no longer exists.
+            previous = known.pop(entry.path, None)
+            if suffixes is not None \
+                    and not entry.name.lower().endswith(suffixes):
+                continue
+            stat = entry.stat()
+            key = (stat.st_mtime_ns, stat.st_size)
+            if previous == key:
+                continue
+            changed.append((entry.path, os.path.dirname(entry.path)) + key +
+                           _classify(entry.name))
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                changed)
+            self._connection.executemany("DELETE FROM files WHERE path = ?",
+                                         ((i,) for i in known))
+        return len(changed)
+
+    def _query(self, query, arguments=()):
+        with self._lock:
+            return self._connection.execute(query, arguments).fetchall()
+
+    def find(self, arch_type=None, stem=None) -> list:
+        """List the paths of indexed files, optionally filtered by
+        **arch_type** and/or **stem**."""
+        query = "SELECT path FROM files WHERE 1"
+        arguments = []
+        if arch_type is not None:
+            query += " AND arch_type = ?"
+            arguments.append(arch_type)
+        if stem is not None:
+            query += " AND stem = ?"
+            arguments.append(stem)
+        query += " ORDER BY path"
+        return [i for (i,) in self._query(query, arguments)]
+
+    def pairs(self) -> list:
+        """Match up upper and lower files belonging to the same patient.
+
+        Returns:
+            A list of :py:`(stem, upper_path, lower_path)` tuples. Files with
+            matching stems are only paired if they are in the same directory.
+            If a file has no counterpart then the counterpart is :py:`None`.
+
+        """
+        out = []
+        last = None
+        for (directory, stem, arch_type, path) in self._query(
+                "SELECT directory, stem, arch_type, path FROM files "
+                "WHERE arch_type IS NOT NULL "
+                "ORDER BY directory, stem, path"):
+            if (directory, stem) != last:
+                out.append([stem, None, None])
+                last = (directory, stem)
+            slot = 1 if arch_type == "U" else 2
+            if out[-1][slot] is None:
+                out[-1][slot] = path
+        return [tuple(i) for i in out]
+
+    def __len__(self):
+        return self._query("SELECT COUNT(*) FROM files")[0][0]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def _walk(root):
+    """Recursively yield every file inside **root** as :class:`os.DirEntry`
+    objects, reusing the file attributes which :func:`os.scandir` gives for
+    free."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
+def _classify(name):
+    """Get the :py:`(arch_type, stem)` from a filename."""
+    stem = os.path.splitext(name)[0]
+    try:
+        parser = ParseArchType(stem)
+    except AmbiguousArchType:
+        return None, stem
+    stem = _substitute(parser, "", r"[ \-_]")
+    # Unlike substitute_arch_type(), don't keep a delimiter left dangling from
+    # a specifier at either end of the filename.
+    return parser.arch_type, stem.strip(" -_")
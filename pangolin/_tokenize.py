@@ -0,0 +1,92 @@
+import re
+from collections import namedtuple
+
+from pangolin._palmer import Palmer, unpack_groups
+
+
+class Token(namedtuple("Token", ["palmer", "notation", "span"])):
+    """A tooth reference found by :func:`tokenize`.
+
+    Attributes:
+        palmer:
+            The normalised :class:`Palmer`.
+        notation:
+            Which notation the reference was written in. One of
+            :py:`'palmer'`, :py:`'fdi'` or :py:`'universal'`.
+        span:
+            The :py:`(start, end)` of the reference in the original text.
+
+    """
+
+    @property
+    def start(self):
+        return self.span[0]
+
+    @property
+    def end(self):
+        return self.span[1]
+
+
+_NOTATIONS = {
+    # Universal numbers are only recognised with a '#' prefix. Otherwise they'd
+    # be indistinguishable from FDI numbers and any other number.
+    "universal": r"\#(?P<universal>[1-9]|[12][0-9]|3[0-2]|[A-T])(?!\w|\.\d)",
+    "palmer": "(?P<palmer>" + Palmer.regex.pattern + ")",
+    "fdi": r"(?<![\w.#])(?P<fdi>[1-4][1-8]|[5-8][1-5])(?!\w|\.\d)",
+}
+
+_patterns = {}
+
+
+def _pattern(notations):
+    """Compile (and cache) one alternation of the given notations' regexes."""
+    try:
+        return _patterns[notations]
+    except KeyError:
+        pass
+    for notation in notations:
+        if notation not in _NOTATIONS:
+            raise ValueError(f"Unknown notation {repr(notation)}. Must be any "
+                             f"of {tuple(_NOTATIONS)}.")
+    pattern = re.compile(
+        "|".join(_NOTATIONS[i] for i in _NOTATIONS if i in notations),
+        re.VERBOSE)
+    return _patterns.setdefault(notations, pattern)
+
+
+def tokenize(text, notations=("palmer", "fdi", "universal")):
+    """Find every tooth reference in a piece of text in one pass, regardless of
+    which notation it's written in.
+
+    Args:
+        text:
+            The text to search.
+        notations:
+            Which notations to look for. Any of :py:`'palmer'`, :py:`'fdi'`
+            and :py:`'universal'`.
+    Returns:
+        A generator of :class:`Token` objects.
+
+    ::
+
+        >>> text = "Extract UR3 and 24. Watch #30."
+        >>> [(str(i.palmer), i.notation) for i in tokenize(text)]
+        [('UR3', 'palmer'), ('UL4', 'fdi'), ('LR6', 'universal')]
+
+    FDI numbers are any standalone two digit numbers which form valid FDI tooth
+    numbers. Universal numbers must be prefixed with a :py:`#`. Where more
+    than one notation could apply, Universal takes precedence over Palmer
+    which takes precedence over FDI.
+
+    """
+    pattern = _pattern(frozenset(notations))
+    palmer = pattern.groupindex.get("palmer")
+    for match in pattern.finditer(text):
+        notation = match.lastgroup
+        if notation == "palmer":
+            tooth = Palmer(*unpack_groups(match.groups()[palmer:palmer + 5]))
+        elif notation == "fdi":
+            tooth = Palmer.from_FDI(match.group("fdi"))
+        else:
+            tooth = Palmer.from_universal(match.group("universal"))
+        yield Token(tooth, notation, match.span())
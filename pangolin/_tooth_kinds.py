@@ -0,0 +1,91 @@
+from pangolin._jaw_type import JawType
+
+# tooth_kinds() results and, via _memo(), anything else derived from
+# TOOTH_KINDS. Replaced with fresh dicts whenever TOOTH_KINDS is modified.
+# Replacing (after the modification) rather than clearing means that a
+# concurrent call which read the old TOOTH_KINDS can only ever write its stale
+# result into a discarded dict. No locks required.
+_cache = {}
+_memos = {}
+
+
+def _memo(name):
+    """Get the memo dict called **name** for results derived from
+    TOOTH_KINDS. Fetch it before reading TOOTH_KINDS and don't hold onto it:
+    it's discarded whenever TOOTH_KINDS is modified."""
+    memos = _memos
+    try:
+        return memos[name]
+    except KeyError:
+        return memos.setdefault(name, {})
+
+
+def _invalidating(method):
+    def wrapped(self, *args, **kwargs):
+        global _cache, _memos
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _cache = {}
+            _memos = {}
+
+    wrapped.__name__ = method.__name__
+    return wrapped
+
+
+class _ToothKinds(dict):
+    """A :class:`dict` which empties tooth_kinds()'s cache when modified."""
+    __setitem__ = _invalidating(dict.__setitem__)
+    __delitem__ = _invalidating(dict.__delitem__)
+    clear = _invalidating(dict.clear)
+    pop = _invalidating(dict.pop)
+    popitem = _invalidating(dict.popitem)
+    setdefault = _invalidating(dict.setdefault)
+    update = _invalidating(dict.update)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
+TOOTH_KINDS = _ToothKinds({
+    JawType(): "IICPPMMM",
+    JawType(primary=True): "IICMM",
+    JawType(arch_type="U", species="sheep"): "PPPMMM",
+    JawType(arch_type="L", species="sheep"): "IIIIPPPMMM",
+    JawType(species="pangolin", primary="*"): "",
+})
+
+
+def tooth_kinds(jaw_type=JawType()) -> str:
+    """Get dental formula for a given :class:`JawType`.
+
+    Args:
+        jaw_type:
+            The type of arch.
+    Returns:
+        The tooth types in one quadrant.
+
+    Examples:
+
+         The following tells us that each quadrant of a baby's mouth contains
+         two incisors, one canine and two molars::
+
+            >>> tooth_kinds(JawType(primary=True))
+            'IICMM'
+
+    """
+    cache = _cache
+    try:
+        return cache[jaw_type]
+    except KeyError:
+        pass
+    kinds = TOOTH_KINDS.get(jaw_type)
+    if kinds is not None:
+        return cache.setdefault(jaw_type, kinds)
+    # Copy so that another thread modifying TOOTH_KINDS can't break iteration.
+    for (jaw_type_, kinds) in list(TOOTH_KINDS.items()):
+        if jaw_type_.match(jaw_type, strict=True):
+            return cache.setdefault(jaw_type, kinds)
+    raise ValueError(f"No tooth kinds data is available for {repr(jaw_type)}. "
+                     "You can add it to `pangolin.TOOTH_KINDS`.")
@@ -0,0 +1,146 @@
+from pangolin._tooth_kinds import tooth_kinds
+from pangolin._jaw_type import _jaw_type_code
+from pangolin._palmer import Palmer
+
+
+def _max_index(jaw_type):
+    """The highest valid index for a jaw type or None if unknown.
+
+    Wildcard arch types and primaries accept any index which is valid for at
+    least one of their concrete counterparts. A wildcard species accepts any
+    index at all.
+    """
+    if jaw_type.species == "*":
+        return float("inf")
+    try:
+        return len(tooth_kinds(jaw_type))
+    except ValueError:
+        pass
+    lengths = []
+    for arch_type in "UL" if jaw_type.arch_type == "*" \
+            else jaw_type.arch_type:
+        for primary in (False, True) if jaw_type.primary == "*" \
+                else (jaw_type.primary,):
+            try:
+                lengths.append(
+                    len(tooth_kinds(jaw_type.with_(arch_type=arch_type,
+                                                   primary=primary))))
+            except ValueError:
+                pass
+    return max(lengths, default=None)
+
+
+class _Validator(object):
+    """Check palmers, remembering the verdict for each distinct input.
+
+    The max-index table is keyed by a palmer's packed jaw type bits so that
+    looking up the limit for a palmer costs one dict lookup. It's rebuilt for
+    every call so that changes to :data:`TOOTH_KINDS` are always respected.
+    """
+
+    def __init__(self):
+        self._max_indices = {}
+        self._verdicts = {}
+
+    def __call__(self, palmer):
+        """Return the reason **palmer** is invalid or None if it's valid."""
+        if isinstance(palmer, str):
+            try:
+                return self._verdicts[palmer]
+            except KeyError:
+                pass
+            return self._verdicts.setdefault(palmer, self._parse(palmer))
+        return self._parse(palmer)
+
+    def _parse(self, palmer):
+        try:
+            if not isinstance(palmer, Palmer):
+                palmer = Palmer(palmer)
+            code = palmer._code
+        except ValueError as ex:
+            return str(ex)
+        try:
+            return self._verdicts[code]
+        except KeyError:
+            pass
+        return self._verdicts.setdefault(code, self._check(palmer))
+
+    def _check(self, palmer):
+        index = palmer.index
+        if index == "*":
+            if palmer.sub_index is not None:
+                return f"'{palmer}' has a sub_index but a wildcard index."
+            return None
+        if index < 1:
+            return f"'{palmer}' has index {index}. Indices start at 1."
+
+        jaw_type = _jaw_type_code(palmer._code)
+        try:
+            max_index = self._max_indices[jaw_type]
+        except KeyError:
+            max_index = self._max_indices.setdefault(
+                jaw_type, _max_index(palmer.jaw_type))
+        if max_index is None:
+            return (f"'{palmer}' can't be checked. No tooth kinds data is "
+                    f"available for {repr(palmer.jaw_type)}.")
+        if index > max_index:
+            return (f"'{palmer}' has index {index} but "
+                    f"{repr(palmer.jaw_type)} only has {max_index} teeth per "
+                    f"quadrant.")
+        return None
+
+
+def validate(palmers) -> list:
+    """Find palmers which parse but can't exist.
+
+    Args:
+        palmers:
+            An iterable of :class:`Palmer` objects, palmer strings or anything
+            else accepted by :meth:`Palmer.__init__`.
+    Returns:
+        A list of :py:`(position, reason)` pairs, one for each invalid palmer.
+
+    A palmer is invalid if:
+
+    - It can't be parsed at all.
+    - Its :attr:`~Palmer.index` is outside the range given by
+      :func:`tooth_kinds` for its :attr:`~Palmer.jaw_type`. This also catches
+      primary teeth lettered beyond the last primary tooth, e.g. **ULF**.
+    - It has a :attr:`~Palmer.sub_index` but a wildcard
+      :attr:`~Palmer.index`.
+    - There is no :data:`TOOTH_KINDS` data for its jaw type.
+
+    ::
+
+        >>> for (position, reason) in validate(["UR8", "UR*.1", "cat"]):
+        ...     print(position, reason)
+        1 'UR*.1' has a sub_index but a wildcard index.
+        2 Could not parse the palmer 'cat'.
+
+    Each distinct input is only checked once so, for the typical case of
+    millions of rows containing a few hundred unique palmers, this is little
+    more than a dict lookup per row. Use :func:`valid_mask` to get a boolean
+    mask instead.
+
+    """
+    validator = _Validator()
+    out = []
+    for (i, palmer) in enumerate(palmers):
+        reason = validator(palmer)
+        if reason is not None:
+            out.append((i, reason))
+    return out
+
+
+def valid_mask(palmers) -> list:
+    """Check many palmers at once, returning a list of booleans.
+
+    This applies the same checks as :func:`validate`. An element of the output
+    is :py:`True` if the palmer at the same position is valid. ::
+
+        >>> valid_mask(["UR8", "UR9", "ULF", "ULE"])
+        [True, False, False, True]
+
+    """
+    validator = _Validator()
+    return [validator(palmer) is None for palmer in palmers]
@@ -0,0 +1,172 @@
+"""
+JSON helpers for data keyed by :class:`~pangolin.Palmer`.
+
+The standard library's :mod:`json` only accepts string dictionary keys and
+gives back plain strings when decoding. The functions here convert palmer
+keys to and from strings with caching so that large per-tooth payloads don't
+pay for a :class:`str` or a full parse on every key.
+
+Decoding can't tell a palmer key from an ordinary string which happens to look
+like one (e.g. :py:`"URL"`) so parsing keys into palmers is opt-in. Pass
+:py:`palmer_keys=True` to :func:`loads` or :func:`load` or use
+:func:`object_pairs_hook` only for data known to be keyed by palmers.
+"""
+import json
+from collections.abc import Mapping
+
+from pangolin._jaw_type import JawType
+from pangolin._palmer import Palmer
+
+#: The maximum number of entries in each of this module's caches. A cache which
+#: fills up is emptied.
+CACHE_SIZE = 10000
+
+_strings = {}
+_palmers = {}
+
+
+def _palmer_to_str(palmer):
+    """A cached :py:`str(palmer)`."""
+    code = palmer._code
+    try:
+        return _strings[code]
+    except KeyError:
+        pass
+    if len(_strings) >= CACHE_SIZE:
+        _strings.clear()
+    return _strings.setdefault(code, str(palmer))
+
+
+def _str_to_palmer(key):
+    """Parse **key** if it's a palmer's canonical string, otherwise return it
+    unchanged."""
+    try:
+        return _palmers[key]
+    except KeyError:
+        pass
+    match = Palmer.regex.fullmatch(key)
+    palmer = Palmer(match) if match else key
+    if match and str(palmer) != key:
+        # Not something dumps() would have written.
+        palmer = key
+    if len(_palmers) >= CACHE_SIZE:
+        _palmers.clear()
+    return _palmers.setdefault(key, palmer)
+
+
+def _key(key):
+    return _palmer_to_str(key) if isinstance(key, Palmer) else key
+
+
+def _convert(obj):
+    """Recursively replace :class:`Palmer` dictionary keys with strings."""
+    if isinstance(obj, dict):
+        return {_key(key): _convert(value) for (key, value) in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_convert(i) for i in obj]
+    return obj
+
+
+def default(obj):
+    """A :py:`default` for :func:`json.dump` or :class:`json.JSONEncoder`
+    which serialises pangolin's types.
+
+    - :class:`~pangolin.Palmer` values become their canonical strings.
+    - :class:`~pangolin.JawType` values become dictionaries.
+    - Other mappings (e.g. :class:`~pangolin.PalmerMap`) become dictionaries
+      with any :class:`~pangolin.Palmer` keys converted to strings.
+
+    ::
+
+        >>> json.dumps([Palmer("UR3"), JawType("U")], default=default)
+        '["UR3", {"arch_type": "U", "primary": false, "species": "human"}]'
+
+    This only handles values. The standard encoder rejects non-string keys
+    before :py:`default` is consulted so use :func:`dumps` for palmer keyed
+    dictionaries.
+
+    """
+    if isinstance(obj, Palmer):
+        return _palmer_to_str(obj)
+    if isinstance(obj, JawType):
+        return obj.to_dict()
+    if isinstance(obj, Mapping):
+        return _convert(dict(obj.items()))
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON "
+                    f"serializable")
+
+
+def dumps(obj, **kwargs) -> str:
+    """Like :func:`json.dumps` but :class:`~pangolin.Palmer` dictionary keys
+    and values are allowed.
+
+    ::
+
+        >>> dumps({Palmer("UR3"): 7.2, Palmer("orc-LLE"): 6.1})
+        '{"UR3": 7.2, "orc-LLE": 6.1}'
+
+    """
+    kwargs.setdefault("default", default)
+    return json.dumps(_convert(obj), **kwargs)
+
+
+def dump(obj, fp, **kwargs):
+    """Like :func:`json.dump`. See :func:`dumps`."""
+    kwargs.setdefault("default", default)
+    json.dump(_convert(obj), fp, **kwargs)
+
+
+def object_pairs_hook(pairs) -> dict:
+    """An :py:`object_pairs_hook` for :func:`json.loads` or
+    :class:`json.JSONDecoder` which converts palmer keys to
+    :class:`~pangolin.Palmer` objects. Other keys are left as strings.
+
+    ::
+
+        >>> json.loads('{"UR3": 7.2, "name": "bob", "human-UR3": 1}',
+        ...            object_pairs_hook=object_pairs_hook)
+        {Palmer('UR3'): 7.2, 'name': 'bob', 'human-UR3': 1}
+
+    Only keys which are exactly a palmer's canonical string (i.e. what
+    :func:`dumps` writes) are converted so that :func:`dumps` output always
+    round-trips. This still includes non-palmer words which happen to be valid
+    Palmer notation such as :py:`"URL"` (the 12th upper right primary tooth).
+
+    """
+    return {_str_to_palmer(key): value for (key, value) in pairs}
+
+
+def object_hook(obj: dict) -> dict:
+    """An :py:`object_hook` equivalent of :func:`object_pairs_hook`."""
+    return object_pairs_hook(obj.items())
+
+
+def loads(s, *, palmer_keys=False, **kwargs):
+    """Like :func:`json.loads` but with optional palmer keys.
+
+    Args:
+        s:
+            The JSON text.
+        palmer_keys:
+            If true, parse palmer keys into :class:`~pangolin.Palmer` objects
+            using :func:`object_pairs_hook`. Otherwise, keys are left as
+            strings, exactly as :func:`json.loads` would give them.
+
+    ::
+
+        >>> loads('{"UR3": 7.2, "URL": "x"}')
+        {'UR3': 7.2, 'URL': 'x'}
+        >>> loads('{"UR3": 7.2, "URL": "x"}', palmer_keys=True)
+        {Palmer('UR3'): 7.2, Palmer('URL'): 'x'}
+
+    """
+    if palmer_keys:
+        kwargs.setdefault("object_pairs_hook", object_pairs_hook)
+    return json.loads(s, **kwargs)
+
+
+def load(fp, *, palmer_keys=False, **kwargs):
+    """Like :func:`json.load`. See :func:`loads`."""
+    if palmer_keys:
+        kwargs.setdefault("object_pairs_hook", object_pairs_hook)
+    return json.load(fp, **kwargs)
@@ -0,0 +1,69 @@
+import pytest
+
+from pangolin import adjacency, Adjacency, Palmer, JawType
+
+
+def test_single():
+    assert Palmer("UR3").mesial == "UR2"
+    assert Palmer("UR1").mesial == "UL1"
+    assert Palmer("LL1").mesial == "LR1"
+    assert Palmer("LL3").distal == "LL4"
+    assert Palmer("UR8").distal is None
+    assert Palmer("URE").distal is None
+    assert Palmer("URC").mesial == "URB"
+    assert Palmer("UR3").opposing == "LR3"
+    assert Palmer("LLA").opposing == "ULA"
+    assert isinstance(Palmer("UR3").mesial, Palmer)
+    # Repeat lookups are memoised.
+    assert Palmer("UR3").mesial is Palmer("UR3").mesial
+    assert Palmer("UR8").distal is None
+
+    # Sheep have fewer upper teeth than lower ones.
+    assert Palmer("sheep-LR10").opposing is None
+    assert Palmer("sheep-LR6").opposing == "sheep-UR6"
+
+    for invalid in ["U*3", "*R3", "UR*"]:
+        with pytest.raises(ValueError, match="ambiguous"):
+            Palmer(invalid).mesial
+    with pytest.raises(ValueError, match="is not a tooth"):
+        Palmer("UR9").distal
+    with pytest.raises(ValueError, match="is not a tooth"):
+        Palmer("UR3.1").opposing
+
+
+def test_bulk():
+    self = adjacency()
+    assert isinstance(self, Adjacency)
+    assert self is adjacency(JawType("U"))
+    assert self is adjacency(dict(JawType()))
+    assert adjacency(JawType(primary=True)) is not self
+
+    assert self.mesial(["UR1", "UR2", Palmer("LL8")]) == ["UL1", "UR1", "LL7"]
+    assert self.distal(["UR1", "UR8"]) == ["UR2", None]
+    assert self.opposing(["UR1", "LL8"]) == ["LR1", "UL8"]
+    assert self.mirror(["UR1", "LL8"]) == ["UL1", "LR8"]
+
+    teeth = self.layout.palmers
+    assert self.mirror(teeth) == [-i for i in teeth]
+    assert self.mesial(self.distal(teeth[1:4])) == list(teeth[1:4])
+
+    with pytest.raises(ValueError):
+        self.mesial(["URC"])
+
+
+def test_tooth_kinds_modified():
+    """Adjacency tables and memoised neighbours must follow changes to
+    TOOTH_KINDS."""
+    from pangolin import TOOTH_KINDS
+    backup = dict(TOOTH_KINDS)
+    assert Palmer("UR8").distal is None
+    assert len(adjacency().layout) == 32
+    try:
+        TOOTH_KINDS[JawType()] = "IICPPMMMM"
+        assert Palmer("UR8").distal == "UR9"
+        assert Palmer("UR9").opposing == "LR9"
+        assert adjacency().distal(["UL8"]) == ["UL9"]
+    finally:
+        TOOTH_KINDS.clear()
+        TOOTH_KINDS.update(backup)
+    assert Palmer("UR8").distal is None
@@ -72,3 +72,33 @@ def test_short_keyword():
 def test_fuzz(x):
     with contextlib.suppress(AmbiguousArchType):
         arch_type(x)
+
+
+def test_candidates():
+    self = ParseArchType("I am an Upper jaw.")
+    candidates = self.candidates()
+    assert len(candidates) == len(ParseArchType.SPECIFIERS)
+    assert candidates[0].specifier == self.specifier == "upper"
+    assert candidates[0].arch_type == "U"
+    assert (candidates[0].start, candidates[0].end) == (self.start, self.end)
+    assert [i.score for i in candidates] == \
+           sorted((i.score for i in candidates), reverse=True)
+
+    # Ties keep `SPECIFIERS` order.
+    assert [i.specifier for i in self.candidates(4)] == \
+           ["upper", "mandibular", "mandible", "lower"]
+    assert self.candidates(0) == []
+
+
+def test_ambiguous_candidates():
+    with pytest.raises(AmbiguousArchType) as error:
+        arch_type("tom axilla")
+    candidates = error.value.candidates(2)
+    assert [i.specifier for i in candidates] == ["maxillary", "maxilla"]
+    assert "maxillary   |  36 -1" in error.value._show()
+
+    # No words at all means no candidates.
+    with pytest.raises(AmbiguousArchType) as error:
+        arch_type("123")
+    assert error.value.candidates() == []
+    assert error.value._show() == ""
@@ -0,0 +1,214 @@
+import io
+import os
+import pathlib
+
+import pytest
+
+from pangolin import (substitute_arch_type_many, substitute_arch_type_csv,
+                      rename_plan, substitute_arch_type, AmbiguousArchType,
+                      ParseArchType, arch_type_from_path, arch_type_from_paths)
+from pangolin._arch_type_bulk import _PathArchTypes
+
+
+def test_many(monkeypatch):
+    texts = ["The upper jaw", "Bob's manddib", "The upper jaw", "nothing"]
+
+    parsed = []
+    original = ParseArchType._match
+
+    def _match(self):
+        parsed.append(self.input)
+        return original(self)
+
+    monkeypatch.setattr(ParseArchType, "_match", _match)
+
+    out = substitute_arch_type_many(texts, errors="ignore")
+    # Lazy.
+    assert parsed == []
+    assert list(out) == ["The jaw", "Bob's ", "The jaw", "nothing"]
+    # Each unique string was only parsed once.
+    assert parsed == ["The upper jaw", "Bob's manddib", "nothing"]
+
+    replace = lambda arch_type, matched: arch_type
+    assert list(substitute_arch_type_many(texts[:3], replace)) == \
+           [substitute_arch_type(i, replace) for i in texts[:3]]
+
+    with pytest.raises(AmbiguousArchType, match="nothing"):
+        list(substitute_arch_type_many(texts))
+    with pytest.raises(ValueError, match="errors"):
+        substitute_arch_type_many(texts, errors="bob")
+
+    # A tiny cache still gives the right answers.
+    assert list(substitute_arch_type_many(texts, "U", errors="ignore",
+                                          cache_size=1)) \
+           == ["The U jaw", "Bob's U", "The U jaw", "nothing"]
+
+
+def test_csv():
+    source = io.StringIO("id,jaw,notes\n"
+                         "1,maxillary,upper left\n"
+                         "2,mandib,\n"
+                         "\n"
+                         "3,?,lower\n"
+                         "4,upper\n")
+    destination = io.StringIO()
+    replace = lambda arch_type, matched: arch_type
+    substitute_arch_type_csv(source, destination, ["jaw", "notes"], replace)
+    assert destination.getvalue().splitlines() == [
+        "id,jaw,notes",
+        "1,U,U left",
+        "2,L,",
+        "",
+        "3,?,L",
+        "4,U",
+    ]
+
+    # No header. Column indices and custom CSV formatting.
+    source = io.StringIO("1;top\n2;bottom\n")
+    destination = io.StringIO()
+    substitute_arch_type_csv(source, destination, [1], replace, separator=";",
+                             lineterminator="\n")
+    assert destination.getvalue() == "1;U\n2;L\n"
+
+    with pytest.raises(AmbiguousArchType):
+        substitute_arch_type_csv(io.StringIO("1;?\n"), io.StringIO(), [1],
+                                 separator=";", errors="raise")
+
+
+def test_rename_plan(tmp_path):
+    # The extension isn't parsed so patient.lower has no arch type.
+    for name in ["a/1 upper.stl", "a/2 lower.stl", "a/b/3 maxillary.stl",
+                 "a/b/notes.txt", "a/4_U.stl", "a/patient.lower"]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+
+    plan = sorted(rename_plan(tmp_path, lambda arch_type, _: arch_type))
+    root = str(tmp_path)
+    assert plan == [
+        (os.path.join(root, "a", "1 upper.stl"),
+         os.path.join(root, "a", "1 U.stl")),
+        (os.path.join(root, "a", "2 lower.stl"),
+         os.path.join(root, "a", "2 L.stl")),
+        (os.path.join(root, "a", "b", "3 maxillary.stl"),
+         os.path.join(root, "a", "b", "3 U.stl")),
+    ]
+    # Nothing was actually renamed.
+    assert (tmp_path / "a" / "1 upper.stl").exists()
+
+
+def test_arch_type_from_path(monkeypatch):
+    assert arch_type_from_path("/data/cohort7/Upper Jaw/patient_1.stl") == "U"
+    assert arch_type_from_path("/data/upper/patient_123_lower.stl") == "L"
+    assert arch_type_from_path(os.path.join("lower", "x", "y", "z.ply")) == "L"
+    assert arch_type_from_path(pathlib.Path("data/maxilla/1.stl")) == "U"
+    assert arch_type_from_path("data/UpperJaw/1.stl") == "U"
+    assert arch_type_from_path("data/MANDIBLE_scans/1.stl") == "L"
+    assert arch_type_from_path("mandible") == "L"
+    # Extensions are ignored.
+    assert arch_type_from_path("data/mandible/scan.upper", "ignore") == "L"
+
+    for path in ["/data/patient_123.stl", "patient_123.stl", "/", ""]:
+        with pytest.raises(AmbiguousArchType):
+            arch_type_from_path(path)
+        assert arch_type_from_path(path, errors="ignore") is None
+    with pytest.raises(ValueError, match="errors"):
+        arch_type_from_path("upper", errors="bob")
+
+    # Directories aren't fuzzy matched. All of these would be otherwise.
+    for directory in ["Desktop", "laptop", "topics", "supper", "stopwatch",
+                      "flower", "slower", "lowe", "upper and lower"]:
+        path = f"/home/{directory}/scans/1.stl"
+        assert arch_type_from_path(path, errors="ignore") is None
+    # But filenames are.
+    assert arch_type_from_path("/home/scans/maxillry.stl") == "U"
+
+
+def test_arch_type_from_path_bounds():
+    path = "/data/Upper Jaw/patient_1/visit_2/scan.stl"
+    assert arch_type_from_path(path) == "U"
+    assert arch_type_from_path(path, max_depth=3) == "U"
+    assert arch_type_from_path(path, errors="ignore", max_depth=2) is None
+    assert arch_type_from_path(path, errors="ignore", max_depth=0) is None
+    assert arch_type_from_path("/data/x/lower.stl", max_depth=0) == "L"
+
+    assert arch_type_from_path(path, root="/data") == "U"
+    assert arch_type_from_path(path, root="/data/Upper Jaw") == "U"
+    assert arch_type_from_path(path, root="/data/Upper Jaw/") == "U"
+    assert arch_type_from_path(path, root=pathlib.Path("/data/Upper Jaw")) \
+           == "U"
+    assert arch_type_from_path(path, errors="ignore",
+                               root="/data/Upper Jaw/patient_1") is None
+    # A directory which merely starts with the same characters isn't inside.
+    assert arch_type_from_path("/data/Upper Jaw/x/1.stl", errors="ignore",
+                               root="/data/Upper") is None
+    # Paths outside the root only get their filenames checked.
+    assert arch_type_from_path(path, errors="ignore", root="/other") is None
+    assert arch_type_from_path(path.replace("a/", "a//"), root="/data") == "U"
+
+
+def test_arch_type_from_path_caching(monkeypatch):
+    # Repeated directories are only looked at once.
+    looked_at = []
+    original = _PathArchTypes._exact
+
+    def _exact(self, name):
+        looked_at.append(name)
+        return original(self, name)
+
+    monkeypatch.setattr(_PathArchTypes, "_exact", _exact)
+    for i in range(3):
+        assert arch_type_from_path(f"/study/Lower Jaw/{i}/scan.stl") == "L"
+    assert looked_at.count("Lower Jaw") == 1
+    # Parent directories of one with an arch type aren't looked at.
+    assert "study" not in looked_at
+    # The same directory with different bounds reuses the cache.
+    arch_type_from_path("/study/Lower Jaw/0/scan.stl", max_depth=1,
+                        errors="ignore")
+    assert looked_at.count("Lower Jaw") == 1
+
+    # Changing the specifiers invalidates the cache.
+    with pytest.raises(AmbiguousArchType):
+        arch_type_from_path("/study/Oben/1.stl")
+    monkeypatch.setattr(ParseArchType, "SPECIFIERS",
+                        ParseArchType.SPECIFIERS + [("oben", "U")])
+    assert arch_type_from_path("/study/Oben/1.stl") == "U"
+
+
+def test_arch_type_from_paths(tmp_path):
+    for path in ["Upper Jaw/a.stl", "Upper Jaw/b_lower.stl", "mandible/x/c.stl",
+                 "other/d.stl"]:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_bytes(b"")
+
+    expected = {
+        str(tmp_path / "Upper Jaw" / "a.stl"): "U",
+        str(tmp_path / "Upper Jaw" / "b_lower.stl"): "L",
+        str(tmp_path / "mandible" / "x" / "c.stl"): "L",
+        str(tmp_path / "other" / "d.stl"): None,
+    }
+    assert dict(arch_type_from_paths(os.walk(tmp_path))) == expected
+    assert dict(arch_type_from_paths(os.walk(str(tmp_path)),
+                                     cache_size=1)) == expected
+    assert dict(arch_type_from_paths(expected)) == expected
+    assert dict(arch_type_from_paths(map(pathlib.Path, expected))) == expected
+    with os.scandir(tmp_path / "Upper Jaw") as entries:
+        assert sorted(arch_type_from_paths(entries)) == \
+               sorted(list(expected.items())[:2])
+
+    with pytest.raises(AmbiguousArchType, match="d.stl"):
+        list(arch_type_from_paths(os.walk(tmp_path), errors="raise"))
+    with pytest.raises(AmbiguousArchType, match="d.stl"):
+        list(arch_type_from_paths(expected, errors="raise"))
+
+    # Bounded by the directory being walked.
+    below = tmp_path / "lower" / "scans"
+    (below / "x").mkdir(parents=True)
+    (below / "x" / "1.stl").write_bytes(b"")
+    assert dict(arch_type_from_paths(os.walk(below))) == \
+           {str(below / "x" / "1.stl"): "L"}
+    for paths in [os.walk(below), [below / "x" / "1.stl"]]:
+        assert dict(arch_type_from_paths(paths, root=below)) == \
+               {str(below / "x" / "1.stl"): None}
+    assert dict(arch_type_from_paths(os.walk(below), max_depth=2)) == \
+           {str(below / "x" / "1.stl"): None}
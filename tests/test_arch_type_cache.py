@@ -0,0 +1,105 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pangolin import (ArchTypeCache, ParseArchType, AmbiguousArchType,
+                      split_arch_type)
+
+
+def test_round_trip(tmp_path, monkeypatch):
+    path = tmp_path / "cache.sqlite"
+    names = ["patient 1 upper.stl", "patient 1 manddib.stl", "tom axilla"]
+
+    with ArchTypeCache(path, batch_size=2) as cache:
+        assert cache.split_arch_type(names[0]) == split_arch_type(names[0])
+        assert len(cache._pending) == 1
+        assert cache.arch_type(names[1]) == "L"
+        # The batch size was reached so both were written.
+        assert cache._pending == {}
+        with pytest.raises(AmbiguousArchType, match="tom axilla"):
+            cache.arch_type(names[2])
+        # Cached results are reused before they hit the disk.
+        with pytest.raises(AmbiguousArchType):
+            cache.split_arch_type(names[2])
+        assert len(cache) == 3
+
+    # A warm cache should never need to invoke the parser.
+    def explode(self):
+        raise AssertionError(f"{self.input} was parsed")
+
+    monkeypatch.setattr(ParseArchType, "_match", explode)
+    with ArchTypeCache(path) as cache:
+        assert cache.arch_type(names[0]) == "U"
+        assert cache.split_arch_type(names[1]) == \
+               ("patient 1 ", "manddib", ".stl")
+        with pytest.raises(AmbiguousArchType):
+            cache.arch_type(names[2])
+        cache.flush()
+
+
+def test_fingerprint(tmp_path, monkeypatch):
+    """Changing the keywords must invalidate old results."""
+    path = tmp_path / "cache.sqlite"
+    with ArchTypeCache(path) as cache:
+        assert cache.arch_type("top") == "U"
+        assert len(cache) == 1
+
+    monkeypatch.setattr(ParseArchType, "SPECIFIERS", [("top", "L")])
+    with ArchTypeCache(path) as cache:
+        assert len(cache) == 0
+        assert cache.arch_type("top") == "L"
+
+        # Changing them whilst a cache is open must be noticed too.
+        specifiers = ParseArchType.SPECIFIERS
+        ParseArchType.SPECIFIERS = [("top", "U")]
+        assert cache.arch_type("top") == "U"
+        assert len(cache) == 1
+        ParseArchType.SPECIFIERS = specifiers
+        assert cache.arch_type("top") == "L"
+
+        # A result parsed whilst they change can't be attributed to either.
+        init = ParseArchType.__init__
+
+        def racing_init(self, text):
+            ParseArchType.SPECIFIERS = [("top", "U"), ("bottom", "L")]
+            init(self, text)
+
+        monkeypatch.setattr(ParseArchType, "__init__", racing_init)
+        assert cache.arch_type("bottom") == "L"
+        assert cache._pending == {}
+
+
+def test_concurrent_readers(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    writer = ArchTypeCache(path)
+    writer.arch_type("lower")
+    writer.flush()
+    reader = ArchTypeCache(path)
+    assert len(reader) == 1
+    writer.arch_type("upper")
+    writer.close()
+    assert len(reader) == 2
+    reader.close()
+
+
+def test_threads(tmp_path):
+    """One cache shared by many threads."""
+    names = [
+        f"patient {i} {('upper', 'lower', 'x')[i % 3]}" for i in range(300)
+    ]
+
+    def work(offset):
+        out = []
+        for i in range(len(names)):
+            try:
+                out.append(cache.arch_type(names[(i + offset) % len(names)]))
+            except AmbiguousArchType:
+                out.append(None)
+        return out[-offset:] + out[:-offset]
+
+    with ArchTypeCache(tmp_path / "cache.sqlite", batch_size=7) as cache:
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(work, range(1, 300, 37)))
+        assert len(cache) == len(names)
+    assert all(i == results[0] for i in results)
+    assert results[0][:3] == ["U", "L", None]
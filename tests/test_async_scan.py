@@ -0,0 +1,92 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pangolin import Palmer, scan_stream, arch_types_async
+
+TEXT = ("Patient 1: UR3 and UL4.1 extracted. "
+        "Patient 2: orc-LL5, 3f9c-a-b-UR1 é-LRE ULE.\n"
+        + "a very long line " * 5 + "UL8 cat_UR12 LR1 "
+        "3f9c0e7d3f9c0e7d-UL- **1 no space at the end LL1")
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def _collect(iterator):
+    return [i async for i in iterator]
+
+
+async def _iterate(chunks):
+    for chunk in chunks:
+        await asyncio.sleep(0)
+        yield chunk
+
+
+def _expected(text):
+    return [(i.start(), Palmer(i)) for i in Palmer.finditer(text)]
+
+
+def _split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 8, 13, 100, 1000])
+def test_chunk_boundaries(size):
+    expected = _expected(TEXT)
+    assert len(expected) == 11
+
+    chunks = _split(TEXT, size)
+    assert _run(_collect(scan_stream(_iterate(chunks)))) == expected
+    chunks = _split(TEXT.encode(), size)
+    assert _run(_collect(scan_stream(_iterate(chunks)))) == expected
+
+    # And again using an executor.
+    with ThreadPoolExecutor(2) as executor:
+        out = _run(_collect(scan_stream(_iterate(chunks), offload_size=4,
+                                        executor=executor)))
+    assert out == expected
+
+
+def test_stream_reader():
+    async def main():
+        reader = asyncio.StreamReader()
+        scanner = scan_stream(reader, "latin-1", chunk_size=10)
+
+        # Palmers are yielded as soon as they're known to be complete.
+        reader.feed_data(b"UR3 and UL")
+        assert await scanner.__anext__() == (0, Palmer("UR3"))
+        reader.feed_data(b"4 and")
+        assert await scanner.__anext__() == (8, Palmer("UL4"))
+
+        reader.feed_data(" LL5 é".encode("latin-1"))
+        reader.feed_eof()
+        return [i async for i in scanner]
+
+    assert _run(main()) == [(16, Palmer("LL5"))]
+
+    async def main():
+        reader = asyncio.StreamReader()
+        reader.feed_data(" LL5 é".encode("latin-1"))
+        reader.feed_eof()
+        return [i async for i in scan_stream(reader, "utf-8")]
+
+    with pytest.raises(UnicodeDecodeError):
+        _run(main())
+
+
+def test_empty():
+    assert _run(_collect(scan_stream(_iterate([])))) == []
+    assert _run(_collect(scan_stream(_iterate(["", b"", "UR1"])))) == \
+           [(0, Palmer("UR1"))]
+
+
+def test_arch_types_async():
+    names = ["upper.stl", "lower.stl", "notes.txt", "upper.stl"]
+    assert _run(arch_types_async(iter(names))) == ["U", "L", None, "U"]
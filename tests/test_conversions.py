@@ -116,3 +116,21 @@ def test_numpy():
     assert arr.dtype == object
     assert arr.item() == self
     assert np.array(Palmer.range()).shape == (16,)
+
+
+@pytest.mark.parametrize("primary", [False, True])
+def test_from_conversions(primary):
+    palmers = Palmer.range(primary=primary, arch_type="U") \
+            + Palmer.range(primary=primary, arch_type="L")
+    for palmer in palmers:
+        assert Palmer.from_FDI(palmer.to_FDI()) == palmer
+        assert Palmer.from_universal(palmer.to_universal()) == palmer
+    assert Palmer.from_FDI(13) == "UR3"
+    assert Palmer.from_FDI("2*") == Palmer("UL*").with_(primary=False)
+
+    for invalid in ["19", "91", "1", "123", "56", "a1"]:
+        with pytest.raises(ValueError, match="Invalid FDI"):
+            Palmer.from_FDI(invalid)
+    for invalid in ["0", "33", "U", "AB", "", "1.0"]:
+        with pytest.raises(ValueError, match="Invalid Universal"):
+            Palmer.from_universal(invalid)
@@ -0,0 +1,75 @@
+import pytest
+
+from pangolin import Dentition, JawType, Palmer
+
+
+def test_basics():
+    present = Dentition(["UR1", "UR2", Palmer("UL1"), "LR6"])
+    treated = Dentition(["UR2", "LR6", "LR7"])
+
+    assert present & treated == Dentition(["UR2", "LR6"])
+    assert present | treated == Dentition(["UR1", "UR2", "UL1", "LR6", "LR7"])
+    assert present - treated == Dentition(["UR1", "UL1"])
+    assert present ^ treated == Dentition(["UR1", "UL1", "LR7"])
+
+    assert "UR1" in present
+    assert Palmer("UR1") in present
+    assert "UR3" not in present
+    assert "UR9" not in present
+    assert "not a palmer" not in present
+    assert len(present) == 4
+    assert present and not Dentition()
+
+    assert list(present) == ["UL1", "UR1", "UR2", "LR6"]
+    assert present.to_list() == list(present)
+    assert all(isinstance(i, Palmer) for i in present)
+
+    assert Dentition(["UR2"]) <= present
+    assert not present <= treated
+    assert present >= Dentition(["UR2"])
+    assert present != treated
+    assert present != {"UR1", "UR2", "UL1", "LR6"}
+    assert hash(present) == hash(Dentition(list(present)))
+
+    assert repr(present) == "Dentition(['UL1', 'UR1', 'UR2', 'LR6'])"
+
+    with pytest.raises(KeyError):
+        Dentition(["UR9"])
+    with pytest.raises(TypeError):
+        present | {"UR1"}
+    with pytest.raises(TypeError):
+        present <= {"UR1"}
+    with pytest.raises(TypeError):
+        present >= {"UR1"}
+
+
+def test_masks():
+    full = Dentition.full()
+    assert len(full) == 32
+    assert list(full) == Palmer.range(arch_type="U") \
+                       + Palmer.range(arch_type="L")
+    assert full.mask == 2**32 - 1
+    assert ~Dentition(["UL8"]) == full - Dentition(["UL8"])
+    assert Dentition(["UL8"]).mask == 1
+
+    self = Dentition(["UR3", "LL2"])
+    assert Dentition.from_mask(self.mask) == self
+    with pytest.raises(ValueError, match="more bits"):
+        Dentition.from_mask(2**32)
+
+
+def test_jaw_types():
+    baby = JawType("U", primary=True)
+    self = Dentition(["URA", "ULE"], baby)
+    assert self.jaw_type == baby
+    assert repr(self) == "Dentition(['ULE', 'URA'], " \
+                         "JawType(arch_type='U', primary=True, species='human'))"
+    assert len(~self) == 8
+    with pytest.raises(KeyError):
+        Dentition(["UR1"], baby)
+
+    with pytest.raises(ValueError, match="different jaw types"):
+        self | Dentition(["UR1"])
+    with pytest.raises(ValueError, match="different jaw types"):
+        self <= Dentition(["UR1"])
+    assert self != Dentition.from_mask(self.mask)
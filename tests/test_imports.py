@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+import pytest
+
+import pangolin
+
+
+def test_lazy_attributes():
+    for (name, module) in pangolin._lazy.items():
+        value = getattr(pangolin, name)
+        assert value is getattr(sys.modules["pangolin" + module], name)
+    assert set(pangolin._lazy) <= set(dir(pangolin))
+
+    with pytest.raises(AttributeError, match="has no attribute 'cake'"):
+        pangolin.cake
+    from pangolin import PalmerTable, tokenize
+
+
+def test_import_is_light():
+    """Heavy dependencies should only be imported once they are needed."""
+    code = "import sys, pangolin; print(' '.join(sys.modules))"
+    modules = subprocess.run([sys.executable, "-c", code], check=True,
+                             stdout=subprocess.PIPE).stdout.decode().split()
+    assert "pangolin" in modules
+    for heavy in ["sqlite3", "difflib", "hashlib", "csv",
+                  "pangolin._arch_type_parser", "pangolin._scan_index",
+                  "pangolin._layout", "pangolin._adjacency"]:
+        assert heavy not in modules
+
+    # Neither should any regex compiling.
+    code = "import pangolin; print(type(vars(pangolin.Palmer)['regex']))"
+    out = subprocess.run([sys.executable, "-c", code], check=True,
+                         stdout=subprocess.PIPE).stdout
+    assert b"_LazyRegex" in out
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from pangolin import JawType
@@ -55,3 +57,74 @@ def test_awkward_inputs():
         JawType(10)
     with pytest.raises(ValueError):
         self.with_(arch_type=10)
+    with pytest.raises(ValueError, match="primary"):
+        JawType(primary="yes")
+
+
+def test_pickle():
+    import pickle
+    self = JawType("U", "*", "unicorn")
+    assert pickle.loads(pickle.dumps(self)) == self
+    assert pickle.loads(pickle.dumps(self)).species == "unicorn"
+
+
+def test_interning():
+    assert JawType("U", True, "orc") is JawType("U", True, "orc")
+    assert JawType("U") is JawType(dict(arch_type="U"))
+    assert JawType("U").with_(arch_type="L") is JawType("L")
+    assert JawType(primary=1) is JawType(primary=True)
+    assert JawType() is not JawType("L")
+
+    # Interning must not leak into subclasses.
+    from pangolin import Palmer
+    assert Palmer("UR3") is not Palmer("UR3")
+    assert Palmer("UR3").jaw_type is JawType("U")
+
+    class SubJawType(JawType):
+        pass
+
+    assert type(SubJawType("U", True, "orc")) is SubJawType
+    assert type(JawType("U", True, "orc")) is JawType
+    assert type(SubJawType("U", True, "orc")) is SubJawType
+
+    assert JawType("U") == {"arch_type": "U", "primary": False,
+                            "species": "human"}
+    assert JawType("U") != {"arch_type": "U"}
+    assert hash(JawType("U")) == hash(JawType("U"))
+
+
+def test_threaded_species_registration():
+    """Threads registering the same new species simultaneously must all get
+    the same, working, species ID."""
+    names = [f"threaded-species-{i}" for i in range(200)]
+
+    def register(offset):
+        return [JawType(species=names[(i + offset) % len(names)])
+                for i in range(len(names))]
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(register, range(0, 200, 25)))
+    for result in results:
+        assert sorted(i.species for i in result) == sorted(names)
+        assert set(result) == set(results[0])
+
+
+def test_bounded_tables(monkeypatch):
+    """Parsing endless new species or codes mustn't grow the intern tables
+    forever."""
+    from pangolin import _jaw_type, Palmer
+    monkeypatch.setattr(_jaw_type, "_MAX_SPECIES", len(_jaw_type._species))
+    monkeypatch.setattr(_jaw_type, "_MAX_CODES", 100)
+    species = list(_jaw_type._species)
+    for i in range(200):
+        self = JawType("U", True, f"overflow-{i}")
+        assert type(self._code) is tuple
+        assert self.species == f"overflow-{i}"
+        assert self == JawType("U", True, f"overflow-{i}")
+        palmer = Palmer(f"overflow-{i}-LR3.1")
+        assert palmer.jaw_type == JawType("L", False, f"overflow-{i}")
+        assert (palmer.side, palmer.index, palmer.sub_index) == ("R", 3, 1)
+        assert type(Palmer("U", "R", i)._code) is int
+    assert _jaw_type._species == species
+    assert len(_jaw_type._codes) <= 100
+    assert type(JawType(species=species[-1])._code) is int
@@ -0,0 +1,81 @@
+import io
+import json
+
+import pytest
+
+from pangolin import Palmer, JawType, PalmerMap
+import pangolin.json
+
+
+def test_dumps():
+    data = {
+        Palmer("UR3"): 7.2,
+        "name": "bob",
+        "teeth": [Palmer("orc-LLE"), {Palmer("UL1"): (1, 2)}],
+        "jaw": JawType("U"),
+        "map": PalmerMap({"LL2": {Palmer("LR2"): 3}}),
+    }
+    out = pangolin.json.dumps(data, sort_keys=True)
+    assert json.loads(out) == {
+        "UR3": 7.2,
+        "name": "bob",
+        "teeth": ["orc-LLE", {"UL1": [1, 2]}],
+        "jaw": {"arch_type": "U", "primary": False, "species": "human"},
+        "map": {"LL2": {"LR2": 3}},
+    }
+
+    file = io.StringIO()
+    pangolin.json.dump(data, file, sort_keys=True)
+    assert file.getvalue() == out
+
+    with pytest.raises(TypeError, match="object is not JSON"):
+        pangolin.json.dumps({"x": object()})
+
+
+def test_default():
+    assert json.dumps([Palmer("UR3")], default=pangolin.json.default) \
+           == '["UR3"]'
+    assert pangolin.json.default(Palmer("U", "L", "*", primary=True)) == "UL*"
+
+
+def test_loads():
+    text = '{"UR3": {"UL1": 1, "name": "x"}, "UR99999": 2, "bob": [3]}'
+    out = pangolin.json.loads(text, palmer_keys=True)
+    assert out == {"UR3": {"UL1": 1, "name": "x"}, "UR99999": 2, "bob": [3]}
+    keys = list(out)
+    assert isinstance(keys[0], Palmer)
+    assert isinstance(keys[1], Palmer)
+    assert keys[1].index == 99999
+    assert isinstance(list(out["UR3"])[0], Palmer)
+    assert not isinstance(keys[2], Palmer)
+
+    assert pangolin.json.load(io.StringIO(text), palmer_keys=True) == out
+    assert json.loads(text, object_hook=pangolin.json.object_hook) == out
+
+    # Opt-in only. Ordinary JSON round-trips unchanged by default.
+    for plain in [
+            pangolin.json.loads(text),
+            pangolin.json.load(io.StringIO(text))
+    ]:
+        assert plain == json.loads(text)
+        assert not any(isinstance(key, Palmer) for key in plain)
+
+    # Only canonical palmer strings are converted.
+    out = pangolin.json.loads('{"human-UR3": 1, "UR03": 2, "UR3": 3}',
+                              palmer_keys=True)
+    assert [type(key) for key in out] == [str, str, Palmer]
+
+    # dumps() output always round-trips.
+    data = {Palmer(i): i for i in ["UR3", "orc-LLE", "U*3", "UR3.1", "URL"]}
+    assert pangolin.json.loads(pangolin.json.dumps(data),
+                               palmer_keys=True) == data
+
+
+def test_cache_bounds(monkeypatch):
+    monkeypatch.setattr(pangolin.json, "CACHE_SIZE", 3)
+    palmers = Palmer.range()
+    for palmer in palmers:
+        assert pangolin.json.default(palmer) == str(palmer)
+        assert pangolin.json._str_to_palmer(str(palmer)) == palmer
+    assert len(pangolin.json._strings) <= 3
+    assert len(pangolin.json._palmers) <= 3
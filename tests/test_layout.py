@@ -0,0 +1,60 @@
+import pytest
+
+from pangolin import layout, Layout, JawType, Palmer
+
+
+def test_slots():
+    self = layout()
+    assert self is layout(JawType())
+    assert self is layout(dict(JawType()))
+    assert isinstance(self, Layout)
+    assert len(self) == 32
+    assert self.palmers == \
+           tuple(Palmer.range(arch_type="U") + Palmer.range(arch_type="L"))
+
+    for (i, palmer) in enumerate(self.palmers):
+        assert self.slot(palmer) == i
+        assert self.slot(str(palmer)) == i
+    # Unnormalised strings.
+    assert self.slot("human-UR3") == self.slot("UR3")
+
+    for invalid in ["UR9", "URC", "U*3", "*R3", "UR*", "UR3.1", "sheep-UR3",
+                    "bob", 10]:
+        with pytest.raises(KeyError):
+            self.slot(invalid)
+
+
+def test_single_arch():
+    self = layout(JawType("L", primary=True))
+    assert [str(i) for i in self.palmers] == \
+           "LLE LLD LLC LLB LLA LRA LRB LRC LRD LRE".split()
+    assert self.slot("LRA") == 5
+    with pytest.raises(KeyError):
+        self.slot("URA")
+
+
+def test_uneven_arches():
+    """Sheep have more lower teeth than upper ones."""
+    self = layout(JawType(species="sheep"))
+    assert len(self) == 12 + 20
+    assert self.slot("sheep-UR6") == 11
+    assert self.slot("sheep-LL10") == 12
+    assert self.slot("sheep-LR10") == 31
+    with pytest.raises(KeyError):
+        self.slot("sheep-UR7")
+
+
+def test_tooth_kinds_modified():
+    """Layouts must follow changes to existing TOOTH_KINDS entries."""
+    from pangolin import TOOTH_KINDS, Dentition
+    backup = dict(TOOTH_KINDS)
+    assert len(layout()) == 32
+    try:
+        TOOTH_KINDS[JawType()] = "IICPPMMMM"
+        assert len(layout()) == 36
+        assert layout().slot("UR9") == 17
+        assert len(Dentition.full()) == 36
+    finally:
+        TOOTH_KINDS.clear()
+        TOOTH_KINDS.update(backup)
+    assert len(layout()) == 32
@@ -0,0 +1,97 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pangolin import Palmer, LazyPalmer
+
+
+@pytest.mark.parametrize("text", [
+    "UR3", "LLC", "*R*", "UR3.1", "orc-UL2", "a--UR3", "x-UR3_UL3", "human-UR3",
+    "UR03", "orc_UL2", "UR0"
+])
+def test_equivalence(text):
+    lazy = Palmer.lazy(text)
+    palmer = Palmer(text)
+    assert isinstance(lazy, LazyPalmer)
+    assert isinstance(lazy, Palmer)
+    assert str(lazy) == str(palmer)
+    assert hash(lazy) == hash(palmer)
+    assert lazy == palmer and palmer == lazy
+    assert lazy == str(palmer) and str(palmer) == lazy
+    assert {palmer: 1}[lazy] == 1
+    assert dict(lazy) == dict(palmer)
+    assert lazy.to_dict() == palmer.to_dict()
+    assert -lazy == -palmer
+    assert repr(lazy) == f"LazyPalmer('{palmer}')"
+
+
+def test_laziness():
+    lazy = LazyPalmer("UR3")
+    assert lazy._raw == "UR3"
+    # Normalised strings don't need parsing to be hashed or compared.
+    assert lazy == "UR3" and hash(lazy) == hash("UR3")
+    assert lazy._raw == "UR3"
+    assert lazy.side == "R"
+    assert lazy._raw is None
+    assert lazy.index == 3
+
+    # Unnormalised strings must be parsed to be hashed.
+    lazy = LazyPalmer("human-UR3")
+    assert str(lazy) == "UR3"
+    assert lazy._raw is None
+
+    with pytest.raises(AttributeError):
+        lazy.bob
+
+
+def test_validation():
+    with pytest.raises(ValueError, match="Could not parse the palmer 'bob'"):
+        LazyPalmer("bob")
+    lazy = LazyPalmer("bob", validate=False)
+    for _ in range(2):
+        with pytest.raises(ValueError, match="'bob'"):
+            lazy.index
+    with pytest.raises(ValueError, match="'bob'"):
+        str(lazy)
+    # Even unvalidated, normalised strings don't need parsing.
+    assert Palmer.lazy("UR3", validate=False) == "UR3"
+
+
+def test_eager_fallback():
+    """Anything other than a string is just a regular Palmer."""
+    assert LazyPalmer("U", "R", 3) == "UR3"
+    assert LazyPalmer(Palmer("UR3")).index == 3
+    assert LazyPalmer() == "***"
+    assert LazyPalmer.range("UR1", "UR3") == ["UR1", "UR2", "UR3"]
+    assert LazyPalmer.from_FDI("13") == "UR3"
+    assert LazyPalmer("UR3").with_(side="L") == "UL3"
+    assert len(LazyPalmer("UR3")) == len(Palmer.keys())
+
+
+def test_threaded_first_access(monkeypatch):
+    """Another thread reading a LazyPalmer whilst it's being parsed must not
+    see a half initialised object."""
+    import pangolin._palmer
+    pack = pangolin._palmer._pack
+    paused = threading.Event()
+    resume = threading.Event()
+
+    def slow_pack(*args):
+        if not paused.is_set():
+            paused.set()
+            resume.wait(5)
+        return pack(*args)
+
+    monkeypatch.setattr(pangolin._palmer, "_pack", slow_pack)
+    lazy = LazyPalmer("UR3")
+    with ThreadPoolExecutor(1) as pool:
+        first = pool.submit(lambda: lazy.side)
+        assert paused.wait(5)
+        assert lazy.side == "R"
+        resume.set()
+        assert first.result() == "R"
+    assert lazy.index == 3 and lazy._raw is None
+
+    # A thread which found `_code` missing just before another set it.
+    assert lazy.__getattr__("_code") == Palmer("UR3")._code
@@ -0,0 +1,61 @@
+import math
+
+import pytest
+
+from pangolin import Palmer, sniff_notation, NotationGuess, convert_column
+
+
+def test_sniff():
+    guess = sniff_notation(["11", "21", "48", "", "36", None, math.nan])
+    assert isinstance(guess, NotationGuess)
+    assert guess == ("fdi", False, 1.0,
+                     {"palmer": 0.0, "fdi": 1.0, "universal": 0.5})
+
+    assert sniff_notation([1, 5, 16.0, " 30 "])[:3] == ("universal", False, 1)
+    assert sniff_notation(["URA", "ULB", "LRE"])[:3] == ("palmer", True, 1)
+    assert sniff_notation(["URA", "UL2"]).primary == "*"
+    # Single letters are not palmers (even though Palmer("U") is valid).
+    assert sniff_notation(list("ABCT")).notation == "universal"
+
+    # Indistinguishable.
+    guess = sniff_notation(["11", "12", "x"])
+    assert guess.notation == "fdi"
+    assert guess.confidence == pytest.approx(2 / 3 / 2)
+
+    assert sniff_notation(["x", None, ""]) == \
+           (None, False, 0.0, {"palmer": 0.0, "fdi": 0.0, "universal": 0.0})
+    assert sniff_notation([]).notation is None
+
+
+def test_sampling():
+    # A universal column whose head looks like FDI.
+    column = ["11", "12"] * 1000 + ["3", "4"] * 1000
+    assert sniff_notation(column, sample_size=10).notation == "universal"
+    assert sniff_notation(iter(column), sample_size=10).notation == "fdi"
+
+
+def test_sampling_numpy():
+    numpy = pytest.importorskip("numpy")
+    column = numpy.array(["11", "12"] * 1000 + ["3", "4"] * 1000)
+    assert sniff_notation(column, sample_size=10).notation == "universal"
+
+
+def test_convert_column():
+    assert convert_column(["11", "21", "", 48.0]) == \
+           [Palmer("UR1"), Palmer("UL1"), None, Palmer("LR8")]
+    assert convert_column(iter(["1", "A", None]), sample_size=1) == \
+           [Palmer("UR8"), Palmer("URE"), None]
+    assert convert_column(["UR1", "LLC"]) == ["UR1", "LLC"]
+    assert convert_column(["11", "12"], "universal") == ["UL3", "UL4"]
+
+    with pytest.raises(ValueError, match=r"Row 2: '99' is not a valid fdi"):
+        convert_column(["11", "12", "99"])
+    assert convert_column(["11", "12", "99"], errors="ignore") == \
+           ["UR1", "UR2", None]
+
+    with pytest.raises(ValueError, match="Couldn't determine"):
+        convert_column(["x"])
+    with pytest.raises(ValueError, match="Unknown notation 'roman'"):
+        convert_column(["x"], "roman")
+    with pytest.raises(ValueError, match="Invalid errors"):
+        convert_column(["x"], errors="skip")
@@ -29,6 +29,23 @@ def test_init():
 
     assert Palmer("orc-LLC").jaw_type == JawType("L", True, "orc")
 
+    # Attributes are packed into fixed width bit fields. Values which don't
+    # fit are stored unpacked.
+    assert type(Palmer("U", "L", 65534, 253)._code) is int
+    for (index, sub_index) in [(65535, None), (3, 255), (-1, -1)]:
+        self = Palmer("U", "L", index, sub_index, primary=True)
+        assert type(self._code) is tuple
+        assert (self.index, self.sub_index) == (index, sub_index)
+        assert self.jaw_type == JawType("U", True)
+    assert Palmer("UL65535") == Palmer("U", "L", 65535)
+    self = Palmer("ULE.9")
+    assert self.with_(index=99999).with_(index=5)._code == self._code
+    assert Palmer("UR99999").index == 99999
+    with pytest.raises(ValueError, match="Invalid index 'x'"):
+        Palmer("U", "L", "x")
+    with pytest.raises(ValueError, match="Invalid side"):
+        Palmer("U", "X", 3)
+
 
 @pytest.mark.parametrize("species", ["human", "sausage-monster"])
 @pytest.mark.parametrize("index", [3, 12, "*"])
@@ -120,6 +137,15 @@ def test_hash():
         assert str(i) in set_
 
 
+def test_pickle():
+    import pickle
+    for palmer in ["UR3", "ogre-ULE.2", "L**"]:
+        palmer = Palmer(palmer)
+        copy = pickle.loads(pickle.dumps(palmer))
+        assert copy == palmer
+        assert copy.to_dict() == palmer.to_dict()
+
+
 def test_sort():
     assert Palmer("UR2") < Palmer("UR3")
     assert "UR2" < Palmer("UR3")
@@ -134,3 +160,38 @@ def test_sort():
 
     palmers = Palmer.range(primary=True)
     assert sorted(palmers[::-1]) == palmers
+
+
+def test_expand():
+    assert Palmer("U*1").expand() == ["UL1", "UR1"]
+    assert Palmer("*RC").expand() == ["URC", "LRC"]
+    assert Palmer("UR3").expand() == ["UR3"]
+    assert Palmer("U*3.1").expand() == ["UL3.1", "UR3.1"]
+    assert Palmer("UR*").expand() == Palmer.range("UR1", "UR8") \
+                                   + Palmer.range("URA", "URE")
+    assert Palmer("L**").expand() == Palmer.range(arch_type="L") \
+                                   + Palmer.range(arch_type="L", primary=True)
+    assert len(Palmer("***").expand()) == 2 * (16 + 10)
+    # Sheep have no primary teeth data.
+    sheep = Palmer.range(0, "sheep-UR6") + Palmer.range(0, "sheep-LR10")
+    assert Palmer("sheep-*R*").expand() == sheep
+    assert Palmer("sheep-*R*").with_(primary="*").expand() == sheep
+    with pytest.raises(ValueError, match="No tooth kinds data"):
+        Palmer("sheep-*R*").with_(primary=True).expand()
+    with pytest.raises(ValueError, match="No tooth kinds data"):
+        Palmer("cat-UR*").with_(primary="*").expand()
+    with pytest.raises(ValueError, match="No tooth kinds data"):
+        Palmer("cat-UR3").with_(primary="*").expand()
+
+    # Explicit indices are checked.
+    with pytest.raises(ValueError, match="only has 8 teeth"):
+        Palmer("UR9").expand()
+    with pytest.raises(ValueError, match="only has 5 teeth"):
+        Palmer("*RF").expand()
+    assert Palmer("U*7").with_(primary="*").expand() == ["UL7", "UR7"]
+    assert Palmer("UR3").with_(primary="*").expand() == ["UR3", "URC"]
+    with pytest.raises(ValueError, match="only has 5 teeth"):
+        Palmer("UR9").with_(primary="*").expand()
+
+    with pytest.raises(ValueError, match="wildcard species"):
+        Palmer("UR3").with_(species="*").expand()
@@ -0,0 +1,76 @@
+import pytest
+
+from pangolin import Palmer, parse_array
+
+np = pytest.importorskip("numpy")
+
+LABELS = [
+    "UR3", "LLE", "U*2.1", "**", "***", "L*", "UR0", "LR9.9", "UL*.3",  # fast
+    "cat-UR3", "UR12", "UR12.3", "dog_LL*", "cat-UR3",  # slow
+    "", "U", "ur3", "URa", "UR3.", "UR3.x", "UR3x", "URE.1.2", "UR99999",
+    "nonsense", "é",  # invalid
+]
+
+
+def _expected(label):
+    match = Palmer.regex.fullmatch(label)
+    return Palmer(match) if match else None
+
+
+@pytest.mark.parametrize("dtype", ["U", "S"])
+def test_columns(dtype):
+    labels = np.array(LABELS)
+    if dtype == "S":
+        labels = np.char.encode(labels)
+    columns = parse_array(labels)
+    assert set(columns) == set(Palmer.keys()) | {"valid"}
+
+    for (i, label) in enumerate(LABELS):
+        palmer = _expected(label)
+        assert columns["valid"][i] == (palmer is not None), label
+        if palmer is None:
+            continue
+        assert columns["arch_type"][i] == palmer.arch_type
+        assert columns["side"][i] == palmer.side
+        assert columns["index"][i] == \
+               (-1 if palmer.index == "*" else palmer.index)
+        assert columns["sub_index"][i] == \
+               (-1 if palmer.sub_index is None else palmer.sub_index)
+        assert columns["primary"][i] == [False, True, "*"].index(palmer.primary)
+        assert columns["species"][i] == palmer.species
+
+
+def test_packed():
+    codes = parse_array(LABELS, packed=True)
+    assert codes.dtype == np.int64
+    for (label, code) in zip(LABELS, codes.tolist()):
+        palmer = _expected(label)
+        if palmer is None or type(palmer._code) is tuple:
+            assert code == -1
+        else:
+            assert code == palmer._code
+
+
+def test_shape():
+    labels = np.array(LABELS[:12]).reshape(3, 2, 2)
+    assert parse_array(labels, packed=True).shape == (3, 2, 2)
+    columns = parse_array(labels)
+    assert all(i.shape == (3, 2, 2) for i in columns.values())
+    assert columns["index"][2, 1, 0] == 12
+
+    # Empty arrays and non contiguous arrays.
+    assert parse_array(np.array([], str), packed=True).shape == (0,)
+    assert parse_array(labels.T, packed=True).tolist() == \
+           parse_array(labels, packed=True).T.tolist()
+
+
+def test_invalid_dtype():
+    with pytest.raises(TypeError, match="string or bytes"):
+        parse_array(np.arange(3))
+
+
+def test_huge_index():
+    columns = parse_array(["UR" + "9" * 20, "UR99999"])
+    assert columns["valid"].tolist() == [False, True]
+    assert columns["index"][1] == 99999
+    assert parse_array(["UR99999"], packed=True).tolist() == [-1]
@@ -0,0 +1,36 @@
+from pangolin import Palmer, LazyPalmer, isin, unique, value_counts
+
+
+def test_isin():
+    values = ["UR3", Palmer("LL2"), "human-UL1", "cat", LazyPalmer("UR3"),
+              LazyPalmer("human-LL2"), dict(Palmer("UL1")), "UR3"]
+    targets = ["UL1", Palmer("UR3"), "cat"]
+    assert isin(values, targets) == [True, False, True, True, True, False,
+                                     True, True]
+    assert isin(values, []) == [False] * len(values)
+
+    # Wildcard indices don't show primary so compare equal, like __eq__ does.
+    assert isin([Palmer("U", "L", "*", primary=True)], ["UL*"]) == [True]
+
+    # Unparsable lazy palmers are treated like unparsable strings.
+    assert isin(["nonsense", "UR3"],
+                [LazyPalmer("nonsense", validate=False)]) == [True, False]
+
+
+def test_unique():
+    values = ["UR3", Palmer("UR3"), "LL2", "human-UR3", "LL2", "cat", "cat"]
+    out = unique(values)
+    assert out == ["UR3", "LL2", "cat"]
+    assert isinstance(out[0], Palmer)
+    assert isinstance(out[1], Palmer)
+    assert out[2] == "cat"
+    assert unique([]) == []
+
+
+def test_value_counts():
+    values = ["UR3", "LL2", Palmer("UR3"), "LL2", "LL2", "x", "orc-ULE"]
+    counts = value_counts(values)
+    assert list(counts.items()) == \
+           [("LL2", 3), ("UR3", 2), ("x", 1), ("orc-ULE", 1)]
+    assert counts[Palmer("orc-ULE")] == 1
+    assert all(isinstance(i, Palmer) for i in list(counts)[:2])
@@ -0,0 +1,36 @@
+from pangolin import PalmerIndex, Palmer
+
+PALMERS = [
+    "UR3", "UL3", "LR3", "UR5", "orc-UR3", "U*3", "UR*", "UR3.1", "LLC", "*RB",
+    "UR3"
+]
+
+QUERIES = [
+    "U*3", "**3", "***", "UR3", "UR*", "URC", "orc-***", "*L*", "LR9", "UR3.1",
+    "U*3.1"
+]
+
+
+def test_index():
+    self = PalmerIndex(PALMERS)
+    assert len(self) == len(PALMERS)
+    assert list(self) == PALMERS
+    assert self[1] == "UL3"
+    assert isinstance(self[0], Palmer)
+
+    assert self.query("U*3")[:3] == ["UR3", "UL3", "U*3"]
+    assert self.query("orc-U*3") == ["orc-UR3"]
+    assert self.count(Palmer("***").with_(species="*")) == len(PALMERS) - 1
+    assert self.count("LR9") == 0
+
+    # Check against brute force.
+    for query in QUERIES:
+        query = Palmer(query)
+        target = [
+            i for (i, palmer) in enumerate(PALMERS)
+            if query.match(Palmer(palmer))
+        ]
+        assert self.positions(query) == target, query
+
+    self.add("LR9")
+    assert self.query("LR9") == ["LR9"]
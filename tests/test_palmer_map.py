@@ -0,0 +1,58 @@
+import array
+
+import pytest
+
+from pangolin import PalmerMap, Palmer, JawType
+
+
+def test_basics():
+    self = PalmerMap({"UR3": 7.2})
+    assert self[Palmer("UR3")] == 7.2
+    assert self["UR3"] == 7.2
+    self[Palmer("UL1")] = "anything"
+    assert self["UL1"] == "anything"
+    assert len(self) == 2
+    assert list(self) == ["UL1", "UR3"]
+    assert all(isinstance(i, Palmer) for i in self)
+    assert dict(self) == {"UL1": "anything", "UR3": 7.2}
+    assert "UR3" in self
+    assert "UR4" not in self
+    assert "UR9" not in self
+    assert self.get("UR4") is None
+    assert repr(self) == "PalmerMap({'UL1': 'anything', 'UR3': 7.2})"
+
+    with pytest.raises(KeyError):
+        self["UR4"]
+    with pytest.raises(KeyError):
+        self["UR9"] = 1
+    with pytest.raises(KeyError):
+        self["UR9"]
+
+    del self["UL1"]
+    assert len(self) == 1
+    assert self.data[self._layout.slot("UL1")] is None
+    with pytest.raises(KeyError):
+        del self["UL1"]
+
+    assert self == {"UR3": 7.2}
+    assert PalmerMap([("UR3", 7.2)]) == self
+
+
+def test_array():
+    self = PalmerMap({"UR3": 7.2, "LL8": 1}, typecode="d")
+    assert isinstance(self.data, array.array)
+    assert len(self.data) == 32
+    assert self["LL8"] == 1.0
+    assert self.data[self._layout.slot("UR3")] == 7.2
+    del self["UR3"]
+    assert self.data[self._layout.slot("UR3")] == 0
+    assert dict(self) == {"LL8": 1.0}
+
+
+def test_jaw_type():
+    jaw_type = JawType("L", True)
+    self = PalmerMap({"LRA": 1}, jaw_type=jaw_type, typecode="i")
+    assert self.jaw_type == jaw_type
+    assert len(self.data) == 10
+    with pytest.raises(KeyError):
+        self["UR1"] = 3
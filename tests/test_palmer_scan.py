@@ -0,0 +1,32 @@
+from hypothesis import given, strategies
+
+from pangolin import Palmer
+
+
+def _compare(text):
+    expected = [(i.span(), i.groups()) for i in Palmer.regex.finditer(text)]
+    assert [(i.span(), i.groups()) for i in Palmer.finditer(text)] == expected
+
+
+def test_finditer():
+    _compare("")
+    _compare("The LL5 is more distal than the LL3. orc-UR* U*3 **C.2")
+    # Greedy species which contain valid palmers.
+    _compare("x-UL1_UR2 UR3-UL4-LL5. _UR1 a-b-c_d")
+    # The rightmost species delimiter wins and nothing after it is a species.
+    _compare("ab-UR1-UL2ULU-UR3ULULU")
+    _compare("*R3 **1 UL*.3 ULE.11 U-UR")
+    _compare("é-UR1 ß_LL9999.9")
+
+
+@given(strategies.text("UL*R1AE.-_x é", max_size=30))
+def test_finditer_fuzz(text):
+    _compare(text)
+
+
+def test_adversarial():
+    """Text which makes the regex quadratic should still work (quickly)."""
+    text = "a-" * 20000 + "UR3"
+    matches = list(Palmer.finditer(text))
+    assert len(matches) == 1
+    assert matches[0].group(1) == text[:-4]
@@ -0,0 +1,68 @@
+import array
+import math
+
+import pytest
+
+from pangolin import PalmerTable, Palmer, JawType
+
+
+@pytest.fixture(params=[False, True], ids=["stdlib", "numpy"])
+def table(request):
+    if request.param:
+        pytest.importorskip("numpy")
+    self = PalmerTable(["bob", "alice", "carol"], use_numpy=request.param)
+    self.set("width", "bob", "UR3", 7.0)
+    self.set("width", "bob", "UL3", 7.4)
+    self.set("width", "alice", "UR3", 8.0)
+    self.set("width", "alice", "LR6", 10.0)
+    self.set("width", "carol", Palmer("LL1"), 5.0)
+    self.set("height", "carol", "LL1", 9.0)
+    return self
+
+
+def test_basics(table):
+    assert len(table) == 3 * 32
+    assert table.metrics == ["width", "height"]
+    assert table.jaw_type == JawType()
+    assert table.get("width", "bob", "UR3") == 7.0
+    assert math.isnan(table.get("width", "bob", "UR4"))
+    assert len(table.column("width")) == len(table)
+    assert table.column("width")[table.row("alice", "LR6")] == 10.0
+    with pytest.raises(KeyError):
+        table.set("width", "dave", "UR3", 1)
+    with pytest.raises(KeyError):
+        table.set("width", "bob", "UR9", 1)
+    with pytest.raises(KeyError):
+        table.get("depth", "bob", "UR3")
+
+
+def test_group_by(table):
+    assert table.group_by("width") == \
+           {"UL3": 7.4, "UR3": 7.5, "LL1": 5.0, "LR6": 10.0}
+    assert table.group_by("width", "tooth", "count") == \
+           {"UL3": 1, "UR3": 2, "LL1": 1, "LR6": 1}
+    assert table.group_by("width", "mirror", "sum") == \
+           {"U*3": 22.4, "L*1": 5.0, "L*6": 10.0}
+    assert table.group_by("width", "quadrant", "max") == \
+           {1: 8.0, 2: 7.4, 3: 5.0, 4: 10.0}
+    assert table.group_by("width", "kind", "min") == \
+           {"C": 7.0, "I": 5.0, "M": 10.0}
+    assert table.group_by("width", lambda x: x.arch_type, "count") == \
+           {"U": 3, "L": 2}
+    assert table.group_by("height", "kind") == {"I": 9.0}
+    for (key, value) in table.group_by("width", "mirror").items():
+        assert isinstance(key, Palmer)
+        assert isinstance(value, float)
+
+    with pytest.raises(ValueError, match="reduce"):
+        table.group_by("width", reduce="median")
+    with pytest.raises(ValueError, match="by"):
+        table.group_by("width", by="species")
+
+
+def test_storage():
+    assert isinstance(PalmerTable([], use_numpy=False).column("x"), array.array)
+    np = pytest.importorskip("numpy")
+    assert isinstance(PalmerTable([]).column("x"), np.ndarray)
+    table = PalmerTable(["bob"], JawType("U", True))
+    assert len(table.column("x")) == 10
@@ -0,0 +1,74 @@
+import pytest
+
+from pangolin import PalmerTranslation, Palmer, JawType, layout
+
+
+def test_mirror():
+    self = PalmerTranslation.mirror()
+    assert len(self.palmers) == len(layout()) + len(layout(JawType(primary=1)))
+    assert self.apply(self.palmers) == [-i for i in self.palmers]
+    assert self.apply_strings(["UR1", Palmer("LLE"), "LL03"]) == \
+           ["UL1", "LRE", "LR3"]
+    assert self("UR1") == "UL1"
+    assert isinstance(self("UR1"), Palmer)
+    assert self.apply(Palmer.lazy(i) for i in ["UR1"]) == ["UL1"]
+
+    for invalid in ["UR9", "U*1", "UR1.1", "cat-UR1", "nonsense", 3, None]:
+        with pytest.raises(ValueError, match="not a tooth"):
+            self.apply([invalid])
+    with pytest.raises(ValueError, match="not a tooth"):
+        self(Palmer("UR9"))
+
+
+def test_mapping():
+    self = PalmerTranslation({"UR8": "UR7", Palmer("UR7"): None,
+                              "LL1": Palmer("LR1")})
+    assert self.apply(["UR8", "UR7", "UR6", "LL1"]) == \
+           ["UR7", None, "UR6", "LR1"]
+    assert self.apply_strings(["UR7", "UR8"]) == [None, "UR7"]
+
+    with pytest.raises(ValueError, match="'UR8' translates to 'UR9'"):
+        PalmerTranslation({"UR8": "UR9"})
+
+
+def test_successor():
+    self = PalmerTranslation.successor()
+    assert self.apply(["URA", "URC", "LLE", "UR8"]) == \
+           ["UR1", "UR3", "LL5", "UR8"]
+    with pytest.raises(ValueError, match="translates to 'UL5'"):
+        PalmerTranslation.successor([JawType(primary=True)])
+
+
+def test_then():
+    mirror = PalmerTranslation.mirror()
+    successor = PalmerTranslation.successor()
+    drop_8s = PalmerTranslation(lambda x: None if x.index == 8 else x)
+
+    combined = mirror.then(successor).then(drop_8s)
+    assert combined.apply(["URA", "LLE", "UR8", "LL7"]) == \
+           ["UL1", "LR5", None, "LR7"]
+    # The originals are unmodified.
+    assert mirror.apply(["URA"]) == ["ULA"]
+    assert drop_8s.then(mirror).apply(["UR8", "UR7"]) == [None, "UL7"]
+    assert mirror.then(mirror).apply(mirror.palmers) == list(mirror.palmers)
+
+    with pytest.raises(ValueError, match="same teeth"):
+        mirror.then(PalmerTranslation.mirror([JawType()]))
+
+
+def test_codes():
+    self = PalmerTranslation.mirror().then(PalmerTranslation.successor())
+    codes = [Palmer(i)._code for i in ["URA", "LL8"]] + [-1]
+    assert self.apply_codes(codes) == \
+           [Palmer("UL1")._code, Palmer("LR8")._code, -1]
+    assert self.apply_codes(iter([])) == []
+    with pytest.raises(ValueError, match="not the code"):
+        self.apply_codes([Palmer("UR9")._code])
+
+    np = pytest.importorskip("numpy")
+    from pangolin import parse_array
+    labels = np.array([["URA", "LL8"], ["nonsense", "URA"]])
+    assert self.apply_codes(parse_array(labels, packed=True)).tolist() == \
+           parse_array(np.array([["UL1", "LR8"], ["", "UL1"]]),
+                       packed=True).tolist()
+    assert self.apply_codes(np.array([], int)).shape == (0,)
@@ -0,0 +1,69 @@
+import pytest
+
+from pangolin import Palmer, scan_file
+from pangolin._scan_file import _scan_range
+
+DATA = ("Patient 1: UR3 and UL4 extracted.\n"
+        "\n"
+        "Patient 2: orc-LL5, 3f9c-a-b-UR1 é-LRE\n"
+        + "a very long line " * 5 + "UL8\n").encode() \
+       + b"\xff\xfe invalid UTF-8 then UR2\n" \
+       + b"no newline at the end LL1"
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_bytes(DATA)
+    return path
+
+
+def _expected(data):
+    text = data.decode("utf-8", "surrogateescape")
+    return [(len(text[:i.start()].encode("utf-8", "surrogateescape")),
+             Palmer(i)) for i in Palmer.regex.finditer(text)]
+
+
+@pytest.mark.parametrize("shard_size", [1, 7, 40, 1000])
+def test_scan_range(path, shard_size):
+    data = path.read_bytes()
+    expected = _expected(data)
+    out = []
+    for start in range(0, len(data), shard_size):
+        out += _scan_range(path, start, min(start + shard_size, len(data)))
+    assert out == expected
+    assert len(out) == 8
+    for (offset, palmer) in out:
+        assert data[offset:].decode("utf-8", "replace").startswith(str(palmer))
+
+
+def test_scan_file(path):
+    expected = _expected(path.read_bytes())
+    assert list(scan_file(path, workers=1, shard_size=16)) == expected
+    assert list(scan_file(path, workers=2, shard_size=16)) == expected
+    assert list(scan_file(path, workers=1)) == expected
+
+
+def test_empty(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert list(scan_file(path, workers=1)) == []
+
+
+def test_bounded_submission(path, monkeypatch):
+    """Shards must be submitted as results are consumed, not all up front."""
+    from concurrent.futures import ThreadPoolExecutor
+    import pangolin._scan_file
+    submitted = []
+
+    class Executor(ThreadPoolExecutor):
+        def submit(self, *args):
+            submitted.append(args)
+            return super().submit(*args)
+
+    monkeypatch.setattr(pangolin._scan_file, "ProcessPoolExecutor", Executor)
+    scan = scan_file(path, workers=2, shard_size=4)
+    first = next(scan)
+    assert len(submitted) <= 2 * 2 + 1
+    assert [first] + list(scan) == list(scan_file(path, workers=1))
+    assert len(submitted) == -(-len(DATA) // 4)
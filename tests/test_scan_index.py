@@ -0,0 +1,97 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from pangolin import ScanIndex
+
+
+def touch(path, content=b""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_index(tmp_path):
+    root = tmp_path / "scans"
+    upper = touch(root / "cohort" / "patient_123_upper.stl")
+    lower = touch(root / "cohort" / "lower-patient_123.STL")
+    other = touch(root / "cohort" / "patient_456 maxillary.ply")
+    touch(root / "cohort" / "notes.txt")
+    unknown = touch(root / "misc" / "patient_789.stl")
+    elsewhere = touch(root / "misc" / "patient_123_mandible.stl")
+    # A duplicate. Only the first (alphabetically) gets paired.
+    duplicate = touch(root / "misc" / "patient_123_mandibular.stl")
+    # Broken symlinks are neither files nor directories.
+    os.symlink(tmp_path / "nowhere.stl", root / "misc" / "broken.stl")
+
+    with ScanIndex(tmp_path / "index.sqlite") as index:
+        assert index.update(root, suffixes=[".stl", ".ply"]) == 6
+        assert len(index) == 6
+
+        assert index.find(arch_type="U", stem="patient_123") == [upper]
+        assert index.find(stem="patient_123") == \
+               [lower, upper, elsewhere, duplicate]
+        assert index.find(arch_type="U") == [upper, other]
+        assert index.find(arch_type="L") == [lower, elsewhere, duplicate]
+        assert len(index.find()) == 6
+
+        assert index.pairs() == [
+            ("patient_123", upper, lower),
+            ("patient_456", other, None),
+            ("patient_123", None, elsewhere),
+        ]
+
+        # Nothing has changed so nothing should be reparsed.
+        assert index.update(root, suffixes=[".stl", ".ply"]) == 0
+
+        # Modify a file, delete another.
+        touch(root / "cohort" / "patient_123_upper.stl", b"solid")
+        os.remove(unknown)
+        assert index.update(root, suffixes=[".stl", ".ply"]) == 1
+        assert len(index) == 5
+
+    # The index persists.
+    with ScanIndex(tmp_path / "index.sqlite") as index:
+        assert len(index) == 5
+        # Indexing another directory doesn't touch the first one's files.
+        assert index.update(tmp_path / "scans" / "misc") == 0
+        assert len(index) == 5
+        # No suffix filter.
+        assert index.update(tmp_path / "scans" / "cohort") == 1
+        assert index.find(stem="notes") == [str(root / "cohort" / "notes.txt")]
+        assert len(index) == 6
+
+        # Files which exist but don't match the suffixes aren't removed.
+        assert index.update(root, suffixes=[".stl"]) == 0
+        assert len(index) == 6
+
+        # A sibling directory whose name starts with the same characters is
+        # separate.
+        sibling = touch(root / "cohort2" / "patient_1_upper.stl")
+        assert index.update(root / "cohort2") == 1
+        os.remove(sibling)
+        assert index.update(root / "cohort") == 0
+        assert len(index) == 7
+        assert index.update(root / "cohort2") == 0
+        assert len(index) == 6
+
+
+def test_threads(tmp_path):
+    """One index shared by threads updating and querying different
+    directories."""
+    roots = [tmp_path / "scans" / str(i) for i in range(8)]
+    for root in roots:
+        for i in range(20):
+            touch(root / f"patient_{i}_upper.stl")
+            touch(root / f"patient_{i}_lower.stl")
+
+    def work(root):
+        assert index.update(root) == 40
+        assert index.update(root) == 0
+        return len(index.find(arch_type="U")), len(index.pairs())
+
+    with ScanIndex(tmp_path / "index.sqlite") as index:
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(work, roots))
+        assert len(index) == 8 * 40
+        assert len(index.pairs()) == 8 * 20
+    assert all(20 <= uppers <= 160 for (uppers, _) in results)
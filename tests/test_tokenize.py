@@ -0,0 +1,44 @@
+import pytest
+
+from pangolin import tokenize, Token, Palmer
+
+
+def test_tokenize():
+    text = "Extract UR3 and 24. Watch #30, #12 and #A. Then UR3.1 (orc-LLC), " \
+           "55 56 99 12.5 x24 #33"
+    tokens = list(tokenize(text))
+    assert [(str(i.palmer), i.notation) for i in tokens] == [
+        ("UR3", "palmer"),
+        ("UL4", "fdi"),
+        ("LR6", "universal"),
+        ("UL4", "universal"),
+        ("URE", "universal"),
+        ("UR3.1", "palmer"),
+        ("orc-LLC", "palmer"),
+        ("URE", "fdi"),
+    ]
+    for token in tokens:
+        assert isinstance(token, Token)
+        assert isinstance(token.palmer, Palmer)
+        assert text[token.start:token.end] in (str(token.palmer), "24", "55") \
+               or text[token.start] == "#"
+    assert tokens[1].span == (16, 18)
+
+    # Restrict notations.
+    # '#' marks a universal number so is never treated as FDI.
+    assert [str(i.palmer) for i in tokenize(text, ["fdi"])] == ["UL4", "URE"]
+    assert [str(i.palmer) for i in tokenize(text, ("palmer",))] == \
+           ["UR3", "UR3.1", "orc-LLC"]
+    assert [i.palmer for i in tokenize(text, {"universal", "palmer"})] == \
+           ["UR3", "LR6", "UL4", "URE", "UR3.1", "orc-LLC"]
+
+    with pytest.raises(ValueError, match="Unknown notation 'bob'"):
+        list(tokenize(text, ["bob"]))
+
+
+def test_matches_palmer_regex():
+    text = "The LL5 is more distal than the LL3. orc-UR* U*3 **C.2"
+    assert [i.palmer for i in tokenize(text, ["palmer"])] == \
+           [Palmer(i) for i in Palmer.regex.finditer(text)]
+    assert [i.span for i in tokenize(text, ["palmer"])] == \
+           [i.span() for i in Palmer.regex.finditer(text)]
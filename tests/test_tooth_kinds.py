@@ -1,6 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from pangolin import tooth_kinds, TOOTH_KINDS, JawType
+from pangolin import (tooth_kinds, TOOTH_KINDS, JawType, Palmer, layout,
+                      valid_mask)
 
 
 def test():
@@ -23,3 +26,80 @@ def test():
 
     # Haha, I'm hilarious.
     assert tooth_kinds(JawType(species="pangolin")) == ''
+
+
+def test_cache_invalidation():
+    """Modifying TOOTH_KINDS must be reflected by tooth_kinds() even though
+    its results are cached."""
+    dog = JawType(species="dog")
+    backup = dict(TOOTH_KINDS)
+    try:
+        with pytest.raises(ValueError):
+            tooth_kinds(dog)
+        TOOTH_KINDS[dog] = "IIICPPPPMM"
+        assert tooth_kinds(dog.with_(arch_type="U")) == "IIICPPPPMM"
+        TOOTH_KINDS[dog] = "IIICPPPPM"
+        assert tooth_kinds(dog.with_(arch_type="U")) == "IIICPPPPM"
+        kinds = TOOTH_KINDS
+        kinds |= {dog: "IIC"}
+        assert tooth_kinds(dog.with_(arch_type="U")) == "IIC"
+        del TOOTH_KINDS[dog]
+        with pytest.raises(ValueError):
+            tooth_kinds(dog.with_(arch_type="U"))
+    finally:
+        TOOTH_KINDS.clear()
+        TOOTH_KINDS.update(backup)
+    assert tooth_kinds(JawType("U")) == "IICPPMMM"
+
+
+def test_modified_during_lookup(monkeypatch):
+    """A tooth_kinds() call which reads TOOTH_KINDS just before another thread
+    modifies it must not leave its outdated result in the cache."""
+    dog = JawType(species="dog")
+    backup = dict(TOOTH_KINDS)
+    original = JawType.match
+
+    def match(self, other, strict=False):
+        # Pretend that another thread modifies TOOTH_KINDS right now.
+        monkeypatch.setattr(JawType, "match", original)
+        TOOTH_KINDS[dog] = "IIC"
+        return original(self, other, strict)
+
+    try:
+        TOOTH_KINDS[dog] = "II"
+        monkeypatch.setattr(JawType, "match", match)
+        assert tooth_kinds(dog.with_(arch_type="U")) in ("II", "IIC")
+        assert tooth_kinds(dog.with_(arch_type="U")) == "IIC"
+    finally:
+        TOOTH_KINDS.clear()
+        TOOTH_KINDS.update(backup)
+
+
+def test_threaded_registration():
+    """Threads each register a species then immediately use it whilst others
+    register theirs. Every memo derived from TOOTH_KINDS must see the
+    registration."""
+    backup = dict(TOOTH_KINDS)
+
+    def work(i):
+        species = f"registered-{i}"
+        kinds = "I" * (1 + i % 5) + "M"
+        TOOTH_KINDS[JawType(species=species)] = kinds
+        n = len(kinds)
+        last = Palmer("U", "R", n, species=species)
+        return [
+            tooth_kinds(JawType("U", species=species)) == kinds,
+            len(layout(JawType(species=species))) == 4 * n,
+            last.distal is None,
+            last.with_(index=n - 1).distal == last,
+            last.opposing == last.with_(arch_type="L"),
+            valid_mask([last, last.with_(index=n + 1)]) == [True, False],
+        ]
+
+    try:
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(work, range(64)))
+    finally:
+        TOOTH_KINDS.clear()
+        TOOTH_KINDS.update(backup)
+    assert results == [[True] * 6] * 64
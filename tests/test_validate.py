@@ -0,0 +1,53 @@
+import pangolin
+from pangolin import Palmer, LazyPalmer, JawType, validate, valid_mask
+
+
+def test_validate():
+    palmers = [
+        "UR8", "UR9", "ULF", "ULE", "UR0", "UR*.1", "UR*", "cat", "UR99999",
+        "dog-UR1", "*-UR30", "LR3.2"
+    ]
+    errors = dict(validate(palmers))
+    assert sorted(errors) == [1, 2, 4, 5, 7, 8, 9, 10]
+    assert "only has 8 teeth" in errors[1]
+    assert "only has 5 teeth" in errors[2]
+    assert "Indices start at 1" in errors[4]
+    assert "wildcard index" in errors[5]
+    assert "Could not parse" in errors[7]
+    assert "has index 99999" in errors[8]
+    assert "No tooth kinds data" in errors[9]
+
+    assert valid_mask(palmers) == [i not in errors for i in range(len(palmers))]
+
+
+def test_mixed_inputs():
+    palmers = [
+        Palmer("UR9"), "UR9",
+        LazyPalmer("UR9"),
+        Palmer("UR3"),
+        dict(Palmer("UR3")),
+        LazyPalmer("nonsense", validate=False), "UR9"
+    ]
+    assert valid_mask(palmers) == [False] * 3 + [True] * 2 + [False] * 2
+    assert validate(palmers)[0][1] == validate(palmers)[1][1]
+
+
+def test_wildcard_jaw_types():
+    # A wildcard arch type is valid if either arch could hold the tooth.
+    assert valid_mask(["sheep-*R6", "sheep-*R10", "sheep-*R11"]) \
+           == [True, True, False]
+    assert valid_mask(["U*E", "**E", "U*F"]) == [True, True, False]
+    assert valid_mask(
+        [Palmer("U", "R", 8, primary="*"),
+         Palmer("U", "R", 9, primary="*")]) == [True, False]
+    # Nothing can be said about a wildcard species.
+    assert valid_mask([Palmer("U", "R", 100, species="*")]) == [True]
+
+
+def test_tooth_kinds_changes(monkeypatch):
+    """Validation must respect changes to TOOTH_KINDS between calls."""
+    assert valid_mask(["dog-UR1"]) == [False]
+    monkeypatch.setitem(pangolin.TOOTH_KINDS, JawType(species="dog"),
+                        "IIICPPPPMM")
+    assert valid_mask(["dog-UR1", "dog-UR10", "dog-UR11"]) \
+           == [True, True, False]